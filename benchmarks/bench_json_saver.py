@@ -0,0 +1,71 @@
+"""
+Сравнение поштучного и пакетного сохранения вакансий в JSONSaver.
+
+Запуск:
+    python -m benchmarks.bench_json_saver --sizes 10000 100000
+
+Поштучное добавление растёт квадратично, поэтому для больших объёмов
+оно измеряется только до --per-item-limit записей, а дальше время
+оценивается экстраполяцией и помечается как оценка.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.file_connector import AbstractFileConnector, JSONSaver
+from src.vacancy import Vacancy
+
+
+def make_vacancies(count: int) -> list:
+    """Создаёт набор синтетических вакансий."""
+    return [
+        Vacancy(
+            f"Python Developer {i}",
+            f"https://hh.ru/vacancy/{i}",
+            f"{100000 + i % 1000 * 100} RUR",
+            "Опыт работы с Python от 3 лет, знание SQL и Linux.",
+        )
+        for i in range(count)
+    ]
+
+
+def time_per_item(vacancies: list, directory: str) -> float:
+    """Время поштучного добавления через add_vacancy."""
+    saver = JSONSaver(os.path.join(directory, "per_item.json"))
+    start = time.perf_counter()
+    AbstractFileConnector.add_vacancies(saver, vacancies)
+    return time.perf_counter() - start
+
+
+def time_bulk(vacancies: list, directory: str) -> float:
+    """Время пакетного добавления через add_vacancies."""
+    saver = JSONSaver(os.path.join(directory, "bulk.json"))
+    start = time.perf_counter()
+    saver.add_vacancies(vacancies)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--per-item-limit", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'per-item, s':>14} {'bulk, s':>10} {'speedup':>10}")
+    for size in args.sizes:
+        vacancies = make_vacancies(size)
+        with tempfile.TemporaryDirectory() as directory:
+            bulk = time_bulk(vacancies, directory)
+            measured = min(size, args.per_item_limit)
+            per_item = time_per_item(vacancies[:measured], directory)
+            estimated = measured < size
+            if estimated:
+                per_item *= (size / measured) ** 2
+        mark = "~" if estimated else ""
+        print(f"{size:>10} {mark + format(per_item, '.2f'):>14} {bulk:>10.3f} "
+              f"{per_item / bulk:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Бенчмарк всего конвейера: разбор ответа API, сохранение в JSONSaver,
+фильтрация и сортировка, а также загрузка страниц HeadHunterAPI
+с локального сервера-заглушки с искусственной задержкой.
+
+Запуск:
+    python -m benchmarks.bench_pipeline --sizes 1000 10000 100000 1000000 \\
+        --output results.json
+    python -m benchmarks.bench_pipeline --baseline results.json
+
+Результат печатается в формате JSON: для каждой операции и размера —
+лучшее время из --repeat запусков. С --baseline операции, ставшие
+медленнее больше чем на --tolerance, перечисляются в stderr, а код
+возврата равен 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.payloads import make_items, make_page
+from src.api import HeadHunterAPI, RequestScheduler
+from src.file_connector import JSONSaver
+from src.utils import (filter_vacancies, get_top_vacancies,
+                       get_vacancies_by_salary, sort_vacancies)
+from src.vacancy import Vacancy
+
+
+def measure(func: Callable[[], object], repeat: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """
+    Лучшее время выполнения func из repeat запусков.
+
+    :param func: Измеряемая функция без аргументов.
+    :param repeat: Количество запусков.
+    :param setup: Подготовка перед каждым запуском, не входящая в замер.
+    :return: Время в секундах.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_size(size: int, repeat: int, directory: str) -> list:
+    """Замеры разбора, сохранения и обработки для набора из size вакансий."""
+    items = make_items(size)
+    results = []
+
+    def record(name: str, seconds: float) -> None:
+        results.append({"name": name, "size": size, "seconds": round(seconds, 6), "repeat": repeat})
+
+    record("vacancy.cast_to_object_list", measure(lambda: Vacancy.cast_to_object_list(items), repeat))
+    vacancies = Vacancy.cast_to_object_list(items)
+    # Сырые данные больше не нужны; del недопустим, пока на items ссылается лямбда.
+    items = None
+
+    filename = os.path.join(directory, f"vacancies_{size}.json")
+
+    def fresh_file() -> None:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    saver = JSONSaver(filename)
+    record("json_saver.add_vacancies", measure(lambda: saver.add_vacancies(vacancies), repeat, fresh_file))
+    saver.add_vacancies(vacancies)
+
+    extra = Vacancy("Senior Python разработчик", "https://hh.ru/vacancy/1", "От 300000 RUR", "Django")
+
+    def remove_extra() -> None:
+        saver.delete_vacancy(extra)
+
+    record("json_saver.add_vacancy", measure(lambda: saver.add_vacancy(extra), repeat, remove_extra))
+    record("json_saver.get_vacancies", measure(saver.get_vacancies, repeat))
+    record(
+        "json_saver.get_vacancies_by_criteria",
+        measure(lambda: saver.get_vacancies({"keyword": "kafka", "salary_min": 200000}), repeat),
+    )
+
+    def add_extra() -> None:
+        saver.add_vacancy(extra)
+
+    record("json_saver.delete_vacancy", measure(lambda: saver.delete_vacancy(extra), repeat, add_extra))
+    fresh_file()
+
+    record("utils.filter_vacancies", measure(lambda: filter_vacancies(vacancies, ["django", "kafka"]), repeat))
+    record(
+        "utils.get_vacancies_by_salary",
+        measure(lambda: get_vacancies_by_salary(vacancies, "100000 - 200000"), repeat),
+    )
+    record("utils.sort_vacancies", measure(lambda: sort_vacancies(vacancies), repeat))
+    ordered = sort_vacancies(vacancies)
+    record("utils.get_top_vacancies", measure(lambda: get_top_vacancies(ordered, 10), repeat))
+    return results
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Отдаёт страницы синтетической выдачи с задержкой server.latency."""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["0"])[0])
+        per_page = int(query.get("per_page", ["100"])[0])
+        time.sleep(self.server.latency)
+        body = json.dumps(make_page(self.server.items, page, per_page)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def bench_api(pages: int, latency: float, max_workers: int, repeat: int) -> list:
+    """Замер HeadHunterAPI.get_vacancies по pages страницам с задержкой latency."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.items = make_items(pages * 100)
+    server.latency = latency
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    api = HeadHunterAPI(
+        base_url=f"http://{host}:{port}/vacancies",
+        max_pages=pages,
+        max_workers=max_workers,
+        scheduler=RequestScheduler(requests_per_second=1000, max_concurrency=max_workers),
+    )
+    try:
+        seconds = measure(lambda: api.get_vacancies("python"), repeat)
+    finally:
+        api.close()
+        server.shutdown()
+        server.server_close()
+    return [{
+        "name": f"api.get_vacancies[latency={latency},workers={max_workers}]",
+        "size": pages * 100,
+        "seconds": round(seconds, 6),
+        "repeat": repeat,
+    }]
+
+
+def environment() -> dict:
+    """Сведения об окружении для сравнения результатов между коммитами."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import numpy  # noqa: F401
+        has_numpy = True
+    except ImportError:
+        has_numpy = False
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": has_numpy,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def find_regressions(results: list, baseline: list, tolerance: float, min_delta: float = 0.001) -> list:
+    """
+    Операции, ставшие медленнее базовых замеров больше чем на tolerance.
+    Разница меньше min_delta секунд считается шумом измерения.
+
+    :return: Список кортежей (операция, размер, базовое время, новое время).
+    """
+    base = {(item["name"], item["size"]): item["seconds"] for item in baseline}
+    regressions = []
+    for item in results:
+        old = base.get((item["name"], item["size"]))
+        if old and item["seconds"] > old * (1 + tolerance) and item["seconds"] - old > min_delta:
+            regressions.append((item["name"], item["size"], old, item["seconds"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--api-pages", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--output", help="файл для результатов вместо stdout")
+    parser.add_argument("--baseline", help="файл с результатами для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results.extend(bench_size(size, args.repeat, directory))
+    if args.api_pages:
+        results.extend(bench_api(args.api_pages, args.latency, args.workers, args.repeat))
+
+    report = {"environment": environment(), "results": results}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for name, size, old, new in regressions:
+            print(f"{name} [{size}]: {old:.4f} s -> {new:.4f} s", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
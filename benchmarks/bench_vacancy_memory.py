@@ -0,0 +1,103 @@
+"""
+Память и скорость работы с большим набором вакансий в трёх представлениях:
+прежний класс Vacancy с __dict__, Vacancy со __slots__ и VacancyTable.
+
+Запуск:
+    python -m benchmarks.bench_vacancy_memory --size 200000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.utils import get_vacancies_by_salary, sort_vacancies
+from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+
+class LegacyVacancy:
+    """Копия прежней раскладки Vacancy: атрибуты в __dict__, зарплата из строки."""
+
+    def __init__(self, title, url, salary, description):
+        self.__title = title
+        self.__url = url
+        self.__salary = salary
+        self.__description = description
+
+    @property
+    def title(self):
+        return self.__title
+
+    @property
+    def url(self):
+        return self.__url
+
+    @property
+    def salary(self):
+        return self.__salary
+
+    @property
+    def description(self):
+        return self.__description
+
+    def _get_salary_value(self) -> int:
+        clean_salary = "".join(filter(str.isdigit, self.salary))
+        return int(clean_salary) if clean_salary else 0
+
+
+def make_rows(count: int) -> list:
+    """Создаёт исходные поля вакансий. Строки общие для всех представлений."""
+    return [
+        (
+            f"Python Developer {i}",
+            f"https://hh.ru/vacancy/{i}",
+            f"От {50000 + i % 2000 * 100} RUR",
+            "Опыт работы с Python от 3 лет, знание SQL и Linux.",
+        )
+        for i in range(count)
+    ]
+
+
+def measure(build, rows: list) -> tuple:
+    """Строит представление и возвращает его вместе с занятой памятью в байтах."""
+    gc.collect()
+    tracemalloc.start()
+    container = build(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return container, current
+
+
+def timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200000)
+    args = parser.parse_args()
+    rows = make_rows(args.size)
+
+    variants = {
+        "legacy __dict__": lambda r: [LegacyVacancy(*row) for row in r],
+        "Vacancy __slots__": lambda r: [Vacancy(*row) for row in r],
+        "VacancyTable": lambda r: VacancyTable(Vacancy(*row) for row in r),
+    }
+    # Прогрев: numpy импортируется при первой обработке таблицы,
+    # и время импорта не должно попадать в замер первой сортировки.
+    sort_vacancies(VacancyTable(Vacancy(*row) for row in rows[:10]))
+
+    print(f"{args.size} вакансий")
+    print(f"{'variant':>18} {'memory, MB':>11} {'sort, s':>8} {'range, s':>9}")
+    for name, build in variants.items():
+        container, memory = measure(build, rows)
+        sort_time = timed(sort_vacancies, container)
+        range_time = timed(get_vacancies_by_salary, container, "100000 - 150000")
+        print(f"{name:>18} {memory / 2 ** 20:>11.1f} {sort_time:>8.3f} {range_time:>9.3f}")
+        del container
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Синтетические ответы API hh.ru для бенчмарков.
+
+Вакансии повторяют форму элементов поля items метода /vacancies:
+примерно у трети нет зарплаты, у части указана только одна граница,
+тексты составлены из небольшого словаря, чтобы фильтры по ключевым
+словам находили и много, и мало совпадений. Генерация детерминирована.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+_ROLES = ["Python", "Java", "Go", "Frontend", "Data", "QA", "DevOps", "Аналитик"]
+_LEVELS = ["Junior", "Middle", "Senior", "Lead"]
+_SKILLS = [
+    "Python", "Django", "FastAPI", "SQL", "PostgreSQL", "Linux", "Docker",
+    "Kubernetes", "Git", "Kafka", "Redis", "pandas", "React", "TypeScript",
+]
+_CURRENCIES = ["RUR", "RUR", "RUR", "RUR", "USD", "EUR", "KZT"]
+_START = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=3)))
+
+
+def make_item(number: int, rng: random.Random) -> dict:
+    """Одна вакансия в формате элемента выдачи поиска hh.ru."""
+    role = rng.choice(_ROLES)
+    skills = rng.sample(_SKILLS, 3)
+    salary = None
+    kind = rng.random()
+    if kind > 0.35:
+        low = rng.randrange(40, 400) * 1000
+        salary = {
+            "from": low if kind < 0.85 else None,
+            "to": low + rng.randrange(0, 150) * 1000 if kind > 0.6 else None,
+            "currency": rng.choice(_CURRENCIES),
+            "gross": rng.random() < 0.5,
+        }
+    published = _START + timedelta(minutes=number)
+    return {
+        "id": str(10_000_000 + number),
+        "name": f"{rng.choice(_LEVELS)} {role} разработчик",
+        "alternate_url": f"https://hh.ru/vacancy/{10_000_000 + number}",
+        "area": {"id": "1", "name": "Москва"},
+        "salary": salary,
+        "published_at": published.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "snippet": {
+            "requirement": f"Опыт работы с {skills[0]} от {rng.randint(1, 5)} лет, "
+                           f"знание {skills[1]} и {skills[2]}.",
+            "responsibility": "Разработка и поддержка сервисов компании.",
+        },
+    }
+
+
+def make_items(count: int, seed: int = 0) -> list:
+    """
+    Список синтетических вакансий.
+
+    :param count: Количество вакансий.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список вакансий в формате JSON.
+    """
+    rng = random.Random(seed)
+    return [make_item(number, rng) for number in range(count)]
+
+
+def make_page(items: list, page: int, per_page: int) -> dict:
+    """Страница ответа поиска hh.ru из готового списка вакансий."""
+    pages = max(1, -(-len(items) // per_page))
+    return {
+        "items": items[page * per_page:(page + 1) * per_page],
+        "found": len(items),
+        "pages": pages,
+        "page": page,
+        "per_page": per_page,
+    }
@@ -1,4 +1,6 @@
-from src.user_interface import user_interaction
+import sys
+
+from src.cli import main
 
 if __name__ == "__main__":
-    user_interaction()
+    sys.exit(main())
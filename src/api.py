@@ -1,11 +1,274 @@
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Callable, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src import metrics
+from src.http_cache import ResponseCache
+
+# Ответы, после которых запрос имеет смысл повторить.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class APIRequestError(Exception):
+    """Запрос к API не удался (в том числе после всех повторов)."""
+
+
+class CircuitOpenError(APIRequestError):
+    """Запрос не отправлен: предохранитель разомкнут после серии ошибок."""
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму «ведро с жетонами».
+    Жетоны пополняются со скоростью rate в секунду, но не больше capacity.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        :param rate: Количество запросов в секунду.
+        :param capacity: Размер ведра — допустимая пачка запросов подряд.
+        :param clock: Источник времени (для тестов).
+        :param sleep: Функция ожидания (для тестов).
+        """
+        if rate <= 0:
+            raise ValueError("rate должен быть положительным.")
+        self.__rate = rate
+        self.__capacity = capacity if capacity is not None else max(1.0, rate)
+        self.__tokens = self.__capacity
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__updated = clock()
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Забирает один жетон, при необходимости дожидаясь его появления."""
+        while True:
+            with self.__lock:
+                now = self.__clock()
+                self.__tokens = min(
+                    self.__capacity, self.__tokens + (now - self.__updated) * self.__rate
+                )
+                self.__updated = now
+                # Допуск нужен, чтобы ошибки округления не давали бесконечно малых ожиданий.
+                if self.__tokens >= 1 - 1e-9:
+                    self.__tokens = max(0.0, self.__tokens - 1)
+                    return
+                wait = (1 - self.__tokens) / self.__rate
+            self.__sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    Предохранитель: после failure_threshold ошибок подряд размыкается
+    на reset_timeout секунд, затем пропускает один пробный запрос.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param failure_threshold: Количество ошибок подряд до размыкания.
+        :param reset_timeout: Время в секундах до пробного запроса.
+        :param clock: Источник времени (для тестов).
+        """
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__clock = clock
+        self.__failures = 0
+        self.__opened_at = None
+        self.__trial_in_progress = False
+        self.__lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Разомкнут ли предохранитель."""
+        return self.__opened_at is not None
+
+    def before_request(self) -> None:
+        """Проверяет, можно ли отправить запрос, иначе выбрасывает CircuitOpenError."""
+        with self.__lock:
+            if self.__opened_at is None:
+                return
+            if (self.__clock() - self.__opened_at >= self.__reset_timeout
+                    and not self.__trial_in_progress):
+                self.__trial_in_progress = True
+                return
+        raise CircuitOpenError("API временно недоступно: слишком много ошибок подряд.")
+
+    def record_success(self) -> None:
+        """Учитывает успешный запрос и замыкает предохранитель."""
+        with self.__lock:
+            self.__failures = 0
+            self.__opened_at = None
+            self.__trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Учитывает ошибку и при необходимости размыкает предохранитель."""
+        with self.__lock:
+            self.__failures += 1
+            self.__trial_in_progress = False
+            if self.__opened_at is not None or self.__failures >= self.__failure_threshold:
+                self.__opened_at = self.__clock()
+
+
+class RequestScheduler:
+    """
+    Планировщик HTTP-запросов, общий для всех клиентов AbstractAPI.
+
+    Ограничивает частоту запросов (TokenBucket) и число одновременных
+    запросов, задаёт таймауты соединения и чтения, повторяет запросы
+    после ошибок соединения и ответов 429/5xx с экспоненциальной
+    задержкой и случайным разбросом (учитывая заголовок Retry-After)
+    и размыкает CircuitBreaker при серии ошибок.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 7,
+        burst: Optional[float] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 15,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        :param requests_per_second: Допустимая частота запросов.
+        :param burst: Допустимая пачка запросов подряд.
+        :param max_concurrency: Максимальное число одновременных запросов.
+        :param max_retries: Количество повторов после первой попытки.
+        :param backoff_base: Базовая задержка перед повтором в секундах.
+        :param backoff_max: Максимальная задержка перед повтором в секундах.
+        :param connect_timeout: Таймаут установки соединения в секундах.
+        :param read_timeout: Таймаут чтения ответа в секундах.
+        :param failure_threshold: Ошибок подряд до размыкания предохранителя.
+        :param reset_timeout: Время до пробного запроса после размыкания.
+        :param sleep: Функция ожидания (для тестов).
+        """
+        self.bucket = TokenBucket(requests_per_second, burst, sleep=sleep)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.__slots = threading.BoundedSemaphore(max_concurrency)
+        self.__max_concurrency = max_concurrency
+        self.__max_retries = max_retries
+        self.__backoff_base = backoff_base
+        self.__backoff_max = backoff_max
+        self.__timeout = (connect_timeout, read_timeout)
+        self.__sleep = sleep
+
+    @property
+    def max_concurrency(self) -> int:
+        """Максимальное число одновременных запросов."""
+        return self.__max_concurrency
+
+    def _backoff(self, attempt: int) -> float:
+        """Экспоненциальная задержка с полным случайным разбросом."""
+        return random.uniform(0, min(self.__backoff_max, self.__backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Задержка из заголовка Retry-After (секунды или HTTP-дата)."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Выполняет запрос с учётом лимитов и повторов.
+
+        :param session: HTTP-сессия клиента.
+        :param method: HTTP-метод.
+        :param url: Адрес запроса.
+        :param kwargs: Параметры для requests.Session.request.
+        :return: Ответ сервера (кроме 429/5xx, которые исчерпали повторы).
+        :raises APIRequestError: Если запрос не удался после всех повторов.
+        """
+        kwargs.setdefault("timeout", self.__timeout)
+        last_error = None
+        for attempt in range(self.__max_retries + 1):
+            self.breaker.before_request()
+            self.bucket.acquire()
+            retry_after = None
+            try:
+                with self.__slots:
+                    response = session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                self.breaker.record_failure()
+                last_error = f"{type(e).__name__}: {e}"
+            except BaseException:
+                # Любой выход без ответа должен освободить пробный запрос предохранителя.
+                self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if response.status_code == 429:
+                    # Сервер доступен и лишь просит снизить частоту запросов.
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+                retry_after = self._retry_after(response)
+                last_error = f"HTTP {response.status_code}"
+            if attempt < self.__max_retries:
+                if retry_after is not None and retry_after > self.__backoff_max:
+                    raise APIRequestError(
+                        f"Запрос {method} {url}: сервер просит повторить через "
+                        f"{retry_after:.0f} с, это больше допустимых {self.__backoff_max:.0f} с"
+                    )
+                self.__sleep(retry_after if retry_after is not None else self._backoff(attempt))
+        raise APIRequestError(
+            f"Запрос {method} {url} не удался после {self.__max_retries + 1} попыток: {last_error}"
+        )
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler() -> RequestScheduler:
+    """Планировщик по умолчанию, общий для всех клиентов API в процессе."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+        return _default_scheduler
 
 
 class AbstractAPI(ABC):
     """Абстрактный класс для работы с API сервиса с вакансиями."""
 
+    def __init__(self, scheduler: Optional[RequestScheduler] = None):
+        """
+        :param scheduler: Планировщик запросов; по умолчанию общий для процесса.
+        """
+        self._scheduler = scheduler or get_default_scheduler()
+
+    def _request(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        """Выполняет HTTP-запрос через планировщик."""
+        return self._scheduler.request(session, method, url, **kwargs)
+
     @abstractmethod
     def get_vacancies(self, keyword: str) -> list:
         """Получить вакансии по ключевому слову."""
@@ -15,26 +278,190 @@ class AbstractAPI(ABC):
 class HeadHunterAPI(AbstractAPI):
     """Класс для работы с платформой hh.ru."""
 
-    def __init__(self):
-        self.__base_url = "https://api.hh.ru/vacancies"
+    def __init__(
+        self,
+        area: int = 1,
+        per_page: int = 100,
+        max_pages: int = 20,
+        max_workers: int = 4,
+        base_url: str = "https://api.hh.ru/vacancies",
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        """
+        Инициализация клиента hh.ru.
+
+        :param area: Идентификатор региона поиска (1 — Москва).
+        :param per_page: Количество вакансий на странице (не больше 100).
+        :param max_pages: Максимальное количество запрашиваемых страниц.
+        :param max_workers: Количество одновременных запросов страниц.
+        :param base_url: Адрес метода поиска вакансий.
+        :param cache: Дисковый кэш ответов (необязательно).
+        :param scheduler: Планировщик запросов; по умолчанию общий для процесса.
+        """
+        super().__init__(scheduler)
+        if max_pages < 1 or max_workers < 1:
+            raise ValueError("max_pages и max_workers должны быть положительными.")
+        self.__base_url = base_url
+        self.__area = area
+        self.__per_page = per_page
+        self.__max_pages = max_pages
+        self.__max_workers = max_workers
+        self.__cache = cache
+        self.__session = requests.Session()
+        # Сессию используют все потоки, работающие с клиентом (например,
+        # задания Harvester), а одновременных запросов бывает столько,
+        # сколько пропускает планировщик: при меньшем пуле соединения
+        # сверх него закрывались бы после каждого запроса.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(max_workers, self._scheduler.max_concurrency),
+        )
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
 
-    def get_vacancies(self, keyword: str) -> list:
+    def close(self) -> None:
+        """Закрывает HTTP-сессию и её пул соединений."""
+        self.__session.close()
+
+    def _fetch_page(self, keyword: str, page: int, extra_params: Optional[dict] = None) -> dict:
         """
-        Получает вакансии с hh.ru по ключевому слову.
-        Возвращает список вакансий в формате JSON.
+        Запрашивает одну страницу результатов поиска.
+
+        :param keyword: Поисковый запрос.
+        :param page: Номер страницы (с нуля).
+        :param extra_params: Дополнительные фильтры поиска hh.ru
+            (например, area, date_from, order_by).
+        :return: Ответ API в формате JSON.
+        :raises APIRequestError: Если страницу не удалось получить.
         """
         params = {
             "text": keyword,
-            "area": 1,
-            "per_page": 100,
-            "page": 0
+            "area": self.__area,
+            "per_page": self.__per_page,
         }
+        params.update(extra_params or {})
+        params["page"] = page
+        return self._get_json(self.__base_url, params)
 
-        try:
-            response = requests.get(self.__base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("items", [])
-        except requests.RequestException as e:
-            print(f"Ошибка при запросе к API: {e}")
-            return []
+    def get_vacancy_details(self, vacancy_id: str) -> dict:
+        """
+        Запрашивает полное описание вакансии (метод /vacancies/{id}).
+
+        :param vacancy_id: Идентификатор вакансии hh.ru.
+        :return: Ответ API в формате JSON с полями description и key_skills.
+        :raises APIRequestError: Если вакансию не удалось получить.
+        """
+        return self._get_json(f"{self.__base_url}/{vacancy_id}", {})
+
+    def _get_json(self, url: str, params: dict) -> dict:
+        """
+        Выполняет GET-запрос через планировщик и кэш ответов.
+
+        :param url: Адрес запроса.
+        :param params: Параметры запроса.
+        :return: Ответ API в формате JSON.
+        :raises APIRequestError: Если ответ не удалось получить.
+        """
+
+        def send(headers: dict) -> requests.Response:
+            response = self._request(self.__session, "GET", url, params=params, headers=headers)
+            timing.nbytes += len(response.content)
+            return response
+
+        with metrics.timer("api.request") as timing:
+            try:
+                if self.__cache is not None:
+                    data = self.__cache.fetch(url, params, send)
+                else:
+                    response = send({})
+                    response.raise_for_status()
+                    data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                raise APIRequestError(f"Ошибка при запросе к API: {e}") from e
+            timing.records = len(data.get("items", ()))
+        return data
+
+    @metrics.timed("api.get_vacancies", records=len)
+    def get_vacancies(self, keyword: str, extra_params: Optional[dict] = None) -> list:
+        """
+        Получает вакансии с hh.ru по ключевому слову.
+        Возвращает список вакансий в формате JSON в порядке страниц
+        без повторов.
+        :param extra_params: Дополнительные фильтры поиска hh.ru.
+        :raises APIRequestError: Если не удалось получить одну из страниц.
+        """
+        vacancies = []
+        for items in self.iter_pages(keyword, extra_params):
+            vacancies.extend(items)
+        return vacancies
+
+    def iter_pages(
+        self, keyword: str, extra_params: Optional[dict] = None, info: Optional[dict] = None
+    ) -> Iterator[list]:
+        """
+        Постранично отдаёт вакансии с hh.ru по ключевому слову.
+        Первая страница определяет общее число страниц (поле pages),
+        остальные запрашиваются параллельно, но не больше max_pages.
+        Одновременно в работе находится не больше max_workers страниц,
+        поэтому в памяти держится только окно из нескольких страниц.
+
+        :param keyword: Поисковый запрос.
+        :param extra_params: Дополнительные фильтры поиска hh.ru; значения
+            area и per_page заменяют заданные в конструкторе.
+        :param info: Словарь, который после первой страницы заполняется
+            сведениями о выдаче: found, pages и truncated — True, если
+            выдача не поместилась в max_pages страниц или hh.ru отдаёт
+            меньше вакансий, чем нашёл (необязательно).
+        :return: Генератор списков вакансий в формате JSON.
+        :raises APIRequestError: Если не удалось получить одну из страниц.
+        """
+        seen_ids = set()
+        first_page = self._fetch_page(keyword, 0, extra_params)
+        yield self._unique_items(first_page, seen_ids)
+
+        reported_pages = int(first_page.get("pages", 1))
+        total_pages = min(reported_pages, self.__max_pages)
+        if info is not None:
+            found = int(first_page.get("found", 0))
+            per_page = int(first_page.get("per_page") or 0)
+            info["found"] = found
+            info["pages"] = reported_pages
+            info["truncated"] = reported_pages > total_pages or (
+                per_page > 0 and found > reported_pages * per_page
+            )
+        if total_pages <= 1:
+            return
+        workers = min(self.__max_workers, total_pages - 1)
+        pages = iter(range(1, total_pages))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(self._fetch_page, keyword, page, extra_params)
+                for page in islice(pages, workers)
+            )
+            while pending:
+                try:
+                    data = pending.popleft().result()
+                except APIRequestError:
+                    for future in pending:
+                        future.cancel()
+                    raise
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(
+                        executor.submit(self._fetch_page, keyword, next_page, extra_params)
+                    )
+                yield self._unique_items(data, seen_ids)
+
+    @staticmethod
+    def _unique_items(data: dict, seen_ids: set) -> list:
+        """Возвращает вакансии страницы, которых ещё не было в выдаче."""
+        items = []
+        for item in data.get("items", []):
+            item_id = item.get("id") or item.get("alternate_url")
+            if item_id is not None:
+                if item_id in seen_ids:
+                    continue
+                seen_ids.add(item_id)
+            items.append(item)
+        return items
@@ -0,0 +1,412 @@
+"""
+Неинтерактивный режим для cron и пакетных заданий.
+
+    python main.py search python java --area 1 --area 2 --keywords django \\
+        --salary "100000 - 200000" --top 10 --format csv
+    python main.py search --config queries.json
+    python main.py query data/vacancies.jsonl --keywords kafka --format table
+    python main.py ingest dumps/*.jsonl --save data/vacancies.db --workers 8
+    python main.py                # интерактивный режим
+
+Команда search выполняет запросы параллельно и выводит подходящие
+вакансии в stdout по мере получения страниц; с --top результат
+выводится после сбора. Команда query читает сохранённый архив
+(.json, .jsonl или .db) потоково, а ingest загружает в архив сохранённые
+сырые ответы API в пуле процессов. Клиент hh.ru (а с ним requests)
+и модуль SQLite импортируются только командами, которым они нужны,
+поэтому запуск команд, работающих с архивом, остаётся быстрым.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from src import metrics
+from src.file_connector import AbstractFileConnector, JSONLinesSaver, JSONSaver
+from src.search_index import normalize_keyword
+from src.utils import (filter_vacancies, get_vacancies_by_salary,
+                       top_vacancies_by_salary)
+from src.vacancy import Vacancy
+
+FORMATS = ("json", "csv", "table")
+
+# Параметры команды search, которые можно задать в файле конфигурации,
+# и их значения по умолчанию. Аргументы командной строки важнее файла.
+_SEARCH_DEFAULTS = {
+    "queries": [],
+    "areas": [],
+    "keywords": [],
+    "mode": "any",
+    "stem": False,
+    "salary": None,
+    "top": None,
+    "format": "json",
+    "save": None,
+    "workers": 4,
+}
+
+_CSV_FIELDS = ("title", "url", "salary", "salary_from", "salary_to", "currency")
+
+# Сколько вакансий архива обрабатывается за один проход фильтров.
+_CHUNK_SIZE = 1000
+
+
+class VacancyWriter:
+    """
+    Потоковый вывод вакансий в формате JSON (массив по одному объекту
+    в строке), CSV или текстовой таблицы. Каждая пачка выводится сразу,
+    поэтому вывод можно читать, не дожидаясь окончания команды.
+    """
+
+    def __init__(self, output: TextIO, fmt: str = "json"):
+        """
+        :param output: Поток вывода.
+        :param fmt: Формат: "json", "csv" или "table".
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Неизвестный формат вывода: {fmt}")
+        self.__output = output
+        self.__format = fmt
+        self.__count = 0
+        self.__csv = csv.writer(output, lineterminator="\n") if fmt == "csv" else None
+        if fmt == "csv":
+            self.__csv.writerow(_CSV_FIELDS)
+        elif fmt == "table":
+            output.write(f"{'Зарплата':<28} {'Вакансия':<50} Ссылка\n")
+
+    @property
+    def count(self) -> int:
+        """Количество выведенных вакансий."""
+        return self.__count
+
+    def write(self, vacancies: Iterable[Vacancy]) -> None:
+        """Выводит пачку вакансий и сбрасывает буфер потока."""
+        for vacancy in vacancies:
+            if self.__format == "json":
+                separator = "[\n" if not self.__count else ",\n"
+                item = vacancy.to_dict()
+                # Ключ поиска нужен хранилищам, а не читателю вывода.
+                del item["search_text"]
+                self.__output.write(separator + json.dumps(item, ensure_ascii=False))
+            elif self.__format == "csv":
+                self.__csv.writerow([getattr(vacancy, field) for field in _CSV_FIELDS])
+            else:
+                self.__output.write(f"{vacancy.salary:<28.28} {vacancy.title:<50.50} {vacancy.url}\n")
+            self.__count += 1
+        self.__output.flush()
+
+    def close(self) -> None:
+        """Завершает вывод (закрывает массив JSON)."""
+        if self.__format == "json":
+            self.__output.write("\n]\n" if self.__count else "[]\n")
+        self.__output.flush()
+
+
+class ResultSelector:
+    """
+    Отбор вакансий по ключевым словам и диапазону зарплат.
+    Без top_n подходящие вакансии сразу передаются в вывод; с top_n
+    хранятся только лучшие кандидаты, а вывод происходит в finish.
+    """
+
+    def __init__(
+        self,
+        writer: VacancyWriter,
+        keywords: Optional[List[str]] = None,
+        salary_range: Optional[str] = None,
+        top_n: Optional[int] = None,
+        mode: str = "any",
+        stem: bool = False,
+    ):
+        """
+        :param writer: Вывод результатов.
+        :param keywords: Ключевые слова для фильтрации (необязательно).
+        :param salary_range: Диапазон зарплат, например "100000 - 150000".
+        :param top_n: Вывести только N вакансий с наибольшей зарплатой.
+        :param mode: "any" — хотя бы одно ключевое слово, "all" — все.
+        :param stem: Отсекать окончания ключевых слов (см. filter_vacancies).
+        """
+        self.__writer = writer
+        self.__keywords = keywords or []
+        self.__salary_range = salary_range
+        self.__top_n = top_n
+        self.__mode = mode
+        self.__stem = stem
+        self.__candidates = []
+
+    def add(self, vacancies: List[Vacancy]) -> None:
+        """Отбирает подходящие вакансии из пачки."""
+        matched = filter_vacancies(vacancies, self.__keywords, self.__mode, stem=self.__stem)
+        if self.__salary_range:
+            matched = get_vacancies_by_salary(matched, self.__salary_range)
+        if self.__top_n is None:
+            self.__writer.write(matched)
+            return
+        self.__candidates.extend(matched)
+        # Кандидатов, которые уже не попадут в топ, держать в памяти незачем.
+        if len(self.__candidates) > 2 * self.__top_n + _CHUNK_SIZE:
+            self.__candidates = top_vacancies_by_salary(self.__candidates, self.__top_n)
+
+    def finish(self) -> int:
+        """
+        Выводит топ (если он задан) и завершает вывод.
+
+        :return: Количество выведенных вакансий.
+        """
+        if self.__top_n is not None:
+            self.__writer.write(top_vacancies_by_salary(self.__candidates, self.__top_n))
+            self.__candidates = []
+        self.__writer.close()
+        return self.__writer.count
+
+
+def open_connector(filename: str) -> AbstractFileConnector:
+    """
+    Хранилище по расширению файла: .json, .jsonl или .db (.sqlite).
+
+    :param filename: Путь к файлу архива.
+    :return: Объект хранилища.
+    :raises ValueError: Если расширение не поддерживается.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".json":
+        return JSONSaver(filename)
+    if extension == ".jsonl":
+        return JSONLinesSaver(filename)
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        from src.db_connector import SQLiteSaver
+
+        return SQLiteSaver(filename)
+    raise ValueError(f"Неизвестный формат архива: {filename}")
+
+
+def close_connector(connector: Optional[AbstractFileConnector]) -> None:
+    """Закрывает соединение с базой, если хранилище его держит."""
+    disconnect = getattr(connector, "disconnect_from_db", None)
+    if disconnect is not None:
+        disconnect()
+
+
+def _chunks(vacancies: Iterable[Vacancy], size: int = _CHUNK_SIZE) -> Iterator[List[Vacancy]]:
+    """Разбивает поток вакансий на списки по size штук."""
+    vacancies = iter(vacancies)
+    while True:
+        chunk = list(islice(vacancies, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_config(filename: str) -> dict:
+    """
+    Читает параметры команды search из файла JSON.
+
+    :param filename: Путь к файлу конфигурации.
+    :return: Словарь параметров.
+    :raises ValueError: Если файл содержит неизвестные параметры.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("Файл конфигурации должен содержать объект JSON.")
+    unknown = set(config) - set(_SEARCH_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Неизвестные параметры конфигурации: {', '.join(sorted(unknown))}")
+    return config
+
+
+def search_options(args: argparse.Namespace) -> dict:
+    """Параметры поиска: значения по умолчанию, затем файл конфигурации, затем аргументы."""
+    options = dict(_SEARCH_DEFAULTS)
+    if args.config:
+        options.update(load_config(args.config))
+    for name in _SEARCH_DEFAULTS:
+        value = getattr(args, name)
+        if value is not None and value != []:
+            options[name] = value
+    if options["format"] not in FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {options['format']}")
+    return options
+
+
+def run_search(args: argparse.Namespace, output: TextIO = None) -> int:
+    """
+    Команда search: параллельный поиск по запросам и регионам.
+
+    :return: Код возврата: 0, или 1, если часть запросов завершилась ошибкой.
+    """
+    output = output or sys.stdout
+    options = search_options(args)
+    if not options["queries"]:
+        raise ValueError("Не задано ни одного поискового запроса.")
+
+    # Клиент hh.ru тянет за собой requests, поэтому импортируется здесь.
+    from src.api import HeadHunterAPI
+    from src.harvester import Harvester
+
+    connector = open_connector(options["save"]) if options["save"] else None
+    selector = ResultSelector(
+        VacancyWriter(output, options["format"]),
+        options["keywords"], options["salary"], options["top"], options["mode"], options["stem"],
+    )
+    api = HeadHunterAPI()
+    try:
+        harvester = Harvester(api, connector, max_workers=options["workers"])
+        stats = harvester.harvest(
+            options["queries"], options["areas"] or (None,), on_batch=selector.add
+        )
+    finally:
+        api.close()
+        close_connector(connector)
+    count = selector.finish()
+    for (keyword, params), error in stats["errors"]:
+        print(f"{keyword} {params}: {error}", file=sys.stderr)
+    print(
+        f"Получено {stats['fetched']} вакансий, отклонено {stats['rejected']}, выведено {count}.",
+        file=sys.stderr,
+    )
+    return 1 if stats["errors"] else 0
+
+
+def run_query(args: argparse.Namespace, output: TextIO = None) -> int:
+    """
+    Команда query: отбор вакансий из сохранённого архива без обращения к API.
+
+    :return: Код возврата: 0, или 1, если архив не найден.
+    """
+    output = output or sys.stdout
+    if not os.path.exists(args.archive):
+        print(f"Архив не найден: {args.archive}", file=sys.stderr)
+        return 1
+    connector = open_connector(args.archive)
+    selector = ResultSelector(
+        VacancyWriter(output, args.format), args.keywords, args.salary, args.top, args.mode, args.stem
+    )
+    # Единственное ключевое слово отбирает уже хранилище (в SQLite — по индексу).
+    criteria = None
+    if len(args.keywords) == 1:
+        criteria = {"keyword": normalize_keyword(args.keywords[0], stem=args.stem)}
+    try:
+        for chunk in _chunks(connector.iter_vacancies(criteria)):
+            selector.add(chunk)
+    finally:
+        close_connector(connector)
+    selector.finish()
+    return 0
+
+
+def run_ingest(args: argparse.Namespace) -> int:
+    """
+    Команда ingest: загрузка сырых ответов API из файлов в архив.
+    Отклонённые записи перечисляются в stderr.
+
+    :return: Код возврата 0.
+    """
+    from src.ingest import ParallelIngestor
+
+    connector = open_connector(args.save)
+    try:
+        ingestor = ParallelIngestor(connector, max_workers=args.workers)
+        stats = ingestor.ingest(args.files)
+    finally:
+        close_connector(connector)
+    for source, position, error in ingestor.rejects:
+        print(f"{source}:{position}: {error}", file=sys.stderr)
+    print(
+        f"Частей {stats['shards']}, разобрано {stats['parsed']}, сохранено {stats['saved']}, "
+        f"повторов {stats['duplicates']}, отклонено {stats['rejected']}.",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def run_interactive(args: argparse.Namespace) -> int:
+    """Интерактивный режим с вопросами в консоли."""
+    from src.user_interface import user_interaction
+
+    user_interaction()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Парсер аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Поиск вакансий на hh.ru")
+    parser.add_argument(
+        "--profile", choices=["cpu", "memory"],
+        help="выполнить под cProfile (cpu) или tracemalloc (memory) и напечатать отчёт",
+    )
+    parser.add_argument(
+        "--metrics", action="append", default=[], metavar="SINK",
+        help="приёмник метрик этапов: memory, json:ПУТЬ или prometheus:ПУТЬ",
+    )
+    parser.set_defaults(handler=run_interactive)
+    commands = parser.add_subparsers(title="команды")
+
+    def add_filters(command: argparse.ArgumentParser, defaults: bool) -> None:
+        # У search значения по умолчанию берутся из _SEARCH_DEFAULTS после
+        # чтения файла конфигурации, поэтому здесь они не задаются.
+        command.add_argument(
+            "--keywords", nargs="+", default=[] if defaults else None, metavar="СЛОВО",
+            help="ключевые слова в названии или описании",
+        )
+        command.add_argument(
+            "--mode", choices=["any", "all"], default="any" if defaults else None,
+            help="any — хотя бы одно ключевое слово, all — все",
+        )
+        command.add_argument(
+            "--stem", action="store_true", default=False if defaults else None,
+            help="отсекать окончания ключевых слов: «разработчика» найдёт «разработчик»",
+        )
+        command.add_argument("--salary", help='диапазон зарплат, например "100000 - 150000"')
+        command.add_argument("--top", type=int, metavar="N", help="только N вакансий с наибольшей зарплатой")
+        command.add_argument(
+            "--format", choices=FORMATS, default="json" if defaults else None, help="формат вывода",
+        )
+
+    search = commands.add_parser("search", help="поиск на hh.ru")
+    search.add_argument("queries", nargs="*", help="поисковые запросы")
+    search.add_argument("--area", dest="areas", type=int, action="append", help="регион (можно несколько)")
+    search.add_argument("--config", help="файл JSON с параметрами поиска")
+    search.add_argument("--save", help="сохранить вакансии в архив (.json, .jsonl или .db)")
+    search.add_argument("--workers", type=int, help="количество одновременных запросов")
+    add_filters(search, defaults=False)
+    search.set_defaults(handler=run_search)
+
+    query = commands.add_parser("query", help="отбор вакансий из сохранённого архива")
+    query.add_argument("archive", help="файл архива (.json, .jsonl или .db)")
+    add_filters(query, defaults=True)
+    query.set_defaults(handler=run_query)
+
+    ingest = commands.add_parser("ingest", help="загрузка сохранённых ответов API в архив")
+    ingest.add_argument("files", nargs="+", help="файлы .json и .jsonl с ответами поиска hh.ru")
+    ingest.add_argument("--save", required=True, help="архив (.json, .jsonl или .db)")
+    ingest.add_argument("--workers", type=int, help="количество процессов; по умолчанию — число ядер")
+    ingest.set_defaults(handler=run_ingest)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Точка входа: без команды запускается интерактивный режим.
+
+    :param argv: Аргументы командной строки; по умолчанию sys.argv[1:].
+    :return: Код возврата.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        sinks = [metrics.make_sink(spec) for spec in args.metrics]
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        return metrics.run_instrumented(lambda: args.handler(args), sinks, args.profile)
+    except BrokenPipeError:
+        # Читатель вывода (например, head) завершился раньше команды.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
@@ -0,0 +1,320 @@
+import json
+import os
+import sqlite3
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.file_connector import AbstractFileConnector
+from src.search_index import normalize_text, search_key
+from src.vacancy import Vacancy
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    salary TEXT NOT NULL,
+    salary_value INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    salary_from INTEGER,
+    salary_to INTEGER,
+    currency TEXT,
+    key_skills TEXT,
+    search_text TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_value ON vacancies (salary_value);
+"""
+
+# Колонки, добавленные после первой версии схемы, и их определения.
+_ADDED_COLUMNS = {
+    "salary_from": "INTEGER",
+    "salary_to": "INTEGER",
+    "currency": "TEXT",
+    "key_skills": "TEXT",
+    "search_text": "TEXT",
+}
+
+# Полнотекстовый индекс строится по нормализованному ключу поиска
+# (см. search_index.search_key), а не по исходным названию и описанию.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+    search_text, content='vacancies', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO vacancies_fts (rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts (vacancies_fts, rowid, search_text)
+    VALUES ('delete', old.rowid, old.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE ON vacancies BEGIN
+    INSERT INTO vacancies_fts (vacancies_fts, rowid, search_text)
+    VALUES ('delete', old.rowid, old.search_text);
+    INSERT INTO vacancies_fts (rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+"""
+
+# Индекс прежней версии по колонкам title и description.
+_DROP_FTS = """
+DROP TRIGGER IF EXISTS vacancies_ai;
+DROP TRIGGER IF EXISTS vacancies_ad;
+DROP TRIGGER IF EXISTS vacancies_au;
+DROP TABLE IF EXISTS vacancies_fts;
+"""
+
+_UPSERT = """
+INSERT INTO vacancies (
+    url, title, salary, salary_value, description, salary_from, salary_to, currency,
+    key_skills, search_text
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    title = excluded.title,
+    salary = excluded.salary,
+    salary_value = excluded.salary_value,
+    description = CASE
+        WHEN excluded.key_skills IS NULL AND vacancies.key_skills IS NOT NULL
+        THEN vacancies.description ELSE excluded.description
+    END,
+    salary_from = excluded.salary_from,
+    salary_to = excluded.salary_to,
+    currency = excluded.currency,
+    key_skills = COALESCE(excluded.key_skills, vacancies.key_skills),
+    search_text = CASE
+        WHEN excluded.key_skills IS NULL AND vacancies.key_skills IS NOT NULL
+        THEN search_key(excluded.title, vacancies.description) ELSE excluded.search_text
+    END
+"""
+
+# Триграммный токенизатор FTS5 не находит подстроки короче трёх символов.
+_FTS_MIN_KEYWORD_LENGTH = 3
+
+_SELECT = (
+    "SELECT title, url, salary, description, salary_from, salary_to, currency,"
+    " key_skills, search_text FROM vacancies"
+)
+
+# Число ссылок в одном запросе: старые сборки SQLite допускают не больше
+# 999 параметров.
+_MAX_QUERY_PARAMS = 500
+
+
+def _dump_key_skills(key_skills: Optional[tuple]) -> Optional[str]:
+    """Ключевые навыки в виде JSON-списка; None — подробности не загружались."""
+    return json.dumps(list(key_skills), ensure_ascii=False) if key_skills is not None else None
+
+
+def _vacancy_from_row(row: tuple) -> Vacancy:
+    """Создаёт объект Vacancy из строки запроса _SELECT."""
+    title, url, salary, description, salary_from, salary_to, currency, skills, search_text = row
+    return Vacancy(
+        title, url, salary, description,
+        salary_from=salary_from, salary_to=salary_to, currency=currency,
+        key_skills=json.loads(skills) if skills is not None else None,
+        search_text=search_text,
+    )
+
+
+class SQLiteSaver(AbstractFileConnector):
+    """
+    Класс для хранения вакансий в базе данных SQLite.
+
+    Ссылка на вакансию — первичный ключ, по числовой зарплате построен
+    индекс, а по названию и описанию — полнотекстовый индекс FTS5,
+    поэтому критерии keyword и salary_min выполняются запросом к базе.
+    """
+
+    def __init__(self, filename: str = "data/vacancies.db", batch_size: int = 1000):
+        """
+        Инициализация коннектора.
+
+        :param filename: Имя файла базы данных.
+        :param batch_size: Количество вакансий в одной транзакции при вставке.
+        """
+        self.__filename = filename
+        self.__batch_size = batch_size
+        self.__connection = None
+        self.__has_fts = False
+        self.connect_to_db()
+
+    @property
+    def filename(self) -> str:
+        """Публичный геттер для имени файла."""
+        return self.__filename
+
+    def connect_to_db(self) -> None:
+        """Открывает соединение с базой и создаёт схему, если её нет."""
+        if self.__connection is not None:
+            return
+        if self.__filename != ":memory:":
+            os.makedirs(os.path.dirname(self.__filename) or ".", exist_ok=True)
+        self.__connection = sqlite3.connect(self.__filename)
+        self.__connection.create_function("search_key", 2, search_key, deterministic=True)
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        self.__connection.execute("PRAGMA synchronous = NORMAL")
+        with self.__connection:
+            self.__connection.executescript(_SCHEMA)
+            fts_columns = {row[1] for row in self.__connection.execute("PRAGMA table_info(vacancies_fts)")}
+            if fts_columns and "search_text" not in fts_columns:
+                self.__connection.executescript(_DROP_FTS)
+                fts_columns = set()
+            self._migrate_columns()
+            try:
+                self.__connection.executescript(_FTS_SCHEMA)
+                if not fts_columns:
+                    # Индекс создан заново: заполняем его уже сохранёнными строками.
+                    self.__connection.execute("INSERT INTO vacancies_fts (vacancies_fts) VALUES ('rebuild')")
+                self.__has_fts = True
+            except sqlite3.OperationalError:
+                # Сборка SQLite без FTS5 или триграммного токенизатора:
+                # поиск по ключевому слову выполняется без индекса.
+                self.__has_fts = False
+
+    def _migrate_columns(self) -> None:
+        """
+        Добавляет в таблицу колонки, которых нет в базе старой версии,
+        и пересчитывает для уже сохранённых строк числовые поля зарплаты
+        и ключ поиска: прежний разбор склеивал цифры, и "100000-150000"
+        превращалось в 100000150000.
+        """
+        existing = {row[1] for row in self.__connection.execute("PRAGMA table_info(vacancies)")}
+        missing = [column for column in _ADDED_COLUMNS if column not in existing]
+        if not missing:
+            return
+        for column in missing:
+            self.__connection.execute(
+                f"ALTER TABLE vacancies ADD COLUMN {column} {_ADDED_COLUMNS[column]}"
+            )
+        rows = self.__connection.execute("SELECT url, title, salary, description FROM vacancies").fetchall()
+        updates = []
+        for url, title, salary, description in rows:
+            salary_from, salary_to, currency = Vacancy._parse_salary(salary)
+            updates.append((
+                salary_from or salary_to or 0, salary_from, salary_to, currency,
+                search_key(title, description), url,
+            ))
+        self.__connection.executemany(
+            "UPDATE vacancies SET salary_value = ?, salary_from = ?, salary_to = ?, "
+            "currency = ?, search_text = ? WHERE url = ?",
+            updates,
+        )
+
+    def disconnect_from_db(self) -> None:
+        """Закрывает соединение с базой."""
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет или обновляет вакансию в базе.
+
+        :param vacancy: Объект Vacancy.
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет или обновляет вакансии пачками, по одной транзакции
+        на batch_size записей.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        rows = (
+            (
+                v.url, v.title, v.salary, v._get_salary_value(), v.description,
+                v.salary_from, v.salary_to, v.currency, _dump_key_skills(v.key_skills),
+                v.search_text,
+            )
+            for v in vacancies
+        )
+        while True:
+            batch = list(islice(rows, self.__batch_size))
+            if not batch:
+                break
+            with self.__connection:
+                self.__connection.executemany(_UPSERT, batch)
+
+    def iter_vacancies(self, criteria: Optional[dict] = None) -> Iterator[Vacancy]:
+        """
+        Отдаёт вакансии, подходящие под критерии, по мере чтения из базы.
+
+        :param criteria: Критерии фильтрации (необязательно).
+        :return: Генератор объектов Vacancy.
+        """
+        conditions = []
+        params = []
+        for key, value in (criteria or {}).items():
+            if key == "keyword":
+                keyword = normalize_text(value)
+                if self.__has_fts and len(keyword) >= _FTS_MIN_KEYWORD_LENGTH:
+                    conditions.append(
+                        "rowid IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)"
+                    )
+                    params.append('"' + keyword.replace('"', '""') + '"')
+                else:
+                    conditions.append("instr(search_text, ?) > 0")
+                    params.append(keyword)
+            elif key == "salary_min":
+                conditions.append("salary_value >= ?")
+                params.append(value)
+
+        query = _SELECT
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY rowid"
+        for row in self.__connection.execute(query, params):
+            yield _vacancy_from_row(row)
+
+    def get_vacancies(self, criteria: Optional[dict] = None) -> List[Vacancy]:
+        """
+        Получает вакансии из базы.
+
+        :param criteria: Критерии фильтрации (необязательно).
+        :return: Список вакансий (объектов Vacancy).
+        """
+        return list(self.iter_vacancies(criteria))
+
+    def get_enriched(self, urls: Iterable[str]) -> Dict[str, Vacancy]:
+        """
+        Получает сохранённые вакансии с подробностями запросом по ссылкам.
+
+        :param urls: Ссылки на вакансии.
+        :return: Словарь «ссылка -> вакансия» для вакансий с подробностями.
+        """
+        urls = iter(urls)
+        enriched = {}
+        while True:
+            batch = list(islice(urls, _MAX_QUERY_PARAMS))
+            if not batch:
+                break
+            query = (
+                f"{_SELECT} WHERE url IN ({', '.join('?' * len(batch))})"
+                " AND key_skills IS NOT NULL"
+            )
+            for row in self.__connection.execute(query, batch):
+                vacancy = _vacancy_from_row(row)
+                enriched[vacancy.url] = vacancy
+        return enriched
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию из базы.
+
+        :param vacancy: Объект Vacancy для удаления.
+        """
+        with self.__connection:
+            self.__connection.execute("DELETE FROM vacancies WHERE url = ?", (vacancy.url,))
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Удаляет пачку вакансий из базы пачками по batch_size записей.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        rows = ((v.url,) for v in vacancies)
+        while True:
+            batch = list(islice(rows, self.__batch_size))
+            if not batch:
+                break
+            with self.__connection:
+                self.__connection.executemany("DELETE FROM vacancies WHERE url = ?", batch)
@@ -0,0 +1,182 @@
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from src.api import APIRequestError, HeadHunterAPI
+from src.file_connector import AbstractFileConnector
+from src.vacancy import Vacancy
+
+_VACANCY_ID_RE = re.compile(r"/vacancy/(\d+)")
+
+# Теги, после которых в тексте описания начинается новая строка.
+_BLOCK_TAGS = {"p", "br", "li", "ul", "ol", "div", "h1", "h2", "h3", "h4", "tr"}
+
+
+class _TextExtractor(HTMLParser):
+    """Собирает текст HTML-документа без разметки."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def strip_html(html: str) -> str:
+    """
+    Удаляет HTML-разметку из описания вакансии.
+
+    :param html: Описание в формате HTML.
+    :return: Текст, в котором абзацы и пункты списков разделены переводом строки.
+    """
+    parser = _TextExtractor()
+    parser.feed(html or "")
+    parser.close()
+    lines = (" ".join(line.split()) for line in "".join(parser.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def vacancy_id_from_url(url: str) -> Optional[str]:
+    """Идентификатор вакансии hh.ru из ссылки вида https://hh.ru/vacancy/123."""
+    match = _VACANCY_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+class VacancyEnricher:
+    """
+    Загрузка полного описания и ключевых навыков вакансий.
+
+    Подробности запрашиваются методом /vacancies/{id} пулом из max_workers
+    потоков с окном ограниченного размера, поэтому тысячи вакансий
+    обрабатываются без накопления ответов в памяти. Запросы идут через
+    планировщик клиента: пул меньше его max_concurrency, так что часть
+    слотов всегда остаётся для поисковых запросов. Вакансии, для которых
+    подробности уже загружены — в самом объекте или в хранилище, — повторно
+    не запрашиваются.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        connector: Optional[AbstractFileConnector] = None,
+        max_workers: int = 2,
+        batch_size: int = 100,
+    ):
+        """
+        Инициализация загрузчика.
+
+        :param api: Клиент hh.ru.
+        :param connector: Хранилище: из него берутся уже загруженные подробности,
+            в него же пачками записываются новые (необязательно).
+        :param max_workers: Количество одновременных запросов подробностей.
+        :param batch_size: Количество вакансий в одной записи в хранилище.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers должно быть положительным.")
+        self.__api = api
+        self.__connector = connector
+        self.__max_workers = max_workers
+        self.__batch_size = batch_size
+        self.__lock = threading.Lock()
+        self.stats = {"fetched": 0, "reused": 0, "failed": 0}
+
+    def _iter_with_stored(self, vacancies: Iterable[Vacancy]) -> Iterator[tuple]:
+        """
+        Пары (вакансия, сохранённая вакансия с подробностями или None).
+        Хранилище опрашивается по пачкам из batch_size ссылок, поэтому
+        в памяти находятся подробности только текущей пачки.
+        """
+        vacancies = iter(vacancies)
+        while True:
+            chunk = list(islice(vacancies, self.__batch_size))
+            if not chunk:
+                return
+            stored = {}
+            if self.__connector is not None:
+                urls = [vacancy.url for vacancy in chunk if not vacancy.is_enriched]
+                if urls:
+                    stored = self.__connector.get_enriched(urls)
+            for vacancy in chunk:
+                yield vacancy, stored.get(vacancy.url)
+
+    def _fetch(self, vacancy: Vacancy) -> Vacancy:
+        """Загружает подробности одной вакансии; при ошибке возвращает её без изменений."""
+        vacancy_id = vacancy_id_from_url(vacancy.url)
+        if vacancy_id is None:
+            return vacancy
+        try:
+            details = self.__api.get_vacancy_details(vacancy_id)
+        except APIRequestError:
+            with self.__lock:
+                self.stats["failed"] += 1
+            return vacancy
+        with self.__lock:
+            self.stats["fetched"] += 1
+        key_skills = [skill["name"] for skill in details.get("key_skills") or [] if skill.get("name")]
+        description = strip_html(details.get("description", "")) or vacancy.description
+        return vacancy.with_details(description, key_skills)
+
+    def iter_enriched(self, vacancies: Iterable[Vacancy]) -> Iterator[Vacancy]:
+        """
+        Лениво отдаёт вакансии с подробностями в исходном порядке.
+        Вакансии, подробности которых не удалось загрузить, отдаются
+        без изменений и будут запрошены при следующем запуске.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        :return: Генератор объектов Vacancy.
+        """
+        vacancies = self._iter_with_stored(vacancies)
+        window = self.__max_workers * 2
+        fresh = []
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+
+            def submit(vacancy: Vacancy, stored: Optional[Vacancy]):
+                if vacancy.is_enriched:
+                    return vacancy
+                if stored is not None:
+                    self.stats["reused"] += 1
+                    return vacancy.with_details(stored.description, stored.key_skills)
+                return executor.submit(self._fetch, vacancy)
+
+            pending = deque(submit(*pair) for pair in islice(vacancies, window))
+            while pending:
+                entry = pending.popleft()
+                if not isinstance(entry, Vacancy):
+                    entry = entry.result()
+                    if entry.is_enriched:
+                        fresh.append(entry)
+                next_pair = next(vacancies, None)
+                if next_pair is not None:
+                    pending.append(submit(*next_pair))
+                if len(fresh) >= self.__batch_size:
+                    self._save(fresh)
+                    fresh = []
+                yield entry
+        self._save(fresh)
+
+    def enrich(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """
+        Загружает подробности для всех вакансий.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        :return: Список объектов Vacancy в исходном порядке.
+        """
+        return list(self.iter_enriched(vacancies))
+
+    def _save(self, vacancies: List[Vacancy]) -> None:
+        """Записывает вакансии с новыми подробностями в хранилище."""
+        if self.__connector is not None and vacancies:
+            self.__connector.add_vacancies(vacancies)
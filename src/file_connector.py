@@ -1,10 +1,139 @@
 import json
+import os
+import tempfile
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import IO, Dict, Iterable, Iterator, List, Optional
 
+from src import metrics
+from src.search_index import InvertedIndex, normalize_text, search_key
 from src.vacancy import Vacancy
 
 
+def _matches_criteria(vacancy: Vacancy, criteria: dict) -> bool:
+    """
+    Проверяет вакансию на соответствие критериям.
+
+    :param vacancy: Объект Vacancy.
+    :param criteria: Словарь критериев (keyword, salary_min).
+    :return: True, если вакансия подходит под все критерии.
+    """
+    for key, value in criteria.items():
+        if key == "keyword":
+            if normalize_text(value) not in vacancy.search_text:
+                return False
+        elif key == "salary_min":
+            if vacancy._get_salary_value() < value:
+                return False
+    return True
+
+
+def _record_matches(record: dict, criteria: dict) -> bool:
+    """
+    Проверяет сохранённую запись на соответствие критериям до создания
+    объекта Vacancy. Результат совпадает с _matches_criteria для вакансии,
+    восстановленной из этой записи.
+
+    :param record: Словарь, сохранённый методом Vacancy.to_dict.
+    :param criteria: Словарь критериев (keyword, salary_min).
+    :return: True, если запись подходит под все критерии.
+    """
+    for key, value in criteria.items():
+        if key == "keyword":
+            text = record.get("search_text") or search_key(record["title"], record["description"] or "")
+            if normalize_text(value) not in text:
+                return False
+        elif key == "salary_min":
+            salary_from, salary_to = record.get("salary_from"), record.get("salary_to")
+            if salary_from is None and salary_to is None:
+                salary_from, salary_to, _ = Vacancy._parse_salary(record["salary"] or "")
+            if (salary_from or salary_to or 0) < value:
+                return False
+    return True
+
+
+def _iter_json_array(f: IO[str], chunk_size: int = 1 << 16) -> Iterator:
+    """
+    Потоково разбирает JSON-массив: элементы декодируются по одному из буфера,
+    который дочитывается из файла кусками по chunk_size символов, поэтому
+    в памяти находится только текущий кусок и один элемент.
+
+    :param f: Текстовый файл, содержащий JSON-массив.
+    :param chunk_size: Размер куска чтения.
+    :return: Генератор элементов массива.
+    :raises ValueError: Если файл не содержит корректный JSON-массив.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    expect = "["
+
+    def fill() -> bool:
+        """Дочитывает кусок в буфер, отбрасывая разобранную часть."""
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return not eof
+
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            if not fill():
+                raise ValueError("Неожиданный конец JSON-массива.")
+            continue
+        char = buffer[pos]
+        if expect == "[":
+            if char != "[":
+                raise ValueError("Файл не содержит JSON-массив.")
+            pos += 1
+            expect = "value or ]"
+        elif char == "]" and expect in ("value or ]", ", or ]"):
+            return
+        elif expect == ", or ]":
+            if char != ",":
+                raise ValueError(f"Ожидалась запятая в позиции {pos}.")
+            pos += 1
+            expect = "value"
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Элемент не поместился в буфер целиком — дочитываем файл.
+                if not fill():
+                    raise
+                continue
+            if not eof and not isinstance(item, (dict, list, str)):
+                # Число на границе куска может быть прочитано не полностью:
+                # принимаем его, только когда за ним виден разделитель.
+                rest = buffer[end:].lstrip()
+                if not rest or rest[0] not in ",]":
+                    fill()
+                    continue
+            pos = end
+            expect = ", or ]"
+            yield item
+
+
+def _keep_details(record: dict, previous: Optional[dict]) -> dict:
+    """
+    Сохраняет в новой записи загруженные ранее полное описание и навыки,
+    если сама она получена из поиска и подробностей не содержит; ключ
+    поиска при этом вычисляется заново.
+
+    :param record: Новая запись вакансии.
+    :param previous: Сохранённая запись с той же ссылкой или None.
+    :return: Запись для сохранения.
+    """
+    if record.get("key_skills") is None and previous and previous.get("key_skills") is not None:
+        record["description"] = previous["description"]
+        record["key_skills"] = previous["key_skills"]
+        record["search_text"] = search_key(record["title"], record["description"] or "")
+    return record
+
+
 class AbstractFileConnector(ABC):
     """Абстрактный класс для работы с файлами."""
 
@@ -17,6 +146,16 @@ class AbstractFileConnector(ABC):
         """
         pass
 
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавить пачку вакансий в файл.
+        Реализация по умолчанию добавляет вакансии по одной.
+
+        :param vacancies: Итерируемый набор объектов вакансий.
+        """
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+
     @abstractmethod
     def get_vacancies(self, criteria: Optional[dict] = None) -> List[Vacancy]:
         """
@@ -27,6 +166,22 @@ class AbstractFileConnector(ABC):
         """
         pass
 
+    def get_enriched(self, urls: Iterable[str]) -> Dict[str, Vacancy]:
+        """
+        Получить сохранённые вакансии с загруженными подробностями.
+        Реализация по умолчанию перебирает все вакансии хранилища.
+
+        :param urls: Ссылки на вакансии.
+        :return: Словарь «ссылка -> вакансия» для вакансий из urls,
+            подробности которых уже сохранены.
+        """
+        urls = set(urls)
+        return {
+            vacancy.url: vacancy
+            for vacancy in self.get_vacancies()
+            if vacancy.url in urls and vacancy.is_enriched
+        }
+
     @abstractmethod
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """
@@ -36,17 +191,34 @@ class AbstractFileConnector(ABC):
         """
         pass
 
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Удалить пачку вакансий из файла.
+        Реализация по умолчанию удаляет вакансии по одной.
+
+        :param vacancies: Итерируемый набор объектов вакансий.
+        """
+        for vacancy in vacancies:
+            self.delete_vacancy(vacancy)
+
 
 class JSONSaver(AbstractFileConnector):
     """Класс для сохранения информации о вакансиях в JSON-файл."""
 
-    def __init__(self, filename: str = "data/vacancies.json"):
+    def __init__(self, filename: str = "data/vacancies.json", use_index: bool = False):
         """
         Инициализация коннектора.
 
         :param filename: Имя файла для хранения вакансий.
+        :param use_index: Держать вакансии и инвертированный индекс в памяти,
+            чтобы повторные запросы не перечитывали файл и не просматривали
+            тексты всех вакансий.
         """
         self.__filename = filename
+        self.__use_index = use_index
+        # [отметка файла, {ссылка: Vacancy}, индекс]; сбрасывается, если файл
+        # изменили в обход этого объекта.
+        self.__cache = None
         self._ensure_directory()
         self._ensure_file_exists()
 
@@ -56,16 +228,12 @@ class JSONSaver(AbstractFileConnector):
         return self.__filename
 
     def _ensure_directory(self) -> None:
-        """Создаёт папку data, если её нет."""
-        import os
-        os.makedirs("data", exist_ok=True)
+        """Создаёт папку для файла, если её нет."""
+        os.makedirs(os.path.dirname(self.__filename) or ".", exist_ok=True)
 
     def _ensure_file_exists(self) -> None:
         """Создаёт файл, если он не существует."""
-        try:
-            with open(self.__filename, 'r', encoding='utf-8') as f:
-                json.load(f)
-        except FileNotFoundError:
+        if not os.path.exists(self.__filename):
             with open(self.__filename, 'w', encoding='utf-8') as f:
                 json.dump([], f, ensure_ascii=False, indent=4)
 
@@ -75,9 +243,64 @@ class JSONSaver(AbstractFileConnector):
 
         :param vacancy: Объект Vacancy.
         """
-        vacancies = self.get_vacancies()
-        vacancies.append(vacancy)
-        self._save_to_file(vacancies)
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет пачку вакансий в JSON-файл за одно чтение и одну запись.
+        Вакансии с уже сохранённой ссылкой заменяют старые записи.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        cache = self._fresh_cache()
+        records = {item["url"]: item for item in self._load_records()}
+        saved = []
+        for vacancy in vacancies:
+            record = _keep_details(vacancy.to_dict(), records.get(vacancy.url))
+            if record["key_skills"] is not None and not vacancy.is_enriched:
+                vacancy = vacancy.with_details(record["description"], record["key_skills"])
+            records[vacancy.url] = record
+            saved.append(vacancy)
+        self._save_records(list(records.values()))
+        if cache is not None:
+            _, by_url, index = cache
+            for vacancy in saved:
+                by_url[vacancy.url] = vacancy
+                index.add(vacancy.url, vacancy.search_text)
+            cache[0] = self._file_stamp()
+
+    def _load_records(self) -> List[dict]:
+        """Читает сохранённые записи без создания объектов Vacancy."""
+        try:
+            with open(self.__filename, 'r', encoding='utf-8') as f:
+                with metrics.timer("json_saver.load_records") as timing:
+                    records = json.load(f)
+                    timing.records = len(records)
+                    timing.nbytes = f.tell()
+            return records
+        except FileNotFoundError:
+            return []
+
+    def _iter_records(self) -> Iterator[dict]:
+        """Потоково читает сохранённые записи, не загружая файл целиком."""
+        try:
+            with open(self.__filename, 'r', encoding='utf-8') as f:
+                yield from _iter_json_array(f)
+        except FileNotFoundError:
+            return
+
+    def iter_vacancies(self, criteria: Optional[dict] = None) -> Iterator[Vacancy]:
+        """
+        Лениво читает вакансии из файла. Критерии проверяются по записям
+        до создания объектов Vacancy, поэтому память занимают только
+        текущий кусок файла и подходящие вакансии.
+
+        :param criteria: Критерии фильтрации (необязательно).
+        :return: Генератор объектов Vacancy.
+        """
+        for record in self._iter_records():
+            if not criteria or _record_matches(record, criteria):
+                yield Vacancy.from_dict(record)
 
     def get_vacancies(self, criteria: Optional[dict] = None) -> List[Vacancy]:
         """
@@ -86,64 +309,118 @@ class JSONSaver(AbstractFileConnector):
         :param criteria: Критерии фильтрации (необязательно).
         :return: Список вакансий (объектов Vacancy).
         """
-        try:
-            with open(self.__filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except FileNotFoundError:
-            data = []
-
-        vacancies = []
-        for item in data:
-            vacancy = Vacancy(
-                title=item["title"],
-                url=item["url"],
-                salary=item["salary"],
-                description=item["description"]
-            )
-            vacancies.append(vacancy)
+        with metrics.timer("json_saver.read") as timing:
+            vacancies = self._select_vacancies(criteria)
+            timing.records = len(vacancies)
+            if metrics.enabled():
+                timing.nbytes = os.path.getsize(self.__filename)
+        return vacancies
+
+    def get_enriched(self, urls: Iterable[str]) -> Dict[str, Vacancy]:
+        """
+        Получает сохранённые вакансии с подробностями, потоково читая файл.
+
+        :param urls: Ссылки на вакансии.
+        :return: Словарь «ссылка -> вакансия» для вакансий с подробностями.
+        """
+        urls = set(urls)
+        return {
+            record["url"]: Vacancy.from_dict(record)
+            for record in self._iter_records()
+            if record["url"] in urls and record.get("key_skills") is not None
+        }
+
+    def _select_vacancies(self, criteria: Optional[dict]) -> List[Vacancy]:
+        """Вакансии по критериям: потоковым чтением файла или из индекса в памяти."""
+        if not self.__use_index:
+            return list(self.iter_vacancies(criteria))
+
+        _, by_url, index = self._load_cache()
+        criteria = dict(criteria or {})
+        keyword = criteria.pop("keyword", None)
+        if keyword is not None:
+            vacancies = [by_url[url] for url in index.search([keyword], substring=True)]
+        else:
+            vacancies = list(by_url.values())
 
         if criteria:
-            filtered = []
-            for vac in vacancies:
-                match = True
-                for key, value in criteria.items():
-                    if key == "keyword":
-                        if value.lower() not in vac.title.lower() and value.lower() not in vac.description.lower():
-                            match = False
-                            break
-                    elif key == "salary_min":
-                        if vac._get_salary_value() < value:
-                            match = False
-                            break
-                if match:
-                    filtered.append(vac)
-            return filtered
+            return [vac for vac in vacancies if _matches_criteria(vac, criteria)]
 
         return vacancies
 
+    def _file_stamp(self) -> tuple:
+        """Время изменения и размер файла для проверки актуальности кэша."""
+        stat = os.stat(self.__filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _fresh_cache(self) -> Optional[list]:
+        """Кэш, если он построен и файл с тех пор не менялся, иначе None."""
+        if self.__cache is not None and self.__cache[0] == self._file_stamp():
+            return self.__cache
+        self.__cache = None
+        return None
+
+    def _load_cache(self) -> list:
+        """Актуальный кэш вакансий и индекса; при необходимости строит его."""
+        cache = self._fresh_cache()
+        if cache is None:
+            stamp = self._file_stamp()
+            by_url = {}
+            for item in self._iter_records():
+                by_url[item["url"]] = Vacancy.from_dict(item)
+            # Тексты для проверки подстрок берутся из того же словаря,
+            # который дополняется при добавлении вакансий.
+            index = InvertedIndex(lambda url: (by_url[url].search_text,))
+            for url, vacancy in by_url.items():
+                index.add(url, vacancy.search_text)
+            cache = self.__cache = [stamp, by_url, index]
+        return cache
+
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """
         Удаляет вакансию из файла.
 
         :param vacancy: Объект Vacancy для удаления.
         """
-        vacancies = self.get_vacancies()
-        vacancies = [v for v in vacancies if v.url != vacancy.url]
-        self._save_to_file(vacancies)
-
-    def _save_to_file(self, vacancies: List[Vacancy]) -> None:
-        """Сохраняет список вакансий в файл."""
-        with open(self.__filename, 'w', encoding='utf-8') as f:
-            data = [
-                {
-                    "title": v.title,
-                    "url": v.url,
-                    "salary": v.salary,
-                    "description": v.description
-                }
-                for v in vacancies
-            ]
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Удаляет пачку вакансий за одно чтение и одну запись файла.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        urls = {vacancy.url for vacancy in vacancies}
+        if not urls:
+            return
+        cache = self._fresh_cache()
+        records = [item for item in self._load_records() if item["url"] not in urls]
+        self._save_records(records)
+        if cache is not None:
+            _, by_url, index = cache
+            for url in urls:
+                by_url.pop(url, None)
+                index.remove(url)
+            cache[0] = self._file_stamp()
+
+    def _save_records(self, records: List[dict]) -> None:
+        """
+        Атомарно перезаписывает файл: данные пишутся во временный файл
+        в той же папке, который затем заменяет исходный.
+        """
+        directory = os.path.dirname(os.path.abspath(self.__filename))
+        with metrics.timer("json_saver.write") as timing:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(records, f, ensure_ascii=False, indent=4)
+                timing.records = len(records)
+                if metrics.enabled():
+                    timing.nbytes = os.path.getsize(tmp_path)
+                os.replace(tmp_path, self.__filename)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
 
     def connect_to_db(self) -> None:
         """Заглушка для подключения к базе данных."""
@@ -152,3 +429,255 @@ class JSONSaver(AbstractFileConnector):
     def disconnect_from_db(self) -> None:
         """Заглушка для отключения от базы данных."""
         pass
+
+
+class JSONLinesSaver(AbstractFileConnector):
+    """
+    Класс для хранения вакансий в файле формата JSON Lines.
+
+    Каждая вакансия — отдельная строка, поэтому добавление дописывает
+    строки в конец файла, а удаление записывает строку-надгробие
+    {"url": ..., "deleted": true}. В памяти хранится только индекс
+    «ссылка -> смещение актуальной строки». Когда доля устаревших строк
+    превышает порог, файл сжимается методом compact.
+    """
+
+    def __init__(
+        self,
+        filename: str = "data/vacancies.jsonl",
+        compact_threshold: float = 0.5,
+        compact_min_lines: int = 1000,
+    ):
+        """
+        Инициализация коннектора.
+
+        :param filename: Имя файла для хранения вакансий.
+        :param compact_threshold: Доля устаревших строк, после которой
+            файл автоматически сжимается.
+        :param compact_min_lines: Минимальное число строк в файле для
+            автоматического сжатия.
+        """
+        self.__filename = filename
+        self.__compact_threshold = compact_threshold
+        self.__compact_min_lines = compact_min_lines
+        self.__offsets = {}
+        self.__enriched = set()
+        self.__lines = 0
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        open(filename, 'ab').close()
+        self._build_index()
+
+    @property
+    def filename(self) -> str:
+        """Публичный геттер для имени файла."""
+        return self.__filename
+
+    @property
+    def stale_ratio(self) -> float:
+        """Доля устаревших строк (надгробия и заменённые записи)."""
+        if not self.__lines:
+            return 0.0
+        return (self.__lines - len(self.__offsets)) / self.__lines
+
+    def _build_index(self) -> None:
+        """Строит индекс актуальных строк одним проходом по файлу."""
+        self.__offsets = {}
+        self.__enriched = set()
+        self.__lines = 0
+        last_offset = 0
+        for offset, record in self._iter_lines():
+            self.__lines += 1
+            self._track(record, offset)
+            last_offset = offset
+        self._truncate_torn_tail(last_offset)
+
+    def _truncate_torn_tail(self, last_offset: int) -> None:
+        """
+        Обрезает недописанную последнюю строку, оставшуюся после прерванной записи,
+        чтобы следующая запись не склеилась с ней.
+
+        :param last_offset: Смещение последней разобранной строки.
+        """
+        with open(self.__filename, 'r+b') as f:
+            f.seek(last_offset)
+            if self.__lines:
+                f.readline()
+            valid_end = f.tell()
+            if f.read().strip():
+                f.truncate(valid_end)
+
+    def _iter_lines(self, offsets: Optional[set] = None) -> Iterator[tuple]:
+        """
+        Построчно читает файл.
+
+        :param offsets: Если задано, разбираются только строки с этими смещениями.
+        :return: Генератор пар (смещение строки, запись).
+        """
+        with open(self.__filename, 'rb') as f:
+            offset = 0
+            for line in f:
+                line_offset = offset
+                offset += len(line)
+                if offsets is not None and line_offset not in offsets:
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Строка без перевода строки в конце — след прерванной
+                    # дозаписи, её пропускаем; повреждение в середине — ошибка.
+                    if line.endswith(b"\n"):
+                        raise
+                    continue
+                yield line_offset, record
+
+    def _append(self, records: Iterable[dict]) -> None:
+        """Дописывает записи в конец файла и обновляет индекс."""
+        with open(self.__filename, 'a+b') as f:
+            offset = f.seek(0, os.SEEK_END)
+            if offset:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+                    offset += 1
+            for record in records:
+                line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n"
+                f.write(line)
+                self.__lines += 1
+                self._track(record, offset)
+                offset += len(line)
+
+    def _track(self, record: dict, offset: int) -> None:
+        """Учитывает в индексе запись, расположенную по смещению offset."""
+        url = record["url"]
+        if record.get("deleted"):
+            self.__offsets.pop(url, None)
+            self.__enriched.discard(url)
+            return
+        self.__offsets[url] = offset
+        if record.get("key_skills") is not None:
+            self.__enriched.add(url)
+        else:
+            self.__enriched.discard(url)
+
+    def _read_record(self, url: str) -> Optional[dict]:
+        """Читает актуальную запись по ссылке одним позиционированием в файле."""
+        offset = self.__offsets.get(url)
+        if offset is None:
+            return None
+        with open(self.__filename, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Дописывает вакансию в файл.
+
+        :param vacancy: Объект Vacancy.
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Дописывает пачку вакансий в файл. Запись с уже сохранённой
+        ссылкой заменяет старую, которая становится устаревшей.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        # Старые записи читаются до дозаписи, пока файл не открыт на запись.
+        records = [
+            _keep_details(vacancy.to_dict(), self._read_record(vacancy.url))
+            if vacancy.url in self.__enriched and not vacancy.is_enriched
+            else vacancy.to_dict()
+            for vacancy in vacancies
+        ]
+        self._append(records)
+        self._maybe_compact()
+
+    def iter_vacancies(self, criteria: Optional[dict] = None) -> Iterator[Vacancy]:
+        """
+        Построчно читает актуальные вакансии, не загружая файл целиком.
+
+        :param criteria: Критерии фильтрации (необязательно).
+        :return: Генератор объектов Vacancy.
+        """
+        live_offsets = set(self.__offsets.values())
+        for _, record in self._iter_lines(live_offsets):
+            vacancy = Vacancy.from_dict(record)
+            if not criteria or _matches_criteria(vacancy, criteria):
+                yield vacancy
+
+    def get_vacancies(self, criteria: Optional[dict] = None) -> List[Vacancy]:
+        """
+        Получает вакансии из файла.
+
+        :param criteria: Критерии фильтрации (необязательно).
+        :return: Список вакансий (объектов Vacancy).
+        """
+        return list(self.iter_vacancies(criteria))
+
+    def get_enriched(self, urls: Iterable[str]) -> Dict[str, Vacancy]:
+        """
+        Читает по индексу только те из запрошенных вакансий, для которых
+        сохранены подробности.
+
+        :param urls: Ссылки на вакансии.
+        :return: Словарь «ссылка -> вакансия» для вакансий с подробностями.
+        """
+        enriched = {}
+        for url in urls:
+            if url in self.__enriched and url not in enriched:
+                enriched[url] = Vacancy.from_dict(self._read_record(url))
+        return enriched
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Помечает вакансию удалённой, дописывая строку-надгробие.
+
+        :param vacancy: Объект Vacancy для удаления.
+        """
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Помечает пачку вакансий удалёнными одной дозаписью надгробий.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        urls = dict.fromkeys(v.url for v in vacancies if v.url in self.__offsets)
+        if not urls:
+            return
+        self._append({"url": url, "deleted": True} for url in urls)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Сжимает файл, если устаревших строк стало слишком много."""
+        if (self.__lines >= self.__compact_min_lines
+                and self.stale_ratio > self.__compact_threshold):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Переписывает файл, оставляя только актуальные записи.
+        Строки копируются без разбора JSON, замена файла атомарна.
+        """
+        urls_by_offset = {offset: url for url, offset in self.__offsets.items()}
+        new_offsets = {}
+        directory = os.path.dirname(os.path.abspath(self.__filename))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as dst, open(self.__filename, 'rb') as src:
+                offset = 0
+                for line in src:
+                    url = urls_by_offset.get(offset)
+                    if url is not None:
+                        new_offsets[url] = dst.tell()
+                        dst.write(line)
+                    offset += len(line)
+            os.replace(tmp_path, self.__filename)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.__offsets = new_offsets
+        self.__lines = len(new_offsets)
@@ -0,0 +1,156 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import product
+from typing import Callable, Iterable, Optional
+
+from src.api import APIRequestError, HeadHunterAPI
+from src.file_connector import AbstractFileConnector
+from src.vacancy import Vacancy
+
+# Отметка о завершении задания в очереди страниц.
+_DONE = object()
+
+
+class Harvester:
+    """
+    Пакетный сбор вакансий по сочетаниям запросов, регионов и фильтров.
+
+    Каждое сочетание — отдельное задание; задания выполняются пулом потоков,
+    а общее число одновременных HTTP-запросов ограничивает планировщик
+    клиента, общий для всех заданий. Страницы передаются через ограниченную
+    очередь в вызывающий поток, который отбрасывает уже встречавшиеся
+    вакансии и записывает остальные в хранилище, поэтому записи
+    в хранилище не бывают параллельными.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        connector: Optional[AbstractFileConnector],
+        max_workers: int = 4,
+        queue_size: int = 16,
+    ):
+        """
+        Инициализация сборщика.
+
+        :param api: Клиент hh.ru.
+        :param connector: Хранилище, в которое записываются вакансии;
+            None — вакансии только передаются в on_batch.
+        :param max_workers: Количество одновременно выполняемых заданий.
+        :param queue_size: Сколько полученных страниц может ждать записи.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers должно быть положительным.")
+        self.__api = api
+        self.__connector = connector
+        self.__max_workers = max_workers
+        self.__queue_size = queue_size
+
+    @staticmethod
+    def make_jobs(
+        queries: Iterable[str],
+        areas: Iterable[Optional[int]] = (None,),
+        filters: Iterable[dict] = ({},),
+    ) -> list:
+        """
+        Составляет задания из всех сочетаний запросов, регионов и фильтров.
+
+        :param queries: Поисковые запросы.
+        :param areas: Регионы; None — регион клиента по умолчанию.
+        :param filters: Наборы дополнительных фильтров поиска hh.ru.
+        :return: Список пар (запрос, параметры).
+        """
+        jobs = []
+        for keyword, area, extra in product(queries, list(areas), list(filters)):
+            params = dict(extra)
+            if area is not None:
+                params["area"] = area
+            jobs.append((keyword, params))
+        return jobs
+
+    def harvest(
+        self,
+        queries: Iterable[str],
+        areas: Iterable[Optional[int]] = (None,),
+        filters: Iterable[dict] = ({},),
+        on_batch: Optional[Callable[[list], None]] = None,
+    ) -> dict:
+        """
+        Собирает вакансии по всем сочетаниям и записывает их по мере получения.
+        Ошибка одного задания не останавливает остальные, а некорректные
+        вакансии пропускаются и учитываются в статистике.
+
+        :param queries: Поисковые запросы.
+        :param areas: Регионы; None — регион клиента по умолчанию.
+        :param filters: Наборы дополнительных фильтров поиска hh.ru.
+        :param on_batch: Функция, которой в вызывающем потоке передаётся каждая
+            пачка новых вакансий после записи в хранилище (необязательно).
+        :return: Словарь со статистикой: jobs, fetched, saved, duplicates,
+            rejected (число некорректных вакансий) и errors (список пар
+            «задание — текст ошибки»).
+        """
+        jobs = self.make_jobs(queries, areas, filters)
+        pages = queue.Queue(maxsize=self.__queue_size)
+        stop = threading.Event()
+        stats = {
+            "jobs": len(jobs), "fetched": 0, "saved": 0, "duplicates": 0, "rejected": 0, "errors": [],
+        }
+        seen_urls = set()
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            futures = [executor.submit(self._run_job, job, pages, stop) for job in jobs]
+            try:
+                remaining = len(jobs)
+                while remaining:
+                    job, payload = pages.get()
+                    if payload is _DONE:
+                        remaining -= 1
+                    elif isinstance(payload, APIRequestError):
+                        stats["errors"].append((job, str(payload)))
+                    else:
+                        stats["fetched"] += len(payload)
+                        batch, rejects = [], []
+                        for vacancy in Vacancy.iter_from_json(payload, rejects):
+                            if vacancy.url in seen_urls:
+                                stats["duplicates"] += 1
+                                continue
+                            seen_urls.add(vacancy.url)
+                            batch.append(vacancy)
+                        stats["rejected"] += len(rejects)
+                        if batch and self.__connector is not None:
+                            self.__connector.add_vacancies(batch)
+                            stats["saved"] += len(batch)
+                        if batch and on_batch is not None:
+                            on_batch(batch)
+            finally:
+                stop.set()
+        for future in futures:
+            # Непредвиденные ошибки заданий не должны теряться в потоках пула.
+            future.result()
+        return stats
+
+    def _run_job(self, job: tuple, pages: queue.Queue, stop: threading.Event) -> None:
+        """Получает страницы одного задания и передаёт их в очередь."""
+        keyword, params = job
+        try:
+            with closing(self.__api.iter_pages(keyword, params)) as job_pages:
+                for items in job_pages:
+                    if not self._put(pages, (job, items), stop):
+                        return
+        except APIRequestError as e:
+            self._put(pages, (job, e), stop)
+        finally:
+            self._put(pages, (job, _DONE), stop)
+
+    @staticmethod
+    def _put(pages: queue.Queue, entry: tuple, stop: threading.Event) -> bool:
+        """Кладёт запись в очередь, пока сбор не остановлен."""
+        while not stop.is_set():
+            try:
+                pages.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
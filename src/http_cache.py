@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class ResponseCache:
+    """
+    Дисковый кэш JSON-ответов API с TTL и вытеснением по LRU.
+
+    Каждый ответ хранится в отдельном файле, имя которого — хэш адреса
+    и нормализованных параметров запроса. Время последнего обращения
+    записывается в mtime файла, поэтому порядок LRU переживает перезапуск.
+    Устаревшие записи с ETag или Last-Modified перепроверяются условным
+    запросом: ответ 304 продлевает запись без повторной загрузки.
+    """
+
+    def __init__(
+        self,
+        directory: str = "data/http_cache",
+        ttl: float = 3600,
+        max_bytes: int = 50 * 2 ** 20,
+    ):
+        """
+        Инициализация кэша.
+
+        :param directory: Папка для файлов кэша.
+        :param ttl: Время жизни записи в секундах.
+        :param max_bytes: Максимальный суммарный размер файлов кэша.
+        """
+        self.__directory = directory
+        self.__ttl = ttl
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_entries()
+
+    @property
+    def stats(self) -> dict:
+        """Счётчики попаданий, промахов и перепроверок."""
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": len(self.__entries),
+                "bytes": self.__total_bytes,
+            }
+
+    def _load_entries(self) -> None:
+        """Восстанавливает порядок LRU по времени изменения файлов."""
+        files = []
+        for name in os.listdir(self.__directory):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(self.__directory, name))
+                files.append((stat.st_mtime, name[:-5], stat.st_size))
+        for _, key, size in sorted(files):
+            self.__entries[key] = size
+            self.__total_bytes += size
+
+    @staticmethod
+    def make_key(url: str, params: dict) -> str:
+        """
+        Ключ записи по адресу и нормализованным параметрам запроса.
+        Текст запроса приводится к нижнему регистру без лишних пробелов,
+        остальные значения — к строкам, порядок параметров не важен.
+        """
+        normalized = {}
+        for name, value in params.items():
+            value = str(value)
+            if name == "text":
+                value = " ".join(value.lower().split())
+            normalized[name] = value
+        raw = json.dumps([url, sorted(normalized.items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.__directory, key + ".json")
+
+    def _read(self, key: str) -> Optional[dict]:
+        """Читает запись и отмечает обращение к ней."""
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+            self.__entries.move_to_end(key)
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(self._path(key))
+        except (OSError, ValueError):
+            self._discard(key)
+            return None
+        return entry
+
+    def _write(self, key: str, entry: dict) -> None:
+        """Атомарно записывает запись и вытесняет самые старые при переполнении."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        with self.__lock:
+            self.__total_bytes += size - self.__entries.pop(key, 0)
+            self.__entries[key] = size
+            evicted = []
+            while self.__total_bytes > self.__max_bytes and len(self.__entries) > 1:
+                old_key, old_size = self.__entries.popitem(last=False)
+                self.__total_bytes -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except FileNotFoundError:
+                pass
+
+    def _discard(self, key: str) -> None:
+        """Удаляет повреждённую или пропавшую запись из учёта."""
+        with self.__lock:
+            self.__total_bytes -= self.__entries.pop(key, 0)
+
+    def fetch(self, url: str, params: dict, send: Callable[[dict], object]) -> dict:
+        """
+        Возвращает ответ из кэша или выполняет запрос.
+
+        :param url: Адрес запроса.
+        :param params: Параметры запроса.
+        :param send: Функция, выполняющая запрос с переданными заголовками
+            и возвращающая объект ответа requests.
+        :return: Тело ответа в формате JSON.
+        """
+        key = self.make_key(url, params)
+        entry = self._read(key)
+        now = time.time()
+        if entry is not None and now - entry["stored_at"] < self.__ttl:
+            with self.__lock:
+                self.hits += 1
+            return entry["body"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        response = send(headers)
+        if response.status_code == 304 and entry is not None:
+            entry["stored_at"] = now
+            self._write(key, entry)
+            with self.__lock:
+                self.revalidations += 1
+            return entry["body"]
+
+        response.raise_for_status()
+        body = response.json()
+        self._write(key, {
+            "stored_at": now,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+        })
+        with self.__lock:
+            self.misses += 1
+        return body
@@ -0,0 +1,275 @@
+"""
+Параллельная загрузка вакансий из сохранённых сырых ответов API.
+
+Источники — файлы с ответами поиска hh.ru: JSON со страницей (объект
+с полем items), списком страниц или списком вакансий, либо JSON Lines,
+где каждая строка — страница или вакансия. Файлы делятся на части:
+JSON — по файлу на часть, JSON Lines — по диапазонам байт, выровненным
+по границам строк. Части разбираются и проверяются в пуле процессов,
+а обратно передаются компактные кортежи полей, которые в основном
+процессе превращаются в объекты Vacancy без повторной проверки.
+"""
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from src.file_connector import AbstractFileConnector
+from src.vacancy import Vacancy
+
+# Размер части файла JSON Lines по умолчанию.
+_SHARD_SIZE = 16 * 2 ** 20
+
+
+def _page_items(data) -> list:
+    """Вакансии из разобранного JSON: страница, список страниц или список вакансий."""
+    if isinstance(data, dict):
+        if "items" in data:
+            return data["items"] or []
+        return [data]
+    if isinstance(data, list):
+        items = []
+        for element in data:
+            if isinstance(element, dict) and isinstance(element.get("items"), list):
+                items.extend(element["items"])
+            else:
+                items.append(element)
+        return items
+    return [data]
+
+
+def _parse_items(items: list, source: str, position: int, rejects: list, compact: bool) -> list:
+    """
+    Проверяет вакансии и возвращает их объектами Vacancy или, для передачи
+    из рабочего процесса, кортежами полей. Ключ поиска в кортеж не входит:
+    пересылка текста между процессами обходится дороже, чем его вычисление
+    в основном процессе при первом обращении.
+    """
+    errors = []
+    vacancies = Vacancy.iter_from_json(items, errors)
+    if compact:
+        rows = [
+            (v.title, v.url, v.salary, v.description, v.salary_from, v.salary_to, v.currency)
+            for v in vacancies
+        ]
+    else:
+        rows = list(vacancies)
+    rejects.extend((source, position, f"запись {number}: {message}") for number, message in errors)
+    return rows
+
+
+def _parse_file_shard(shard: tuple, compact: bool = True) -> tuple:
+    """
+    Разбирает часть файла.
+
+    :param shard: Кортеж (имя файла, начало, конец); для файла JSON
+        начало и конец равны None.
+    :param compact: Вернуть кортежи полей вместо объектов Vacancy.
+    :return: Кортеж (вакансии, отклонённые записи). Отклонённая
+        запись — (файл, позиция, текст ошибки), где позиция — смещение
+        строки JSON Lines или 0 для файла JSON.
+    """
+    filename, start, end = shard
+    rows, rejects = [], []
+    if start is None:
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError as e:
+            return rows, [(filename, 0, str(e))]
+        return _parse_items(_page_items(data), filename, 0, rejects, compact), rejects
+
+    with open(filename, "rb") as f:
+        if start:
+            # Строка, начатая в предыдущей части, принадлежит ей.
+            f.seek(start - 1)
+            f.readline()
+        while f.tell() < end:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                rejects.append((filename, offset, str(e)))
+                continue
+            rows.extend(_parse_items(_page_items(data), filename, offset, rejects, compact))
+    return rows, rejects
+
+
+def _parse_pages_shard(shard: tuple, compact: bool = True) -> tuple:
+    """
+    Разбирает часть уже загруженных страниц.
+
+    :param shard: Кортеж (номер первой страницы, список страниц).
+    :param compact: Вернуть кортежи полей вместо объектов Vacancy.
+    :return: Кортеж (вакансии, отклонённые записи); позиция
+        отклонённой записи — номер страницы.
+    """
+    first_page, pages = shard
+    rows, rejects = [], []
+    for number, items in enumerate(pages, first_page):
+        rows.extend(_parse_items(_page_items(items), "pages", number, rejects, compact))
+    return rows, rejects
+
+
+class ParallelIngestor:
+    """
+    Загрузка больших архивов сырых ответов API пулом процессов.
+
+    Разбор и проверка вакансий выполняются в max_workers процессах,
+    поэтому загрузка масштабируется по числу ядер. Одновременно в работе
+    находится не больше 2 * max_workers частей, а результаты принимаются
+    в исходном порядке, отбрасываются повторы по ссылке и пачками
+    записываются в хранилище. Некорректные записи не прерывают загрузку,
+    а собираются в список rejects.
+    """
+
+    def __init__(
+        self,
+        connector: Optional[AbstractFileConnector] = None,
+        max_workers: Optional[int] = None,
+        shard_size: int = _SHARD_SIZE,
+    ):
+        """
+        Инициализация загрузчика.
+
+        :param connector: Хранилище для записи вакансий (необязательно).
+        :param max_workers: Количество процессов; по умолчанию — число ядер.
+        :param shard_size: Размер части файла JSON Lines в байтах.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers < 1 or shard_size < 1:
+            raise ValueError("max_workers и shard_size должны быть положительными.")
+        self.__connector = connector
+        self.__max_workers = max_workers
+        self.__shard_size = shard_size
+        self.rejects = []
+        self.stats = {"shards": 0, "parsed": 0, "duplicates": 0, "rejected": 0}
+
+    def make_shards(self, filenames: Iterable[str]) -> List[tuple]:
+        """
+        Делит файлы на части.
+
+        :param filenames: Файлы .json и .jsonl.
+        :return: Список кортежей (имя файла, начало, конец).
+        """
+        shards = []
+        for filename in filenames:
+            if not filename.endswith(".jsonl"):
+                shards.append((filename, None, None))
+                continue
+            size = os.path.getsize(filename)
+            for start in range(0, size, self.__shard_size):
+                shards.append((filename, start, min(start + self.__shard_size, size)))
+        return shards
+
+    def iter_vacancies(self, filenames: Iterable[str]) -> Iterator[Vacancy]:
+        """
+        Отдаёт вакансии из файлов без повторов по ссылке.
+
+        :param filenames: Файлы .json и .jsonl с сырыми ответами API.
+        :return: Генератор объектов Vacancy в порядке файлов.
+        """
+        return self._iter_shards(_parse_file_shard, self.make_shards(filenames))
+
+    def iter_from_pages(self, pages: Iterable[list], pages_per_shard: int = 20) -> Iterator[Vacancy]:
+        """
+        Отдаёт вакансии из уже загруженных страниц без повторов по ссылке.
+
+        :param pages: Итерируемый набор страниц (списков вакансий в формате JSON).
+        :param pages_per_shard: Количество страниц в одной части.
+        :return: Генератор объектов Vacancy в порядке страниц.
+        """
+        pages = iter(pages)
+
+        def shards():
+            first_page = 0
+            while True:
+                chunk = list(islice(pages, pages_per_shard))
+                if not chunk:
+                    return
+                yield first_page, chunk
+                first_page += len(chunk)
+
+        return self._iter_shards(_parse_pages_shard, shards())
+
+    def ingest(self, filenames: Iterable[str], batch_size: int = 1000) -> dict:
+        """
+        Загружает вакансии из файлов в хранилище.
+
+        :param filenames: Файлы .json и .jsonl с сырыми ответами API.
+        :param batch_size: Количество вакансий в одной записи в хранилище.
+        :return: Статистика: shards, parsed, duplicates, rejected и saved.
+        """
+        return self._save(self.iter_vacancies(filenames), batch_size)
+
+    def ingest_pages(self, pages: Iterable[list], batch_size: int = 1000) -> dict:
+        """
+        Загружает вакансии из уже загруженных страниц в хранилище.
+
+        :param pages: Итерируемый набор страниц (списков вакансий в формате JSON).
+        :param batch_size: Количество вакансий в одной записи в хранилище.
+        :return: Статистика: shards, parsed, duplicates, rejected и saved.
+        """
+        return self._save(self.iter_from_pages(pages), batch_size)
+
+    def _save(self, vacancies: Iterator[Vacancy], batch_size: int) -> dict:
+        """Записывает вакансии в хранилище пачками по batch_size."""
+        if self.__connector is None:
+            raise ValueError("Для записи вакансий нужно хранилище.")
+        saved = 0
+        while True:
+            batch = list(islice(vacancies, batch_size))
+            if not batch:
+                break
+            self.__connector.add_vacancies(batch)
+            saved += len(batch)
+        return dict(self.stats, saved=saved)
+
+    def _iter_shards(self, parse, shards: Iterable[tuple]) -> Iterator[Vacancy]:
+        """Разбирает части и отдаёт новые вакансии в исходном порядке."""
+        seen_urls = set()
+        for rows, rejects in self._parse_all(parse, shards):
+            self.stats["shards"] += 1
+            self.stats["parsed"] += len(rows)
+            self.stats["rejected"] += len(rejects)
+            self.rejects.extend(rejects)
+            for row in rows:
+                if not isinstance(row, Vacancy):
+                    # Строки из рабочих процессов приходят копиями: валюты
+                    # интернируются заново, как при обычном создании вакансии.
+                    title, url, salary, description, salary_from, salary_to, currency = row
+                    row = Vacancy._from_trusted(
+                        title, url, salary, description, salary_from, salary_to,
+                        sys.intern(currency) if currency else None,
+                    )
+                if row.url in seen_urls:
+                    self.stats["duplicates"] += 1
+                    continue
+                seen_urls.add(row.url)
+                yield row
+
+    def _parse_all(self, parse, shards: Iterable[tuple]) -> Iterator[tuple]:
+        """Результаты разбора частей по порядку: в пуле процессов или на месте."""
+        if self.__max_workers == 1:
+            # С одним процессом пул дал бы только расходы на пересылку данных.
+            for shard in shards:
+                yield parse(shard, compact=False)
+            return
+        shards = iter(shards)
+        window = self.__max_workers * 2
+        with ProcessPoolExecutor(max_workers=self.__max_workers) as executor:
+            pending = deque(executor.submit(parse, shard) for shard in islice(shards, window))
+            while pending:
+                result = pending.popleft().result()
+                next_shard = next(shards, None)
+                if next_shard is not None:
+                    pending.append(executor.submit(parse, next_shard))
+                yield result
@@ -0,0 +1,338 @@
+"""
+Необязательная инструментация этапов конвейера.
+
+Этапы (запросы к API, разбор JSON, чтение и запись файлов, фильтры)
+отмечены декоратором timed или блоком timer. Пока не подключён ни один
+приёмник, обёртка сводится к одной проверке списка, поэтому стоимость
+выключенной инструментации близка к нулю. Подключённые приёмники
+получают для каждого вызова время выполнения, количество записей
+и объём данных в байтах.
+"""
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Iterable, Optional, TextIO
+
+_sinks = []
+
+
+class MetricsSink:
+    """Базовый приёмник метрик."""
+
+    def record(self, stage: str, seconds: float, records: int = 0, nbytes: int = 0) -> None:
+        """
+        Принимает замер одного вызова этапа.
+
+        :param stage: Имя этапа, например "api.get_vacancies".
+        :param seconds: Время выполнения в секундах.
+        :param records: Количество обработанных записей.
+        :param nbytes: Объём прочитанных или записанных данных в байтах.
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Сбрасывает накопленные данные; вызывается при отключении приёмника."""
+
+    def close(self) -> None:
+        """Освобождает ресурсы приёмника после отключения."""
+
+
+class InMemorySink(MetricsSink):
+    """Приёмник, суммирующий замеры по этапам в памяти."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    def record(self, stage: str, seconds: float, records: int = 0, nbytes: int = 0) -> None:
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = {
+                    "calls": 0, "seconds": 0.0, "max_seconds": 0.0, "records": 0, "bytes": 0,
+                }
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["records"] += records
+            stats["bytes"] += nbytes
+
+    def snapshot(self) -> dict:
+        """Копия накопленных сумм: этап -> calls, seconds, max_seconds, records, bytes."""
+        with self._lock:
+            return {stage: dict(stats) for stage, stats in self._stages.items()}
+
+    def report(self) -> str:
+        """Текстовая таблица этапов, отсортированная по суммарному времени."""
+        lines = [f"{'stage':<36} {'calls':>7} {'seconds':>10} {'records':>10} {'bytes':>12}"]
+        items = sorted(self.snapshot().items(), key=lambda item: item[1]["seconds"], reverse=True)
+        for stage, stats in items:
+            lines.append(
+                f"{stage:<36} {stats['calls']:>7} {stats['seconds']:>10.3f} "
+                f"{stats['records']:>10} {stats['bytes']:>12}"
+            )
+        return "\n".join(lines)
+
+
+class JSONLogSink(MetricsSink):
+    """Приёмник, дописывающий каждый замер строкой JSON в файл."""
+
+    def __init__(self, filename: str):
+        """
+        :param filename: Файл журнала в формате JSON Lines.
+        """
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._file = open(filename, "a", encoding="utf-8")
+
+    def record(self, stage: str, seconds: float, records: int = 0, nbytes: int = 0) -> None:
+        line = json.dumps({
+            "ts": round(time.time(), 6),
+            "stage": stage,
+            "seconds": round(seconds, 6),
+            "records": records,
+            "bytes": nbytes,
+        })
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class PrometheusTextSink(InMemorySink):
+    """
+    Приёмник для node_exporter textfile collector: суммы по этапам
+    записываются в файл в текстовом формате Prometheus при flush.
+    """
+
+    def __init__(self, filename: str, prefix: str = "vacancies_stage"):
+        """
+        :param filename: Файл .prom, который читает коллектор.
+        :param prefix: Префикс имён метрик.
+        """
+        super().__init__()
+        self._filename = filename
+        self._prefix = prefix
+
+    def render(self) -> str:
+        """Текущие суммы в текстовом формате Prometheus."""
+        series = [
+            ("calls_total", "counter", "calls", "Количество вызовов этапа."),
+            ("seconds_total", "counter", "seconds", "Суммарное время этапа в секундах."),
+            ("max_seconds", "gauge", "max_seconds", "Самый долгий вызов этапа в секундах."),
+            ("records_total", "counter", "records", "Обработано записей."),
+            ("bytes_total", "counter", "bytes", "Обработано байт."),
+        ]
+        snapshot = self.snapshot()
+        lines = []
+        for suffix, kind, key, help_text in series:
+            name = f"{self._prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stage, stats in sorted(snapshot.items()):
+                lines.append(f'{name}{{stage="{stage}"}} {stats[key]}')
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        """Атомарно перезаписывает файл, чтобы коллектор не прочитал его частично."""
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_path, self._filename)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def add_sink(sink: MetricsSink) -> MetricsSink:
+    """Подключает приёмник и тем самым включает инструментацию."""
+    _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink: MetricsSink) -> None:
+    """Отключает приёмник, предварительно сбросив его данные."""
+    _sinks.remove(sink)
+    sink.flush()
+    sink.close()
+
+
+def enabled() -> bool:
+    """Подключён ли хотя бы один приёмник."""
+    return bool(_sinks)
+
+
+def record(stage: str, seconds: float = 0.0, records: int = 0, nbytes: int = 0) -> None:
+    """Передаёт замер всем подключённым приёмникам."""
+    for sink in _sinks:
+        sink.record(stage, seconds, records, nbytes)
+
+
+def timed(stage: str, records: Optional[Callable[[object], int]] = None):
+    """
+    Декоратор, замеряющий время вызова функции как этапа stage.
+
+    :param stage: Имя этапа.
+    :param records: Функция, вычисляющая количество записей по результату
+        (например, len).
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _sinks:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            record(stage, time.perf_counter() - start, records(result) if records else 0)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class _Timer:
+    """Замер блока кода; количество записей и байт задаются внутри блока."""
+
+    __slots__ = ("stage", "records", "nbytes", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.records = 0
+        self.nbytes = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            record(self.stage, time.perf_counter() - self.start, self.records, self.nbytes)
+
+
+class _NullTimer:
+    """Пустой замер для выключенной инструментации."""
+
+    __slots__ = ()
+    records = nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(stage: str):
+    """
+    Контекстный менеджер для замера блока кода как этапа stage.
+    Внутри блока можно задать timer.records и timer.nbytes.
+    """
+    return _Timer(stage) if _sinks else _NULL_TIMER
+
+
+def make_sink(spec: str) -> MetricsSink:
+    """
+    Создаёт приёмник по описанию из командной строки.
+
+    :param spec: "memory", "json:ПУТЬ" или "prometheus:ПУТЬ".
+    :return: Объект приёмника.
+    :raises ValueError: Если описание не распознано.
+    """
+    kind, _, path = spec.partition(":")
+    if kind == "memory" and not path:
+        return InMemorySink()
+    if kind == "json" and path:
+        return JSONLogSink(path)
+    if kind == "prometheus" and path:
+        return PrometheusTextSink(path)
+    raise ValueError(f"Неизвестный приёмник метрик: {spec}")
+
+
+def run_instrumented(
+    func: Callable[[], object],
+    sinks: Iterable[MetricsSink] = (),
+    profile: Optional[str] = None,
+    report_output: Optional[TextIO] = None,
+):
+    """
+    Выполняет func с подключёнными приёмниками метрик и профилировщиком.
+    Приёмники отключаются после выполнения, а суммы приёмников InMemorySink
+    печатаются в report_output.
+
+    :param func: Функция без аргументов.
+    :param sinks: Приёмники метрик (см. make_sink).
+    :param profile: Режим профилирования "cpu" или "memory" (необязательно).
+    :param report_output: Поток для отчётов; по умолчанию sys.stderr.
+    :return: Результат func.
+    """
+    output = report_output or sys.stderr
+    sinks = [add_sink(sink) for sink in sinks]
+    try:
+        if profile:
+            return profile_call(func, profile, output)
+        return func()
+    finally:
+        for sink in sinks:
+            remove_sink(sink)
+            if type(sink) is InMemorySink:
+                output.write(sink.report() + "\n")
+
+
+def profile_call(func: Callable[[], object], mode: str, output: TextIO, limit: int = 30):
+    """
+    Выполняет func под профилировщиком и печатает отчёт.
+
+    :param func: Функция без аргументов.
+    :param mode: "cpu" — cProfile, "memory" — tracemalloc.
+    :param output: Поток для отчёта.
+    :param limit: Количество строк отчёта.
+    :return: Результат func.
+    """
+    # Профилировщики импортируются только при запросе отчёта.
+    if mode == "cpu":
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func)
+        finally:
+            buffer = io.StringIO()
+            pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(limit)
+            output.write(buffer.getvalue())
+    if mode == "memory":
+        import tracemalloc
+
+        tracemalloc.start()
+        try:
+            return func()
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            output.write(f"Память: текущая {current / 2 ** 20:.1f} МБ, пик {peak / 2 ** 20:.1f} МБ\n")
+            for stat in snapshot.statistics("lineno")[:limit]:
+                output.write(f"{stat}\n")
+    raise ValueError(f"Неизвестный режим профилирования: {mode}")
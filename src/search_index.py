@@ -0,0 +1,221 @@
+import re
+import unicodedata
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Окончания, которые отсекает stem_word, от длинных к коротким.
+_ENDINGS = sorted(
+    [
+        "ями", "ами", "ого", "его", "ому", "ему", "ыми", "ими", "иях", "ией",
+        "ой", "ей", "ий", "ый", "ая", "яя", "ое", "ее", "ие", "ые", "ов", "ев",
+        "ах", "ях", "ам", "ям", "ом", "ем", "ую", "юю", "ия", "ью",
+        "а", "я", "ы", "и", "е", "у", "ю", "ь",
+        "ing", "ers", "er", "es", "ed", "s",
+    ],
+    key=len, reverse=True,
+)
+_MIN_STEM_LENGTH = 4
+
+
+def normalize_text(text: str) -> str:
+    """
+    Приводит текст к виду для поиска: NFKC, casefold и замена «ё» на «е».
+    В отличие от lower(), casefold сравнивает без учёта регистра и такие
+    символы, как «ß», а NFKC — совместимые формы (лигатуры, полноширинные
+    буквы). Повторная нормализация результата его не меняет.
+
+    :param text: Исходный текст.
+    :return: Нормализованный текст.
+    """
+    folded = unicodedata.normalize("NFKC", unicodedata.normalize("NFKC", text).casefold())
+    return folded.replace("ё", "е")
+
+
+def search_key(title: str, description: str) -> str:
+    """
+    Ключ поиска вакансии: нормализованные название и описание через перевод
+    строки, чтобы подстрока не находилась на стыке двух полей.
+
+    :param title: Название вакансии.
+    :param description: Описание вакансии.
+    :return: Нормализованный текст.
+    """
+    return normalize_text(f"{title}\n{description}")
+
+
+def stem_word(word: str) -> str:
+    """
+    Простое отсечение окончания русского или английского слова:
+    «разработчиками» -> «разработчик». Основа не короче четырёх букв.
+
+    :param word: Нормализованное слово.
+    :return: Основа слова.
+    """
+    for ending in _ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= _MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+    return word
+
+
+def normalize_keyword(keyword: str, stem: bool = False) -> str:
+    """
+    Нормализует ключевое слово так же, как ключ поиска вакансии.
+
+    :param keyword: Ключевое слово или фраза.
+    :param stem: Отсечь окончание; применяется только к ключевому слову
+        из одного слова — фразы ищутся как есть.
+    :return: Нормализованное ключевое слово.
+    """
+    keyword = normalize_text(keyword)
+    if stem and _TOKEN_RE.fullmatch(keyword):
+        return stem_word(keyword)
+    return keyword
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбивает текст на нормализованные слова.
+    :param text: Исходный текст.
+    :return: Список слов после normalize_text.
+    """
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс «слово -> ключи документов».
+
+    Ключом документа может быть ссылка на вакансию или номер строки
+    таблицы. Индекс строится один раз и обновляется при добавлении
+    и удалении документов; поиск возвращает ключи в порядке добавления.
+    """
+
+    def __init__(self, get_texts: Optional[Callable[[Hashable], Iterable[str]]] = None):
+        """
+        Инициализация индекса.
+
+        :param get_texts: Функция, возвращающая тексты документа по ключу.
+            Нужна для точной проверки подстрок при substring=True.
+        """
+        self.__postings: Dict[str, Set[Hashable]] = {}
+        self.__tokens: Dict[Hashable, Set[str]] = {}
+        self.__order: Dict[Hashable, int] = {}
+        self.__counter = 0
+        self.__get_texts = get_texts
+
+    def __len__(self) -> int:
+        return len(self.__tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__tokens
+
+    def add(self, key: Hashable, *texts: str) -> None:
+        """
+        Добавляет документ в индекс или заменяет уже добавленный.
+        Заменённый документ сохраняет своё место в порядке выдачи.
+
+        :param key: Ключ документа.
+        :param texts: Тексты документа (например, название и описание).
+        """
+        if key in self.__tokens:
+            self._unlink(key)
+        else:
+            self.__order[key] = self.__counter
+            self.__counter += 1
+        tokens = set()
+        for text in texts:
+            tokens.update(tokenize(text))
+        self.__tokens[key] = tokens
+        for token in tokens:
+            self.__postings.setdefault(token, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Удаляет документ из индекса.
+
+        :param key: Ключ документа.
+        """
+        if key not in self.__tokens:
+            return
+        self._unlink(key)
+        del self.__tokens[key]
+        del self.__order[key]
+
+    def _unlink(self, key: Hashable) -> None:
+        """Убирает ключ из списков документов всех его слов."""
+        for token in self.__tokens[key]:
+            keys = self.__postings[token]
+            keys.discard(key)
+            if not keys:
+                del self.__postings[token]
+
+    def search(self, keywords: Iterable[str], mode: str = "any", substring: bool = False) -> List[Hashable]:
+        """
+        Ищет документы по ключевым словам.
+
+        :param keywords: Ключевые слова.
+        :param mode: "any" — хотя бы одно слово (ИЛИ), "all" — все слова (И).
+        :param substring: Искать ключевые слова как подстроки слов документа,
+            как это делает полный просмотр текстов.
+        :return: Ключи найденных документов в порядке добавления.
+        """
+        if mode not in ("any", "all"):
+            raise ValueError("mode должен быть 'any' или 'all'.")
+        result = None
+        for keyword in keywords:
+            keys = self._match_keyword(keyword, substring)
+            if result is None:
+                result = keys
+            elif mode == "any":
+                result = result | keys
+            else:
+                result = result & keys
+        if not result:
+            return []
+        return sorted(result, key=self.__order.__getitem__)
+
+    def _match_keyword(self, keyword: str, substring: bool) -> Set[Hashable]:
+        """Ключи документов, содержащих одно ключевое слово."""
+        tokens = tokenize(keyword)
+        if not tokens:
+            if not substring:
+                return set()
+            candidates = set(self.__tokens)
+        else:
+            candidates = None
+            for token in tokens:
+                if substring:
+                    # Подстроку ищем в словаре индекса, а не в текстах документов.
+                    keys = set()
+                    for known, known_keys in self.__postings.items():
+                        if token in known:
+                            keys |= known_keys
+                else:
+                    keys = self.__postings.get(token, set())
+                candidates = set(keys) if candidates is None else candidates & keys
+                if not candidates:
+                    return set()
+        needle = normalize_text(keyword)
+        if substring and self.__get_texts is not None and (len(tokens) != 1 or tokens[0] != needle):
+            # Ключевое слово из нескольких слов или со знаками препинания
+            # проверяется по исходным текстам.
+            candidates = {
+                key for key in candidates
+                if any(needle in normalize_text(text) for text in self.__get_texts(key))
+            }
+        return candidates
+
+
+def build_vacancy_index(vacancies: Iterable) -> InvertedIndex:
+    """
+    Строит индекс по названиям и описаниям вакансий с ключами-ссылками.
+    :param vacancies: Итерируемый набор объектов Vacancy.
+    :return: Объект InvertedIndex.
+    """
+    by_url = {}
+    index = InvertedIndex(lambda url: (by_url[url].search_text,))
+    for vacancy in vacancies:
+        by_url[vacancy.url] = vacancy
+        index.add(vacancy.url, vacancy.search_text)
+    return index
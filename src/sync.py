@@ -0,0 +1,222 @@
+import json
+import os
+import tempfile
+import warnings
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from src.api import HeadHunterAPI
+from src.file_connector import AbstractFileConnector
+from src.vacancy import Vacancy
+
+_PUBLISHED_AT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def _parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """Разбирает дату публикации hh.ru ("2024-05-01T12:00:00+0300")."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, _PUBLISHED_AT_FORMAT)
+    except ValueError:
+        return None
+
+
+class VacancySync:
+    """
+    Инкрементальная синхронизация сохранённых поисковых запросов.
+
+    Для каждого запроса (текст и фильтры) хранится водяной знак — самая
+    поздняя дата публикации среди уже полученных вакансий. Следующий запуск
+    передаёт её в фильтр date_from и сохраняет только новые вакансии,
+    заменяя записи с той же ссылкой. Вакансии, опубликованные ровно в момент
+    водяного знака, запоминаются по id, потому что date_from включает
+    границу и они приходят повторно.
+
+    Если выдача не поместилась в max_pages страниц клиента, вакансии
+    старше последней полученной страницы остались непрочитанными. В этом
+    случае водяной знак не сдвигается, пропавшие вакансии не удаляются,
+    а в статистике и предупреждении сообщается об усечённой выдаче.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        connector: AbstractFileConnector,
+        state_file: str = "data/sync_state.json",
+    ):
+        """
+        Инициализация синхронизации.
+
+        :param api: Клиент hh.ru.
+        :param connector: Хранилище вакансий.
+        :param state_file: Файл с водяными знаками сохранённых запросов.
+        """
+        self.__api = api
+        self.__connector = connector
+        self.__state_file = state_file
+        self.__state = self._load_state()
+
+    @property
+    def queries(self) -> list:
+        """Сохранённые запросы в виде пар (текст, фильтры)."""
+        return [(entry["keyword"], entry["params"]) for entry in self.__state.values()]
+
+    @staticmethod
+    def make_key(keyword: str, extra_params: Optional[dict] = None) -> str:
+        """Ключ запроса: нормализованный текст и отсортированные фильтры."""
+        params = sorted((name, str(value)) for name, value in (extra_params or {}).items())
+        return json.dumps([" ".join(keyword.lower().split()), params], ensure_ascii=False)
+
+    def _load_state(self) -> dict:
+        """Читает состояние синхронизации из файла."""
+        try:
+            with open(self.__state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _save_state(self) -> None:
+        """Атомарно записывает состояние синхронизации."""
+        directory = os.path.dirname(os.path.abspath(self.__state_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.__state, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.__state_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def sync(self, keyword: str, extra_params: Optional[dict] = None, expire: bool = False) -> dict:
+        """
+        Синхронизирует один запрос.
+
+        :param keyword: Поисковый запрос.
+        :param extra_params: Дополнительные фильтры поиска hh.ru.
+        :param expire: Запросить полную выдачу и удалить из хранилища вакансии
+            этого запроса, которых в ней больше нет. Без повторной записи
+            сохраняются только новые и переопубликованные вакансии.
+        :return: Словарь со статистикой: fetched, saved, expired, watermark
+            и truncated — признак выдачи, не поместившейся в max_pages страниц.
+        :raises APIRequestError: Если не удалось получить одну из страниц;
+            состояние запроса при этом не меняется.
+        """
+        key = self.make_key(keyword, extra_params)
+        entry = self.__state.get(key) or {
+            "keyword": keyword,
+            "params": dict(extra_params or {}),
+            "watermark": None,
+            "boundary_ids": [],
+            "urls": [],
+        }
+        watermark = _parse_published_at(entry["watermark"])
+        boundary_ids = set(entry["boundary_ids"])
+        known_urls = set(entry["urls"])
+
+        params = dict(extra_params or {})
+        params["order_by"] = "publication_time"
+        if watermark is not None and not expire:
+            params["date_from"] = entry["watermark"]
+
+        returned_urls = set()
+        newest, newest_raw, newest_ids = watermark, entry["watermark"], set(boundary_ids)
+        fetched = saved = 0
+        info = {}
+        for page in self.__api.iter_pages(keyword, params, info):
+            fetched += len(page)
+            fresh = []
+            for item in page:
+                published = _parse_published_at(item.get("published_at"))
+                returned_urls.add(item.get("alternate_url", ""))
+                if published is not None:
+                    if newest is None or published > newest:
+                        newest, newest_raw, newest_ids = published, item["published_at"], set()
+                    if published == newest:
+                        newest_ids.add(item.get("id"))
+                if not self._is_new(item, published, watermark, boundary_ids, known_urls):
+                    continue
+                fresh.append(item)
+            batch = list(Vacancy.iter_from_json(fresh))
+            if batch:
+                self.__connector.add_vacancies(batch)
+                saved += len(batch)
+
+        expired = 0
+        truncated = bool(info.get("truncated"))
+        if truncated:
+            # Непрочитанная часть выдачи: ни удалять вакансии, ни сдвигать
+            # водяной знак по неполным данным нельзя.
+            warnings.warn(
+                f"Выдача запроса {keyword!r} усечена: найдено {info.get('found')}, "
+                f"получено {fetched}. Водяной знак не изменён, устаревшие вакансии не удалены.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            entry["urls"] = sorted(known_urls | returned_urls)
+            newest_raw = entry["watermark"]
+        elif expire:
+            expired = self._expire(key, known_urls - returned_urls)
+            entry["urls"] = sorted(returned_urls)
+        else:
+            entry["urls"] = sorted(known_urls | returned_urls)
+        if not truncated:
+            entry["watermark"] = newest_raw
+            entry["boundary_ids"] = sorted(i for i in newest_ids if i is not None)
+        entry["last_sync"] = datetime.now(timezone.utc).strftime(_PUBLISHED_AT_FORMAT)
+        self.__state[key] = entry
+        self._save_state()
+        return {
+            "fetched": fetched,
+            "saved": saved,
+            "expired": expired,
+            "watermark": newest_raw,
+            "truncated": truncated,
+        }
+
+    def sync_saved(self, expire: bool = False) -> dict:
+        """
+        Синхронизирует все сохранённые запросы.
+
+        :param expire: Удалять вакансии, пропавшие из выдачи (см. sync).
+        :return: Словарь «ключ запроса -> статистика».
+        """
+        return {
+            self.make_key(keyword, params): self.sync(keyword, params, expire)
+            for keyword, params in self.queries
+        }
+
+    @staticmethod
+    def _is_new(
+        item: dict,
+        published: Optional[datetime],
+        watermark: Optional[datetime],
+        boundary_ids: set,
+        known_urls: set,
+    ) -> bool:
+        """Нужно ли сохранять вакансию: она новее водяного знака или ещё не сохранена."""
+        if watermark is None or published is None:
+            return True
+        if published > watermark:
+            return True
+        if published == watermark:
+            return item.get("id") not in boundary_ids
+        return item.get("alternate_url", "") not in known_urls
+
+    def _expire(self, key: str, missing_urls: Iterable[str]) -> int:
+        """
+        Удаляет из хранилища вакансии, пропавшие из выдачи запроса,
+        если их не возвращает ни один другой сохранённый запрос.
+
+        :return: Количество удалённых вакансий.
+        """
+        missing_urls = set(missing_urls)
+        for other_key, other in self.__state.items():
+            if other_key != key:
+                missing_urls -= set(other["urls"])
+        if not missing_urls:
+            return 0
+        stale = [v for v in self.__connector.get_vacancies() if v.url in missing_urls]
+        self.__connector.delete_vacancies(stale)
+        return len(stale)
@@ -1,8 +1,8 @@
-from src.api import HeadHunterAPI
+from src.api import APIRequestError, HeadHunterAPI
 from src.file_connector import JSONSaver
-from src.utils import (filter_vacancies, get_top_vacancies,
-                       get_vacancies_by_salary, print_vacancies,
-                       sort_vacancies)
+from src.http_cache import ResponseCache
+from src.utils import (filter_vacancies, get_vacancies_by_salary,
+                       print_vacancies, top_vacancies_by_salary)
 from src.vacancy import Vacancy
 
 
@@ -26,20 +26,6 @@ def user_interaction():
         print("Поисковый запрос не может быть пустым.")
         return
 
-    hh_api = HeadHunterAPI()
-    raw_vacancies = hh_api.get_vacancies(search_query)
-    if not raw_vacancies:
-        print("Не удалось получить вакансии с hh.ru.")
-        return
-
-    vacancies_list = Vacancy.cast_to_object_list(raw_vacancies)
-    print(f"Получено {len(vacancies_list)} вакансий.")
-
-    json_saver = JSONSaver()
-    for vacancy in vacancies_list:
-        json_saver.add_vacancy(vacancy)
-    print(f"Вакансии сохранены в файл {json_saver.filename}.")
-
     top_n = int(input("Введите количество вакансий для вывода в топ N: ") or 5)
     filter_words_input = input(
         "Введите ключевые слова для фильтрации вакансий (через пробел): "
@@ -49,13 +35,34 @@ def user_interaction():
         "Введите диапазон зарплат (например, 100000 - 150000): "
     ).strip()
 
-    filtered_vacancies = filter_vacancies(vacancies_list, filter_words)
-    if salary_range:
-        ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
-    else:
-        ranged_vacancies = filtered_vacancies
-    sorted_vacancies = sort_vacancies(ranged_vacancies)
-    top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
+    # Страницы обрабатываются по мере получения: каждая сохраняется пачкой
+    # и сразу фильтруется, поэтому весь результат поиска в памяти не хранится.
+    hh_api = HeadHunterAPI(cache=ResponseCache())
+    json_saver = JSONSaver()
+    total = 0
+    ranged_vacancies = []
+    try:
+        for page in hh_api.iter_pages(search_query):
+            batch = list(Vacancy.iter_from_json(page))
+            json_saver.add_vacancies(batch)
+            total += len(batch)
+
+            matched = filter_vacancies(batch, filter_words)
+            if salary_range:
+                matched = get_vacancies_by_salary(matched, salary_range)
+            ranged_vacancies.extend(matched)
+            print(f"Получено {total} вакансий, подходит {len(ranged_vacancies)}.")
+    except APIRequestError as e:
+        print(e)
+    finally:
+        hh_api.close()
+
+    if not total:
+        print("Не удалось получить вакансии с hh.ru.")
+        return
+    print(f"Вакансии сохранены в файл {json_saver.filename}.")
+
+    top_vacancies = top_vacancies_by_salary(ranged_vacancies, top_n)
 
     print(f"\n=== Топ {top_n} вакансий по зарплате ===")
     print_vacancies(top_vacancies)
@@ -1,67 +1,230 @@
+import heapq
+from typing import Optional, Sequence, Union
+
+from src import metrics
+from src.search_index import InvertedIndex, normalize_keyword, tokenize
 from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+# numpy необязателен и импортируется при первой обработке VacancyTable,
+# чтобы не замедлять запуск команд, которым он не нужен.
+_NOT_LOADED = object()
+np = _NOT_LOADED
+
+
+def _numpy():
+    """Модуль numpy или None, если он не установлен."""
+    global np
+    if np is _NOT_LOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - numpy необязателен
+            numpy = None
+        np = numpy
+    return np
 
 
-def filter_vacancies(vacancies: list[Vacancy], keywords: list[str]) -> list[Vacancy]:
+# Функции ниже принимают как список объектов Vacancy, так и VacancyTable;
+# для таблицы они работают по колонкам и возвращают новую таблицу.
+Vacancies = Union[list[Vacancy], VacancyTable]
+
+
+@metrics.timed("utils.filter_vacancies", records=len)
+def filter_vacancies(
+    vacancies: Vacancies,
+    keywords: list[str],
+    mode: str = "any",
+    index: Optional[InvertedIndex] = None,
+    substring: bool = True,
+    stem: bool = False,
+) -> Vacancies:
     """
     Фильтрует вакансии по ключевым словам.
-    :param vacancies: Список вакансий.
+    Результат не зависит от вида набора: по умолчанию ключевые слова ищутся
+    как подстроки названия и описания, а при substring=False — как целые
+    слова. Для таблицы вакансий (или при переданном индексе) поиск идёт по
+    инвертированному индексу, для списка без индекса просматриваются ключи
+    поиска вакансий (Vacancy.search_text). Регистр, «ё» и совместимые
+    формы символов не учитываются.
+    :param vacancies: Список вакансий или таблица вакансий.
     :param keywords: Список ключевых слов.
+    :param mode: "any" — хотя бы одно слово, "all" — все слова.
+    :param index: Индекс по ссылкам вакансий списка (необязательно).
+    :param substring: Искать подстроки (True) или только целые слова (False).
+    :param stem: Отсекать окончания ключевых слов из одного слова, чтобы
+        «разработчика» находило и «разработчик» (только при substring=True).
     :return: Отфильтрованный список вакансий.
     """
     if not keywords:
         return vacancies
-    filtered = []
-    for vacancy in vacancies:
-        for word in keywords:
-            if word.lower() in vacancy.title.lower() or word.lower() in vacancy.description.lower():
-                filtered.append(vacancy)
-                break
-    return filtered
+    if substring and stem:
+        keywords = [normalize_keyword(word, stem=True) for word in keywords]
+    if isinstance(vacancies, VacancyTable):
+        return vacancies.take(vacancies.index.search(keywords, mode, substring))
+    if index is not None:
+        found = set(index.search(keywords, mode, substring))
+        return [vacancy for vacancy in vacancies if vacancy.url in found]
+
+    check = any if mode == "any" else all
+    if not substring:
+        keyword_tokens = [set(tokenize(word)) for word in keywords]
+        return [
+            vacancy for vacancy in vacancies
+            if _contains_words(vacancy, keyword_tokens, check)
+        ]
+    words = [normalize_keyword(word) for word in keywords]
+    return [vacancy for vacancy in vacancies if _contains(vacancy.search_text, words, check)]
+
+
+def _contains(search_text: str, words: list[str], check=any) -> bool:
+    """Проверяет, встречаются ли слова (любое или все) в ключе поиска вакансии."""
+    return check(word in search_text for word in words)
+
+
+def _contains_words(vacancy: Vacancy, keyword_tokens: list[set], check=any) -> bool:
+    """Проверяет, есть ли ключевые слова (любое или все) среди целых слов вакансии."""
+    tokens = set(tokenize(vacancy.search_text))
+    return check(bool(words) and words <= tokens for words in keyword_tokens)
+
+
+def _parse_salary_range(salary_range_str: str) -> tuple[int, Optional[int]]:
+    """
+    Разбирает строку диапазона зарплат.
+    :param salary_range_str: Строка вида "100000 - 150000" или "100000".
+    :return: Кортеж (минимум, максимум или None).
+    """
+    parts = salary_range_str.split('-')
+    if len(parts) == 2:
+        return int(parts[0].strip()), int(parts[1].strip())
+    return int(salary_range_str.strip()), None
 
 
-def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range_str: str) -> list[Vacancy]:
+@metrics.timed("utils.get_vacancies_by_salary", records=len)
+def get_vacancies_by_salary(vacancies: Vacancies, salary_range_str: str) -> Vacancies:
     """
     Фильтрует вакансии по диапазону зарплат.
-    :param vacancies: Список вакансий.
+    :param vacancies: Список вакансий или таблица вакансий.
     :param salary_range_str: Строка диапазона зарплат (например, "100000 - 150000").
     :return: Отфильтрованный список вакансий.
     """
     try:
-        parts = salary_range_str.split('-')
-        if len(parts) == 2:
-            min_salary = int(parts[0].strip())
-            max_salary = int(parts[1].strip())
-            return [v for v in vacancies if min_salary <= v._get_salary_value() <= max_salary]
-        else:
-            min_salary = int(salary_range_str.strip())
-            return [v for v in vacancies if v._get_salary_value() >= min_salary]
+        min_salary, max_salary = _parse_salary_range(salary_range_str)
     except (ValueError, AttributeError):
         return vacancies
+    if isinstance(vacancies, VacancyTable):
+        return vacancies.take(_salary_range_indices(vacancies, min_salary, max_salary))
+    if max_salary is None:
+        max_salary = float("inf")
+    return [v for v in vacancies if min_salary <= v._get_salary_value() <= max_salary]
 
 
-def sort_vacancies(vacancies: list[Vacancy]) -> list[Vacancy]:
+@metrics.timed("utils.sort_vacancies", records=len)
+def sort_vacancies(vacancies: Vacancies) -> Vacancies:
     """
     Сортирует вакансии по зарплате (по убыванию).
-    :param vacancies: Список вакансий.
+    Вакансии с одинаковой зарплатой сохраняют исходный порядок.
+    :param vacancies: Список вакансий или таблица вакансий.
     :return: Отсортированный список.
     """
+    if isinstance(vacancies, VacancyTable):
+        values = vacancies.salary_values
+        np = _numpy()
+        if np is not None:
+            salaries = np.frombuffer(values, dtype=np.int64)
+            return vacancies.take(np.argsort(-salaries, kind="stable"))
+        return vacancies.take(sorted(range(len(values)), key=values.__getitem__, reverse=True))
     return sorted(vacancies, key=lambda x: x._get_salary_value(), reverse=True)
 
 
-def get_top_vacancies(vacancies: list[Vacancy], top_n: int) -> list[Vacancy]:
+@metrics.timed("utils.top_vacancies_by_salary", records=len)
+def top_vacancies_by_salary(
+    vacancies: Vacancies, top_n: int, salary_range_str: Optional[str] = None
+) -> Vacancies:
+    """
+    Возвращает N вакансий с наибольшей зарплатой без полной сортировки.
+    Результат совпадает с sort_vacancies(...)[:top_n]: по убыванию
+    зарплаты, при равенстве — в исходном порядке.
+    :param vacancies: Список вакансий или таблица вакансий.
+    :param top_n: Количество вакансий для вывода.
+    :param salary_range_str: Диапазон зарплат для предварительного отбора (необязательно).
+    :return: Список топ N вакансий.
+    """
+    if salary_range_str:
+        try:
+            min_salary, max_salary = _parse_salary_range(salary_range_str)
+        except (ValueError, AttributeError):
+            salary_range_str = None
+    if top_n <= 0:
+        return vacancies[:0]
+
+    if isinstance(vacancies, VacancyTable):
+        candidates = None
+        if salary_range_str:
+            candidates = _salary_range_indices(vacancies, min_salary, max_salary)
+        return vacancies.take(_top_indices(vacancies, top_n, candidates))
+
+    if salary_range_str:
+        vacancies = get_vacancies_by_salary(vacancies, salary_range_str)
+    return heapq.nlargest(top_n, vacancies, key=lambda x: x._get_salary_value())
+
+
+def _salary_range_indices(table: VacancyTable, min_salary: int, max_salary: Optional[int]) -> Sequence[int]:
+    """Номера строк таблицы с зарплатой в диапазоне (булева маска numpy, если доступен)."""
+    values = table.salary_values
+    np = _numpy()
+    if np is not None:
+        salaries = np.frombuffer(values, dtype=np.int64)
+        mask = salaries >= min_salary
+        if max_salary is not None:
+            mask &= salaries <= max_salary
+        return np.flatnonzero(mask)
+    if max_salary is None:
+        return [i for i, value in enumerate(values) if value >= min_salary]
+    return [i for i, value in enumerate(values) if min_salary <= value <= max_salary]
+
+
+def _top_indices(table: VacancyTable, top_n: int, candidates: Optional[Sequence[int]] = None) -> Sequence[int]:
+    """
+    Номера top_n строк с наибольшей зарплатой среди candidates (или всех строк).
+    С numpy используется argpartition за O(n), иначе — куча за O(n log N).
+    """
+    values = table.salary_values
+    np = _numpy()
+    if np is None:
+        rows = range(len(values)) if candidates is None else candidates
+        return heapq.nlargest(top_n, rows, key=values.__getitem__)
+
+    salaries = np.frombuffer(values, dtype=np.int64)
+    if candidates is not None:
+        salaries = salaries[candidates]
+    if top_n < len(salaries):
+        # Граничное значение N-й по величине зарплаты: всё, что больше, входит
+        # в топ целиком, а из равных ей берутся первые по порядку строки.
+        threshold = -np.partition(-salaries, top_n - 1)[top_n - 1]
+        greater = np.flatnonzero(salaries > threshold)
+        equal = np.flatnonzero(salaries == threshold)[:top_n - len(greater)]
+        chosen = np.concatenate([greater, equal])
+    else:
+        chosen = np.arange(len(salaries))
+    order = chosen[np.lexsort((chosen, -salaries[chosen]))]
+    return order if candidates is None else np.asarray(candidates)[order]
+
+
+@metrics.timed("utils.get_top_vacancies", records=len)
+def get_top_vacancies(vacancies: Vacancies, top_n: int) -> Vacancies:
     """
     Возвращает топ N вакансий.
-    :param vacancies: Список вакансий.
+    :param vacancies: Список вакансий или таблица вакансий.
     :param top_n: Количество вакансий для вывода.
     :return: Список топ N вакансий.
     """
     return vacancies[:top_n]
 
 
-def print_vacancies(vacancies: list[Vacancy]):
+def print_vacancies(vacancies: Vacancies):
     """
     Выводит вакансии в консоль.
-    :param vacancies: Список вакансий.
+    :param vacancies: Список вакансий или таблица вакансий.
     """
     if not vacancies:
         print("Вакансий не найдено.")
@@ -1,20 +1,63 @@
+import re
+import sys
+from typing import Iterable, Iterator, Optional
+
+from src import metrics
+from src.search_index import search_key
+
+_SALARY_NUMBER_RE = re.compile(r"\d[\d \u00a0\u202f]*")
 
 
 class Vacancy:
     """Класс для представления вакансии."""
 
-    def __init__(self, title: str, url: str, salary: str, description: str):
+    __slots__ = (
+        "__title", "__url", "__salary", "__description",
+        "__salary_from", "__salary_to", "__currency", "__salary_value",
+        "__key_skills", "__search_text",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        salary: str,
+        description: str,
+        salary_from: Optional[int] = None,
+        salary_to: Optional[int] = None,
+        currency: Optional[str] = None,
+        key_skills: Optional[Iterable[str]] = None,
+        search_text: Optional[str] = None,
+    ):
         """
         Инициализация вакансии.
+        Если границы зарплаты не переданы, они разбираются из строки salary.
         :param title: Название вакансии
         :param url: Ссылка на вакансию
         :param salary: Зарплата (строка)
         :param description: Описание вакансии
+        :param salary_from: Нижняя граница зарплаты
+        :param salary_to: Верхняя граница зарплаты
+        :param currency: Валюта зарплаты
+        :param key_skills: Ключевые навыки из полного описания вакансии;
+            None — подробности вакансии ещё не загружались
+        :param search_text: Сохранённый ранее ключ поиска (см. search_text);
+            None — ключ будет вычислен при первом обращении
         """
         self.__title = self._validate_title(title)
         self.__url = self._validate_url(url)
         self.__salary = self._validate_salary(salary)
         self.__description = description or ""
+        if salary_from is None and salary_to is None:
+            salary_from, salary_to, parsed_currency = self._parse_salary(self.__salary)
+            currency = currency or parsed_currency
+        self.__salary_from = self._validate_salary_bound(salary_from)
+        self.__salary_to = self._validate_salary_bound(salary_to)
+        # Валют немного, поэтому строки интернируются и не дублируются в памяти.
+        self.__currency = sys.intern(currency) if currency else None
+        self.__salary_value = self.__salary_from or self.__salary_to or 0
+        self.__key_skills = tuple(key_skills) if key_skills is not None else None
+        self.__search_text = search_text
 
     @property
     def title(self):
@@ -36,6 +79,55 @@ class Vacancy:
         """Публичный геттер для description."""
         return self.__description
 
+    @property
+    def salary_from(self):
+        """Публичный геттер для нижней границы зарплаты."""
+        return self.__salary_from
+
+    @property
+    def salary_to(self):
+        """Публичный геттер для верхней границы зарплаты."""
+        return self.__salary_to
+
+    @property
+    def currency(self):
+        """Публичный геттер для валюты зарплаты."""
+        return self.__currency
+
+    @property
+    def key_skills(self):
+        """Публичный геттер для ключевых навыков (None, если не загружались)."""
+        return self.__key_skills
+
+    @property
+    def search_text(self) -> str:
+        """
+        Нормализованные название и описание для поиска по ключевым словам
+        (см. search_index.search_key). Вычисляется один раз при первом
+        обращении и сохраняется хранилищами вместе с вакансией.
+        """
+        if self.__search_text is None:
+            self.__search_text = search_key(self.__title, self.__description)
+        return self.__search_text
+
+    @property
+    def is_enriched(self) -> bool:
+        """Загружены ли полное описание и ключевые навыки."""
+        return self.__key_skills is not None
+
+    def with_details(self, description: str, key_skills: Iterable[str]) -> "Vacancy":
+        """
+        Возвращает копию вакансии с полным описанием и ключевыми навыками.
+
+        :param description: Полное описание без HTML-разметки.
+        :param key_skills: Ключевые навыки.
+        :return: Новый объект Vacancy.
+        """
+        return self._from_trusted(
+            self.__title, self.__url, self.__salary, description or "",
+            self.__salary_from, self.__salary_to, self.__currency, tuple(key_skills),
+        )
+
     def _validate_title(self, title: str) -> str:
         """Валидация названия вакансии."""
         if not isinstance(title, str) or not title.strip():
@@ -56,6 +148,33 @@ class Vacancy:
             return "Зарплата не указана"
         return salary.strip()
 
+    def _validate_salary_bound(self, value: Optional[int]) -> Optional[int]:
+        """Валидация границы зарплаты: неотрицательное целое число или None."""
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError("Некорректная граница зарплаты.")
+        return int(value) or None
+
+    @staticmethod
+    def _parse_salary(salary: str) -> tuple:
+        """
+        Разбирает строку зарплаты на нижнюю и верхнюю границы и валюту.
+        Понимает форматы "100000-150000 RUR", "От 100000 RUR",
+        "До 150000 RUR" и "100 000 руб.".
+        :return: Кортеж (salary_from, salary_to, currency).
+        """
+        matches = list(_SALARY_NUMBER_RE.finditer(salary))
+        if not matches:
+            return None, None, None
+        numbers = [int(re.sub(r"\D", "", m.group())) for m in matches[:2]]
+        currency = salary[matches[-1].end():].strip() or None
+        if len(numbers) == 2:
+            return numbers[0], numbers[1], currency
+        if salary.lower().startswith("до"):
+            return None, numbers[0], currency
+        return numbers[0], None, currency
+
     def __lt__(self, other):
         """Метод для сравнения вакансий по зарплате (меньше)."""
         return self._get_salary_value() < other._get_salary_value()
@@ -71,52 +190,138 @@ class Vacancy:
     def _get_salary_value(self) -> int:
         """
         Вспомогательный метод для получения числового значения зарплаты.
-        Если зарплата не указана или не может быть преобразована, возвращает 0.
+        Значение вычисляется один раз при создании вакансии: нижняя граница,
+        а если её нет — верхняя. Если зарплата не указана, возвращает 0.
         """
-        if "Зарплата не указана" in self.salary:
-            return 0
-
-        # Упрощенная логика: берем нижнюю границу диапазона
-        try:
-            # Убираем пробелы и символы, оставляем только цифры
-            clean_salary = "".join(filter(str.isdigit, self.salary))
-            if clean_salary:
-                return int(clean_salary)
-        except (ValueError, TypeError):
-            pass
-        return 0
+        return self.__salary_value
 
     def __str__(self):
         """Строковое представление вакансии."""
         return f"{self.title}\n{self.url}\n{self.salary}\n{self.description[:100]}..."
 
     @classmethod
-    def cast_to_object_list(cls, vacancies_json: list) -> list:
+    def _from_trusted(
+        cls,
+        title: str,
+        url: str,
+        salary: str,
+        description: str,
+        salary_from: Optional[int],
+        salary_to: Optional[int],
+        currency: Optional[str],
+        key_skills: Optional[tuple] = None,
+        search_text: Optional[str] = None,
+    ) -> "Vacancy":
+        """
+        Создаёт вакансию из уже проверенных полей без повторной валидации.
+        Используется контейнерами, которые валидируют данные при добавлении.
+        """
+        vacancy = object.__new__(cls)
+        vacancy.__title = title
+        vacancy.__url = url
+        vacancy.__salary = salary
+        vacancy.__description = description
+        vacancy.__salary_from = salary_from
+        vacancy.__salary_to = salary_to
+        vacancy.__currency = currency
+        vacancy.__salary_value = salary_from or salary_to or 0
+        vacancy.__key_skills = key_skills
+        vacancy.__search_text = search_text
+        return vacancy
+
+    def to_dict(self) -> dict:
+        """Словарь с полями вакансии для сохранения в файл."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "salary": self.salary,
+            "description": self.description,
+            "salary_from": self.salary_from,
+            "salary_to": self.salary_to,
+            "currency": self.currency,
+            "key_skills": list(self.key_skills) if self.key_skills is not None else None,
+            "search_text": self.search_text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Vacancy":
+        """
+        Создаёт вакансию из словаря, сохранённого методом to_dict.
+        :param data: Словарь с полями вакансии.
+        :return: Объект Vacancy.
+        """
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            salary=data["salary"],
+            description=data["description"],
+            salary_from=data.get("salary_from"),
+            salary_to=data.get("salary_to"),
+            currency=data.get("currency"),
+            key_skills=data.get("key_skills"),
+            search_text=data.get("search_text"),
+        )
+
+    @classmethod
+    @metrics.timed("vacancy.cast_to_object_list", records=len)
+    def cast_to_object_list(cls, vacancies_json: list, errors: Optional[list] = None) -> list:
         """
         Преобразует список вакансий из JSON в список объектов Vacancy.
         :param vacancies_json: Список вакансий в формате JSON.
+        :param errors: Список для отклонённых записей (см. iter_from_json).
         :return: Список объектов Vacancy.
         """
-        vacancies = []
-        for item in vacancies_json:
-            title = item.get("name", "")
-            url = item.get("alternate_url", "")
-            salary_info = item.get("salary", {})
-            if salary_info:
-                from_salary = salary_info.get("from")
-                to_salary = salary_info.get("to")
-                currency = salary_info.get("currency", "")
-                if from_salary and to_salary:
-                    salary_str = f"{from_salary}-{to_salary} {currency}"
-                elif from_salary:
-                    salary_str = f"От {from_salary} {currency}"
-                elif to_salary:
-                    salary_str = f"До {to_salary} {currency}"
-                else:
-                    salary_str = "Зарплата не указана"
+        return list(cls.iter_from_json(vacancies_json, errors))
+
+    @classmethod
+    def iter_from_json(
+        cls, vacancies_json: Iterable[dict], errors: Optional[list] = None
+    ) -> Iterator["Vacancy"]:
+        """
+        Лениво преобразует вакансии из JSON в объекты Vacancy.
+        :param vacancies_json: Итерируемый набор вакансий в формате JSON.
+        :param errors: Если передан, некорректные записи пропускаются, а в список
+            добавляются пары (номер записи, текст ошибки); иначе первая
+            некорректная запись прерывает разбор исключением ValueError.
+        :return: Генератор объектов Vacancy.
+        """
+        for number, item in enumerate(vacancies_json):
+            if errors is None:
+                yield cls._from_json_item(item)
+                continue
+            try:
+                vacancy = cls._from_json_item(item)
+            except (ValueError, TypeError, AttributeError) as e:
+                errors.append((number, str(e)))
+                continue
+            yield vacancy
+
+    @classmethod
+    def _from_json_item(cls, item: dict) -> "Vacancy":
+        """Создаёт вакансию из одного элемента выдачи поиска hh.ru."""
+        title = item.get("name", "")
+        url = item.get("alternate_url", "")
+        salary_info = item.get("salary") or {}
+        from_salary = to_salary = currency = None
+        if salary_info:
+            from_salary = salary_info.get("from")
+            to_salary = salary_info.get("to")
+            currency = salary_info.get("currency", "")
+            if from_salary and to_salary:
+                salary_str = f"{from_salary}-{to_salary} {currency}"
+            elif from_salary:
+                salary_str = f"От {from_salary} {currency}"
+            elif to_salary:
+                salary_str = f"До {to_salary} {currency}"
             else:
                 salary_str = "Зарплата не указана"
-            description = item.get("snippet", {}).get("requirement", "") or ""
-            vacancy = cls(title, url, salary_str, description)
-            vacancies.append(vacancy)
-        return vacancies
+        else:
+            salary_str = "Зарплата не указана"
+        # hh.ru присылает "snippet": null у вакансий без краткого описания.
+        description = (item.get("snippet") or {}).get("requirement", "") or ""
+        return cls(
+            title, url, salary_str, description,
+            salary_from=from_salary or None,
+            salary_to=to_salary or None,
+            currency=currency or None
+        )
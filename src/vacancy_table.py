@@ -0,0 +1,134 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Union
+
+from src.search_index import InvertedIndex, search_key
+from src.vacancy import Vacancy
+
+
+class VacancyTable:
+    """
+    Колоночное хранилище большого набора вакансий.
+
+    Строковые поля лежат в отдельных списках, а зарплаты — в массивах
+    array('q'), где 0 означает «не указана». Элементы таблицы выдаются
+    как объекты Vacancy, которые создаются при обращении без повторной
+    валидации.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """
+        Инициализация таблицы.
+
+        :param vacancies: Итерируемый набор вакансий для заполнения таблицы.
+        """
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.salaries: List[str] = []
+        self.descriptions: List[str] = []
+        self.currencies: List[str] = []
+        self.key_skills: List[Optional[tuple]] = []
+        self.salary_from = array("q")
+        self.salary_to = array("q")
+        self.salary_values = array("q")
+        self._index = None
+        self.extend(vacancies)
+
+    def append(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в конец таблицы.
+
+        :param vacancy: Объект Vacancy.
+        """
+        self.titles.append(vacancy.title)
+        self.urls.append(vacancy.url)
+        self.salaries.append(vacancy.salary)
+        self.descriptions.append(vacancy.description)
+        self.currencies.append(vacancy.currency)
+        self.key_skills.append(vacancy.key_skills)
+        self.salary_from.append(vacancy.salary_from or 0)
+        self.salary_to.append(vacancy.salary_to or 0)
+        self.salary_values.append(vacancy._get_salary_value())
+        if self._index is not None:
+            self._index.add(len(self.urls) - 1, vacancy.search_text)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет вакансии в конец таблицы.
+
+        :param vacancies: Итерируемый набор объектов Vacancy.
+        """
+        for vacancy in vacancies:
+            self.append(vacancy)
+
+    @property
+    def index(self) -> InvertedIndex:
+        """
+        Инвертированный индекс по ключам поиска вакансий, ключи — номера строк.
+        Строится при первом обращении и дополняется при добавлении строк.
+        Ключи поиска в таблице не хранятся и вычисляются только здесь.
+        """
+        if self._index is None:
+            index = InvertedIndex(lambda row: (self._search_key_at(row),))
+            for row in range(len(self.urls)):
+                index.add(row, self._search_key_at(row))
+            self._index = index
+        return self._index
+
+    def take(self, indices: Iterable[int]) -> "VacancyTable":
+        """
+        Возвращает новую таблицу из строк с указанными номерами.
+
+        :param indices: Номера строк в нужном порядке.
+        :return: Новый объект VacancyTable.
+        """
+        # Массивы номеров numpy быстрее перебирать как обычный список.
+        indices = indices.tolist() if hasattr(indices, "tolist") else list(indices)
+        table = VacancyTable()
+        table.titles = list(map(self.titles.__getitem__, indices))
+        table.urls = list(map(self.urls.__getitem__, indices))
+        table.salaries = list(map(self.salaries.__getitem__, indices))
+        table.descriptions = list(map(self.descriptions.__getitem__, indices))
+        table.currencies = list(map(self.currencies.__getitem__, indices))
+        table.key_skills = list(map(self.key_skills.__getitem__, indices))
+        table.salary_from = array("q", map(self.salary_from.__getitem__, indices))
+        table.salary_to = array("q", map(self.salary_to.__getitem__, indices))
+        table.salary_values = array("q", map(self.salary_values.__getitem__, indices))
+        return table
+
+    def _search_key_at(self, index: int) -> str:
+        """Ключ поиска для строки таблицы."""
+        return search_key(self.titles[index], self.descriptions[index])
+
+    def _vacancy_at(self, index: int) -> Vacancy:
+        """Создаёт объект Vacancy для строки таблицы."""
+        return Vacancy._from_trusted(
+            self.titles[index],
+            self.urls[index],
+            self.salaries[index],
+            self.descriptions[index],
+            self.salary_from[index] or None,
+            self.salary_to[index] or None,
+            self.currencies[index],
+            self.key_skills[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        for index in range(len(self.urls)):
+            yield self._vacancy_at(index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Vacancy, "VacancyTable"]:
+        """Строка таблицы по номеру или новая таблица по срезу."""
+        if isinstance(key, slice):
+            return self.take(range(*key.indices(len(self))))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Номер строки вне таблицы.")
+        return self._vacancy_at(key)
+
+    def to_list(self) -> List[Vacancy]:
+        """Список объектов Vacancy для всех строк таблицы."""
+        return list(self)
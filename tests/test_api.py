@@ -0,0 +1,360 @@
+import json
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.api import (APIRequestError, CircuitBreaker, CircuitOpenError,
+                     HeadHunterAPI, RequestScheduler, TokenBucket)
+from src.http_cache import ResponseCache
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Обработчик, отдающий страницы поиска в формате hh.ru."""
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["0"])[0])
+        server = self.server
+        if path.count("/") == 2:
+            self.send_details(path.rsplit("/", 1)[1])
+            return
+        with server.lock:
+            failure = server.failures.pop(0) if server.failures else None
+            if failure:
+                server.failed += 1
+        if failure:
+            status, headers = failure
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if server.etag and self.headers.get("If-None-Match") == server.etag:
+            with server.lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        with server.lock:
+            server.requests.append(query)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        items = [
+            {
+                "id": str(page * 10 + i),
+                "name": f"Vacancy {page}-{i}",
+                "alternate_url": f"https://hh.ru/vacancy/{page * 10 + i}",
+            }
+            for i in range(2)
+        ]
+        if page > 0:
+            # Повтор вакансии с предыдущей страницы, как бывает при сдвиге выдачи.
+            items.append({"id": str((page - 1) * 10), "name": "dup"})
+        body = json.dumps({
+            "items": items,
+            "found": server.pages * 2,
+            "pages": server.pages,
+            "page": page,
+        }).encode("utf-8")
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if server.etag:
+            self.send_header("ETag", server.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_details(self, vacancy_id):
+        """Отдаёт полное описание вакансии, как метод /vacancies/{id}."""
+        server = self.server
+        with server.lock:
+            server.detail_requests.append(vacancy_id)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        if vacancy_id in server.missing_details:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({
+            "id": vacancy_id,
+            "description": f"<p>Полное описание <strong>{vacancy_id}</strong></p><ul><li>Python</li></ul>",
+            "key_skills": [{"name": "Python"}, {"name": "SQL"}],
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServerTestCase(unittest.TestCase):
+    """Базовый класс тестов с локальным сервером-заглушкой hh.ru."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.pages = 6
+        self.server.delay = 0.05
+        self.server.etag = None
+        self.server.not_modified = 0
+        self.server.failures = []
+        self.server.failed = 0
+        self.server.detail_requests = []
+        self.server.missing_details = set()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}/vacancies"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_api(self, **kwargs) -> HeadHunterAPI:
+        """Клиент, направленный на заглушку, без ограничения частоты запросов."""
+        kwargs.setdefault("scheduler", RequestScheduler(requests_per_second=1000, backoff_base=0.01))
+        return HeadHunterAPI(base_url=self.base_url, **kwargs)
+
+
+class TestHeadHunterAPI(StubServerTestCase):
+    def test_fetches_all_pages_in_order(self):
+        """Тест получения всех страниц по порядку и без повторов."""
+        api = self.make_api(max_workers=3)
+        vacancies = api.get_vacancies("python")
+        api.close()
+        ids = [item["id"] for item in vacancies]
+        expected = [str(page * 10 + i) for page in range(6) for i in range(2)]
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(self.server.requests), 6)
+
+    def test_concurrency_limit(self):
+        """Тест ограничения количества одновременных запросов."""
+        api = self.make_api(max_workers=2)
+        api.get_vacancies("python")
+        api.close()
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+    def test_page_cap(self):
+        """Тест ограничения количества запрашиваемых страниц."""
+        api = self.make_api(max_pages=2, area=2)
+        vacancies = api.get_vacancies("python")
+        api.close()
+        self.assertEqual(len(vacancies), 4)
+        self.assertEqual(sorted(q["page"][0] for q in self.server.requests), ["0", "1"])
+        self.assertTrue(all(q["area"] == ["2"] for q in self.server.requests))
+
+    def test_iter_pages_yields_page_by_page(self):
+        """Тест постраничной выдачи с ограниченным окном запросов."""
+        api = self.make_api(max_workers=2)
+        pages = api.iter_pages("python")
+        first = next(pages)
+        self.assertEqual([item["id"] for item in first], ["0", "1"])
+        # Пока первая страница не обработана, запрошено не больше окна.
+        time.sleep(0.2)
+        self.assertLessEqual(len(self.server.requests), 3)
+        rest = list(pages)
+        api.close()
+        self.assertEqual(len(rest), 5)
+        self.assertTrue(all(len(items) == 2 for items in rest))
+
+    def test_request_error_is_raised(self):
+        """Тест ошибки соединения: исключение вместо пустого результата."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        api = HeadHunterAPI(
+            base_url=f"http://127.0.0.1:{port}/vacancies",
+            scheduler=RequestScheduler(max_retries=1, backoff_base=0.01),
+        )
+        with self.assertRaises(APIRequestError):
+            api.get_vacancies("python")
+        api.close()
+
+
+class TestHeadHunterAPICache(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.server.pages = 2
+        self.server.delay = 0
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp_dir.cleanup()
+
+    def test_repeated_query_is_served_from_cache(self):
+        """Тест повторного запроса из кэша без обращения к серверу."""
+        cache = ResponseCache(self.tmp_dir.name, ttl=60)
+        api = self.make_api(cache=cache)
+        first = api.get_vacancies("Python")
+        second = self.make_api(cache=cache).get_vacancies("  python ")
+        api.close()
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(cache.stats["hits"], 2)
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_stale_entry_is_revalidated_by_etag(self):
+        """Тест условной перепроверки устаревшей записи по ETag."""
+        self.server.etag = '"v1"'
+        cache = ResponseCache(self.tmp_dir.name, ttl=0)
+        api = self.make_api(cache=cache)
+        first = api.get_vacancies("python")
+        second = api.get_vacancies("python")
+        api.close()
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.not_modified, 2)
+        self.assertEqual(cache.stats["revalidations"], 2)
+        self.assertEqual(cache.stats["hits"], 0)
+
+    def test_lru_eviction_by_size(self):
+        """Тест вытеснения давно не использованных записей при переполнении."""
+        cache = ResponseCache(self.tmp_dir.name, ttl=60, max_bytes=10 ** 6)
+        api = self.make_api(cache=cache, max_pages=1)
+        api.get_vacancies("python")
+        entry_size = cache.stats["bytes"]
+        api.close()
+
+        cache = ResponseCache(self.tmp_dir.name, ttl=60, max_bytes=entry_size * 2 + entry_size // 2)
+        api = self.make_api(cache=cache, max_pages=1)
+        api.get_vacancies("java")
+        api.get_vacancies("python")
+        api.get_vacancies("go")
+        self.assertEqual(cache.stats["entries"], 2)
+        api.get_vacancies("python")
+        api.get_vacancies("java")
+        api.close()
+        self.assertEqual(cache.stats["hits"], 2)
+        self.assertEqual(cache.stats["misses"], 3)
+
+
+class TestRequestScheduler(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server.pages = 1
+        self.server.delay = 0
+        self.sleeps = []
+
+    def make_scheduler(self, **kwargs) -> RequestScheduler:
+        kwargs.setdefault("requests_per_second", 1000)
+        return RequestScheduler(sleep=self.sleeps.append, **kwargs)
+
+    def test_retries_429_honoring_retry_after(self):
+        """Тест повтора после 429 с задержкой из Retry-After."""
+        self.server.failures = [(429, {"Retry-After": "2"}), (503, {})]
+        api = self.make_api(scheduler=self.make_scheduler(backoff_base=0.25))
+        vacancies = api.get_vacancies("python")
+        api.close()
+        self.assertEqual(len(vacancies), 2)
+        self.assertEqual(self.server.failed, 2)
+        self.assertEqual(self.sleeps[0], 2.0)
+        self.assertTrue(0 <= self.sleeps[1] <= 0.5)
+
+    def test_retries_exhausted(self):
+        """Тест исключения после исчерпания повторов."""
+        self.server.failures = [(500, {})] * 3
+        api = self.make_api(scheduler=self.make_scheduler(max_retries=2))
+        with self.assertRaises(APIRequestError):
+            api.get_vacancies("python")
+        api.close()
+        self.assertEqual(self.server.failed, 3)
+
+    def test_client_error_is_not_retried(self):
+        """Тест ошибки 4xx без повторов."""
+        self.server.failures = [(400, {})]
+        api = self.make_api(scheduler=self.make_scheduler())
+        with self.assertRaises(APIRequestError):
+            api.get_vacancies("python")
+        api.close()
+        self.assertEqual(self.server.failed, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_circuit_breaker_opens(self):
+        """Тест размыкания предохранителя после серии ошибок."""
+        self.server.failures = [(502, {})] * 2
+        scheduler = self.make_scheduler(max_retries=5, failure_threshold=2)
+        api = self.make_api(scheduler=scheduler)
+        with self.assertRaises(CircuitOpenError):
+            api.get_vacancies("python")
+        api.close()
+        self.assertEqual(self.server.failed, 2)
+        self.assertTrue(scheduler.breaker.is_open)
+
+    def test_large_retry_after_fails_fast(self):
+        """Тест отказа без ожидания, если Retry-After больше допустимой задержки."""
+        self.server.failures = [(429, {"Retry-After": "86400"})]
+        api = self.make_api(scheduler=self.make_scheduler(backoff_max=30))
+        with self.assertRaises(APIRequestError):
+            api.get_vacancies("python")
+        api.close()
+        self.assertEqual(self.sleeps, [])
+
+    def test_half_open_trial_released_on_any_request_error(self):
+        """Тест: любая ошибка пробного запроса освобождает предохранитель."""
+
+        class BrokenSession:
+            def request(self, *args, **kwargs):
+                raise requests.exceptions.ChunkedEncodingError("обрыв ответа")
+
+        scheduler = self.make_scheduler(max_retries=0, failure_threshold=1, reset_timeout=0)
+        for _ in range(3):
+            with self.assertRaises(APIRequestError) as context:
+                scheduler.request(BrokenSession(), "GET", self.base_url)
+            self.assertNotIsInstance(context.exception, CircuitOpenError)
+
+
+class TestRateLimitPrimitives(unittest.TestCase):
+    def test_token_bucket_rate(self):
+        """Тест ограничения частоты запросов ведром с жетонами."""
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=10, capacity=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(12):
+            bucket.acquire()
+        self.assertAlmostEqual(now[0], 1.0)
+        self.assertEqual(len(waits), 10)
+
+    def test_circuit_breaker_half_open(self):
+        """Тест пробного запроса после таймаута предохранителя."""
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        now[0] = 10
+        breaker.before_request()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+        breaker.before_request()
+
+
+if __name__ == "__main__":
+    unittest.main()
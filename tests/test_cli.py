@@ -0,0 +1,216 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from src.cli import ResultSelector, VacancyWriter, build_parser, main, search_options
+from src.db_connector import SQLiteSaver
+from src.file_connector import JSONLinesSaver, JSONSaver
+from src.vacancy import Vacancy
+from tests.test_api import StubServerTestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_vacancies():
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", "100000-150000 RUR", "Django и Kafka"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", "От 200000 RUR", "Spring"),
+        Vacancy("Python Lead", "https://hh.ru/vacancy/3", "От 300000 RUR", "Kafka"),
+        Vacancy("Аналитик", "https://hh.ru/vacancy/4", "Зарплата не указана", "SQL"),
+    ]
+
+
+class TestVacancyWriter(unittest.TestCase):
+    def test_json_is_valid_array(self):
+        """Тест: потоковый вывод JSON — корректный массив, в том числе пустой."""
+        output = io.StringIO()
+        writer = VacancyWriter(output, "json")
+        writer.write(make_vacancies()[:2])
+        writer.write(make_vacancies()[2:3])
+        writer.close()
+        data = json.loads(output.getvalue())
+        self.assertEqual([item["url"] for item in data], [
+            "https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3",
+        ])
+        self.assertEqual(writer.count, 3)
+
+        output = io.StringIO()
+        VacancyWriter(output, "json").close()
+        self.assertEqual(json.loads(output.getvalue()), [])
+
+    def test_csv_and_table(self):
+        """Тест вывода в CSV и в виде таблицы."""
+        output = io.StringIO()
+        writer = VacancyWriter(output, "csv")
+        writer.write(make_vacancies()[:1])
+        writer.close()
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0][:2], ["title", "url"])
+        self.assertEqual(rows[1][:5], ["Python Developer", "https://hh.ru/vacancy/1", "100000-150000 RUR",
+                                       "100000", "150000"])
+
+        output = io.StringIO()
+        writer = VacancyWriter(output, "table")
+        writer.write(make_vacancies()[:2])
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+        self.assertIn("https://hh.ru/vacancy/2", output.getvalue())
+
+        with self.assertRaises(ValueError):
+            VacancyWriter(io.StringIO(), "xml")
+
+
+class TestResultSelector(unittest.TestCase):
+    def test_streams_without_top(self):
+        """Тест: без топа подходящие вакансии выводятся сразу после каждой пачки."""
+        output = io.StringIO()
+        writer = VacancyWriter(output, "table")
+        selector = ResultSelector(writer, ["python"], "100000")
+        selector.add(make_vacancies()[:2])
+        self.assertEqual(writer.count, 1)
+        selector.add(make_vacancies()[2:])
+        self.assertEqual(selector.finish(), 2)
+
+    def test_top_across_batches(self):
+        """Тест: топ выбирается по всем пачкам, а не по каждой отдельно."""
+        writer = VacancyWriter(io.StringIO(), "json")
+        selector = ResultSelector(writer, top_n=2)
+        vacancies = make_vacancies()
+        for vacancy in vacancies:
+            selector.add([vacancy])
+        self.assertEqual(writer.count, 0)
+        self.assertEqual(selector.finish(), 2)
+
+
+class TestQueryCommand(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_main(self, argv):
+        output = io.StringIO()
+        with mock.patch("sys.stdout", output):
+            code = main(argv)
+        return code, output.getvalue()
+
+    def test_query_each_archive_format(self):
+        """Тест команды query для архивов JSON, JSON Lines и SQLite."""
+        for name, saver_class in [("a.json", JSONSaver), ("a.jsonl", JSONLinesSaver), ("a.db", SQLiteSaver)]:
+            filename = os.path.join(self.tmp_dir.name, name)
+            saver = saver_class(filename)
+            saver.add_vacancies(make_vacancies())
+            if isinstance(saver, SQLiteSaver):
+                saver.disconnect_from_db()
+            with self.subTest(archive=name):
+                code, text = self.run_main(["query", filename, "--keywords", "kafka", "--top", "1"])
+                self.assertEqual(code, 0)
+                self.assertEqual([item["url"] for item in json.loads(text)], ["https://hh.ru/vacancy/3"])
+
+    def test_query_missing_archive(self):
+        """Тест: отсутствующий архив не создаётся, команда завершается с кодом 1."""
+        filename = os.path.join(self.tmp_dir.name, "missing.json")
+        with mock.patch("sys.stderr", io.StringIO()):
+            code, text = self.run_main(["query", filename])
+        self.assertEqual(code, 1)
+        self.assertFalse(os.path.exists(filename))
+
+    def test_query_does_not_import_api(self):
+        """Тест: команда query не импортирует клиент hh.ru и requests."""
+        filename = os.path.join(self.tmp_dir.name, "a.jsonl")
+        JSONLinesSaver(filename).add_vacancies(make_vacancies())
+        code = (
+            "import sys; from src.cli import main; main(['query', sys.argv[1], '--format', 'csv']);"
+            "assert 'requests' not in sys.modules and 'src.api' not in sys.modules"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, filename], cwd=ROOT, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(len(result.stdout.splitlines()), 5)
+
+    def test_ingest_raw_dumps(self):
+        """Тест команды ingest: сырые ответы API загружаются в архив, ошибки — в stderr."""
+        dump = os.path.join(self.tmp_dir.name, "dump.jsonl")
+        with open(dump, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"items": [
+                {"name": "Python", "alternate_url": "https://hh.ru/vacancy/1"},
+                {"name": "", "alternate_url": "https://hh.ru/vacancy/2"},
+            ]}) + "\n")
+        archive = os.path.join(self.tmp_dir.name, "archive.db")
+        errors = io.StringIO()
+        with mock.patch("sys.stderr", errors):
+            code, _ = self.run_main(["ingest", dump, "--save", archive, "--workers", "1"])
+        self.assertEqual(code, 0)
+        self.assertIn("отклонено 1", errors.getvalue())
+        saver = SQLiteSaver(archive)
+        self.assertEqual([v.url for v in saver.get_vacancies()], ["https://hh.ru/vacancy/1"])
+        saver.disconnect_from_db()
+
+
+class TestSearchOptions(unittest.TestCase):
+    def test_arguments_override_config(self):
+        """Тест: аргументы командной строки важнее файла конфигурации."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"queries": ["python"], "areas": [1, 2], "top": 5, "format": "csv"}, f)
+        self.addCleanup(os.remove, f.name)
+        args = build_parser().parse_args(["search", "--config", f.name, "--top", "3"])
+        options = search_options(args)
+        self.assertEqual(options["queries"], ["python"])
+        self.assertEqual(options["areas"], [1, 2])
+        self.assertEqual(options["top"], 3)
+        self.assertEqual(options["format"], "csv")
+        self.assertEqual(options["workers"], 4)
+
+    def test_unknown_config_key(self):
+        """Тест: опечатка в файле конфигурации не проходит незамеченной."""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"querys": ["python"]}, f)
+        self.addCleanup(os.remove, f.name)
+        args = build_parser().parse_args(["search", "--config", f.name])
+        with self.assertRaises(ValueError):
+            search_options(args)
+
+
+class TestSearchCommand(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server.pages = 3
+        self.server.delay = 0.01
+
+    def test_search_streams_and_saves(self):
+        """Тест команды search: параллельные запросы, вывод без повторов и сохранение."""
+        api = self.make_api(max_workers=2)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "out.jsonl")
+            output = io.StringIO()
+            with mock.patch("src.api.HeadHunterAPI", return_value=api), \
+                    mock.patch("sys.stdout", output), mock.patch("sys.stderr", io.StringIO()):
+                code = main(["search", "python", "java", "--area", "1", "--area", "2",
+                             "--format", "csv", "--save", filename])
+            self.assertEqual(code, 0)
+            rows = list(csv.reader(io.StringIO(output.getvalue())))
+            self.assertEqual(len(rows), 7)
+            self.assertEqual(len(JSONLinesSaver(filename).get_vacancies()), 6)
+        self.assertEqual(len(self.server.requests), 12)
+
+    def test_search_reports_errors(self):
+        """Тест: ошибка запроса выводится в stderr, а код возврата равен 1."""
+        self.server.failures = [(400, {})]
+        api = self.make_api(max_workers=1)
+        errors = io.StringIO()
+        with mock.patch("src.api.HeadHunterAPI", return_value=api), \
+                mock.patch("sys.stdout", io.StringIO()), mock.patch("sys.stderr", errors):
+            code = main(["search", "python", "--workers", "1"])
+        self.assertEqual(code, 1)
+        self.assertIn("python", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.db_connector import SQLiteSaver
+from src.vacancy import Vacancy
+
+
+class TestSQLiteSaver(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.saver = SQLiteSaver(os.path.join(self.tmp_dir.name, "vacancies.db"), batch_size=2)
+        self.saver.add_vacancies([
+            Vacancy("Python Developer", "https://hh.ru/vacancy/1", "50000 руб.", "Django"),
+            Vacancy("Разработчик", "https://hh.ru/vacancy/2", "150000 руб.", "Опыт с PYTHON"),
+            Vacancy("Аналитик", "https://hh.ru/vacancy/3", "200000 руб.", "SQL, Excel"),
+        ])
+
+    def tearDown(self):
+        self.saver.disconnect_from_db()
+        self.tmp_dir.cleanup()
+
+    def test_upsert_by_url(self):
+        """Тест обновления вакансии с той же ссылкой."""
+        self.saver.add_vacancy(
+            Vacancy("Senior Python Developer", "https://hh.ru/vacancy/1", "90000 руб.", "")
+        )
+        vacancies = self.saver.get_vacancies()
+        self.assertEqual(len(vacancies), 3)
+        self.assertEqual(vacancies[0].title, "Senior Python Developer")
+        self.assertEqual(
+            [v.url for v in self.saver.get_vacancies({"keyword": "senior"})],
+            ["https://hh.ru/vacancy/1"],
+        )
+
+    def test_keyword_and_salary_criteria(self):
+        """Тест критериев keyword и salary_min на стороне базы."""
+        found = self.saver.get_vacancies({"keyword": "python"})
+        self.assertEqual([v.url for v in found], [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+        ])
+        found = self.saver.get_vacancies({"keyword": "python", "salary_min": 100000})
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/2"])
+        found = self.saver.get_vacancies({"keyword": "разраб"})
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/2"])
+
+    def test_short_keyword(self):
+        """Тест поиска по ключевому слову короче трёх символов."""
+        found = self.saver.get_vacancies({"keyword": "sq"})
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/3"])
+
+    def test_delete_and_reconnect(self):
+        """Тест удаления вакансии и сохранения данных между подключениями."""
+        self.saver.delete_vacancy(self.saver.get_vacancies()[0])
+        self.saver.disconnect_from_db()
+        self.saver.connect_to_db()
+        self.assertEqual(len(self.saver.get_vacancies()), 2)
+        self.assertEqual(self.saver.get_vacancies({"keyword": "django"}), [])
+
+    def test_upsert_keeps_loaded_details(self):
+        """Тест: краткая запись из поиска не затирает загруженные подробности."""
+        vacancy = self.saver.get_vacancies()[0]
+        self.saver.add_vacancy(vacancy.with_details("Полное описание", ["Django"]))
+        self.saver.add_vacancy(
+            Vacancy("Python Developer", vacancy.url, "60000 руб.", "Django")
+        )
+        stored = self.saver.get_vacancies()[0]
+        self.assertEqual(stored.key_skills, ("Django",))
+        self.assertEqual(stored.description, "Полное описание")
+        self.assertEqual(stored.salary_from, 60000)
+        self.assertEqual(stored.search_text, "python developer\nполное описание")
+
+    def test_keyword_uses_normalized_text(self):
+        """Тест поиска по ключу с учётом «ё» и регистра, в том числе коротких слов."""
+        self.saver.add_vacancy(Vacancy("Ёлочный дизайнер", "https://hh.ru/vacancy/7", "", "ИИ и ML"))
+        self.assertEqual(len(self.saver.get_vacancies({"keyword": "ЕЛОЧН"})), 1)
+        self.assertEqual(len(self.saver.get_vacancies({"keyword": "ии"})), 1)
+
+    def test_fts_of_previous_version_is_rebuilt(self):
+        """Тест пересоздания полнотекстового индекса старой версии по title и description."""
+        filename = os.path.join(self.tmp_dir.name, "old_fts.db")
+        connection = sqlite3.connect(filename)
+        connection.executescript(
+            "CREATE TABLE vacancies (url TEXT PRIMARY KEY, title TEXT NOT NULL, salary TEXT NOT NULL,"
+            " salary_value INTEGER NOT NULL, description TEXT NOT NULL, salary_from INTEGER,"
+            " salary_to INTEGER, currency TEXT, key_skills TEXT);"
+            "CREATE VIRTUAL TABLE vacancies_fts USING fts5(title, description, content='vacancies',"
+            " content_rowid='rowid', tokenize='trigram');"
+            "CREATE TRIGGER vacancies_ai AFTER INSERT ON vacancies BEGIN"
+            " INSERT INTO vacancies_fts (rowid, title, description)"
+            " VALUES (new.rowid, new.title, new.description); END;"
+            "INSERT INTO vacancies (url, title, salary, salary_value, description)"
+            " VALUES ('https://hh.ru/vacancy/8', 'Ёлочный дизайнер', 'Зарплата не указана', 0, 'Figma');"
+        )
+        connection.close()
+
+        saver = SQLiteSaver(filename)
+        self.assertEqual(len(saver.get_vacancies({"keyword": "елочный"})), 1)
+        saver.disconnect_from_db()
+
+    def test_migration_recomputes_salary(self):
+        """Тест пересчёта зарплаты в базе старой версии без колонок границ."""
+        filename = os.path.join(self.tmp_dir.name, "old.db")
+        connection = sqlite3.connect(filename)
+        connection.execute(
+            "CREATE TABLE vacancies (url TEXT PRIMARY KEY, title TEXT NOT NULL, "
+            "salary TEXT NOT NULL, salary_value INTEGER NOT NULL, description TEXT NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO vacancies VALUES (?, ?, ?, ?, ?)",
+            ("https://hh.ru/vacancy/9", "Python", "100000-150000 RUR", 100000150000, ""),
+        )
+        connection.commit()
+        connection.close()
+
+        saver = SQLiteSaver(filename)
+        vacancy = saver.get_vacancies()[0]
+        self.assertEqual(vacancy.search_text, "python\n")
+        self.assertEqual((vacancy.salary_from, vacancy.salary_to), (100000, 150000))
+        self.assertEqual(vacancy.currency, "RUR")
+        self.assertEqual(saver.get_vacancies({"salary_min": 200000}), [])
+        saver.disconnect_from_db()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.db_connector import SQLiteSaver
+from src.enrichment import VacancyEnricher, strip_html, vacancy_id_from_url
+from src.file_connector import JSONLinesSaver, JSONSaver
+from src.vacancy import Vacancy
+from tests.test_api import StubServerTestCase
+
+
+def make_vacancies(count: int) -> list:
+    return [
+        Vacancy(f"Vacancy {i}", f"https://hh.ru/vacancy/{i}", "100000 руб.", "Кратко")
+        for i in range(count)
+    ]
+
+
+class TestHelpers(unittest.TestCase):
+    def test_strip_html(self):
+        """Тест удаления разметки из описания вакансии."""
+        html = "<p>Ищем <b>Python</b>&nbsp;разработчика</p><ul><li>SQL</li><li>Git</li></ul>"
+        self.assertEqual(strip_html(html), "Ищем Python разработчика\nSQL\nGit")
+
+    def test_vacancy_id_from_url(self):
+        """Тест получения идентификатора вакансии из ссылки."""
+        self.assertEqual(vacancy_id_from_url("https://hh.ru/vacancy/123?query=x"), "123")
+        self.assertIsNone(vacancy_id_from_url("https://example.com/job"))
+
+
+class TestGetEnriched(unittest.TestCase):
+    def test_each_connector(self):
+        """Тест: хранилища отдают подробности только запрошенных вакансий."""
+        vacancies = make_vacancies(4)
+        vacancies[1] = vacancies[1].with_details("Полное описание", ["Python"])
+        vacancies[2] = vacancies[2].with_details("Другое описание", [])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name, saver_class in [("a.json", JSONSaver), ("a.jsonl", JSONLinesSaver), ("a.db", SQLiteSaver)]:
+                saver = saver_class(os.path.join(tmp_dir, name))
+                saver.add_vacancies(vacancies)
+                with self.subTest(connector=saver_class.__name__):
+                    urls = [v.url for v in vacancies[:2]] + ["https://hh.ru/vacancy/404"]
+                    enriched = saver.get_enriched(urls)
+                    self.assertEqual(list(enriched), ["https://hh.ru/vacancy/1"])
+                    self.assertEqual(enriched["https://hh.ru/vacancy/1"].key_skills, ("Python",))
+                    self.assertEqual(len(saver.get_enriched(v.url for v in vacancies)), 2)
+                if isinstance(saver, SQLiteSaver):
+                    saver.disconnect_from_db()
+
+
+class TestVacancyEnricher(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server.delay = 0.02
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.saver = JSONLinesSaver(os.path.join(self.tmp_dir.name, "vacancies.jsonl"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_enrich_with_bounded_pool(self):
+        """Тест загрузки подробностей ограниченным пулом в исходном порядке."""
+        api = self.make_api()
+        enricher = VacancyEnricher(api, max_workers=2)
+        vacancies = enricher.enrich(make_vacancies(10))
+        api.close()
+        self.assertEqual([v.url for v in vacancies], [v.url for v in make_vacancies(10)])
+        self.assertEqual(vacancies[3].key_skills, ("Python", "SQL"))
+        self.assertEqual(vacancies[3].description, "Полное описание 3\nPython")
+        self.assertEqual(enricher.stats["fetched"], 10)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+    def test_skips_vacancies_enriched_in_storage(self):
+        """Тест: подробности из хранилища не запрашиваются повторно."""
+        api = self.make_api()
+        VacancyEnricher(api, self.saver).enrich(make_vacancies(3))
+        self.assertEqual(len(self.server.detail_requests), 3)
+        self.assertTrue(all(v.is_enriched for v in self.saver.get_vacancies()))
+
+        # Повторный поиск сохраняет краткие записи, но подробности не теряются.
+        self.saver.add_vacancies(make_vacancies(4))
+        self.assertEqual(self.saver.get_vacancies()[0].key_skills, ("Python", "SQL"))
+
+        # Хранилище опрашивается по ссылкам пачки, а не читается целиком.
+        enricher = VacancyEnricher(api, self.saver, batch_size=2)
+        with mock.patch.object(self.saver, "get_vacancies", side_effect=AssertionError):
+            vacancies = enricher.enrich(make_vacancies(4))
+        api.close()
+        self.assertEqual(self.server.detail_requests[3:], ["3"])
+        self.assertEqual(enricher.stats["reused"], 3)
+        self.assertTrue(all(v.is_enriched for v in vacancies))
+
+    def test_failed_details_leave_vacancy_unchanged(self):
+        """Тест: вакансия без подробностей остаётся исходной."""
+        self.server.missing_details = {"1"}
+        api = self.make_api()
+        enricher = VacancyEnricher(api, self.saver)
+        vacancies = enricher.enrich(make_vacancies(2))
+        api.close()
+        self.assertTrue(vacancies[0].is_enriched)
+        self.assertFalse(vacancies[1].is_enriched)
+        self.assertEqual(vacancies[1].description, "Кратко")
+        self.assertEqual(enricher.stats["failed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
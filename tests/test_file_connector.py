@@ -0,0 +1,196 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.file_connector import JSONLinesSaver, JSONSaver, _iter_json_array
+from src.vacancy import Vacancy
+
+
+def make_vacancy(number: int, salary: str = "100000 руб.") -> Vacancy:
+    """Создаёт тестовую вакансию с уникальной ссылкой."""
+    return Vacancy(
+        f"Python Developer {number}",
+        f"https://hh.ru/vacancy/{number}",
+        salary,
+        "Требования...",
+    )
+
+
+class TestJSONSaver(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "data", "vacancies.json")
+        self.saver = JSONSaver(self.filename)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_add_vacancies_deduplicates_by_url(self):
+        """Тест пакетного добавления с заменой записей по ссылке."""
+        self.saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        self.saver.add_vacancies([make_vacancy(2, "200000 руб."), make_vacancy(3)])
+        vacancies = self.saver.get_vacancies()
+        self.assertEqual([v.url for v in vacancies], [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/3",
+        ])
+        self.assertEqual(vacancies[1].salary, "200000 руб.")
+
+    def test_add_vacancies_keeps_loaded_details(self):
+        """Тест: краткая запись из поиска не затирает загруженные подробности."""
+        self.saver.add_vacancy(make_vacancy(1).with_details("Полное описание", ["Python"]))
+        self.saver.add_vacancies([make_vacancy(1, "200000 руб.")])
+        vacancy = self.saver.get_vacancies()[0]
+        self.assertEqual(vacancy.salary, "200000 руб.")
+        self.assertEqual(vacancy.description, "Полное описание")
+        self.assertEqual(vacancy.key_skills, ("Python",))
+
+    def test_search_text_is_persisted(self):
+        """Тест: ключ поиска сохраняется в файле и используется для критериев."""
+        self.saver.add_vacancy(Vacancy("Менеджер", "https://hh.ru/vacancy/1", "", "Ведение ОТЧЁТОВ"))
+        with open(self.filename, "r", encoding="utf-8") as f:
+            record = json.load(f)[0]
+        self.assertEqual(record["search_text"], "менеджер\nведение отчетов")
+        self.assertEqual(len(self.saver.get_vacancies({"keyword": "Отчёт"})), 1)
+        self.assertEqual(len(JSONSaver(self.filename, use_index=True).get_vacancies({"keyword": "отчет"})), 1)
+
+    def test_iter_vacancies_applies_criteria_to_records(self):
+        """Тест потокового чтения с критериями, в том числе для старых записей."""
+        self.saver.add_vacancies([make_vacancy(1, "50000 руб."), make_vacancy(2, "150000 руб.")])
+        with open(self.filename, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        # Запись старого формата без разобранных границ зарплаты.
+        records.append({
+            "title": "Аналитик", "url": "https://hh.ru/vacancy/3",
+            "salary": "120000-150000 руб.", "description": "SQL",
+        })
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+        found = self.saver.iter_vacancies({"salary_min": 100000})
+        self.assertNotIsInstance(found, list)
+        self.assertEqual([v.url for v in found], [
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/3",
+        ])
+        self.assertEqual(
+            [v.url for v in self.saver.get_vacancies({"keyword": "sql", "salary_min": 100000})],
+            ["https://hh.ru/vacancy/3"],
+        )
+
+    def test_iter_json_array_by_small_chunks(self):
+        """Тест разбора JSON-массива кусками меньше одного элемента."""
+        data = [{"title": "Вакансия, [1]", "n": 12345}, 3.5e10, None, [1, [2]]]
+        text = json.dumps(data, ensure_ascii=False, indent=4)
+        self.assertEqual(list(_iter_json_array(io.StringIO(text), chunk_size=3)), data)
+        with self.assertRaises(ValueError):
+            list(_iter_json_array(io.StringIO("[1, 2"), chunk_size=3))
+
+    def test_add_vacancy_and_delete(self):
+        """Тест добавления и удаления одной вакансии."""
+        self.saver.add_vacancy(make_vacancy(1))
+        self.saver.add_vacancy(make_vacancy(1))
+        self.assertEqual(len(self.saver.get_vacancies()), 1)
+        self.saver.delete_vacancy(make_vacancy(1))
+        self.assertEqual(self.saver.get_vacancies(), [])
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        """Тест атомарной записи без временных файлов."""
+        self.saver.add_vacancies(make_vacancy(i) for i in range(10))
+        directory = os.path.dirname(self.filename)
+        self.assertEqual(os.listdir(directory), ["vacancies.json"])
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)), 10)
+
+    def test_get_vacancies_by_criteria(self):
+        """Тест фильтрации сохранённых вакансий по критериям."""
+        self.saver.add_vacancies([
+            make_vacancy(1, "50000 руб."),
+            make_vacancy(2, "150000 руб."),
+        ])
+        found = self.saver.get_vacancies({"keyword": "developer", "salary_min": 100000})
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/2"])
+
+
+class TestJSONLinesSaver(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "vacancies.jsonl")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def count_lines(self) -> int:
+        with open(self.filename, encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def test_add_appends_lines(self):
+        """Тест добавления вакансий дописыванием строк."""
+        saver = JSONLinesSaver(self.filename)
+        saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        saver.add_vacancy(make_vacancy(2, "200000 руб."))
+        self.assertEqual(self.count_lines(), 3)
+        vacancies = saver.get_vacancies()
+        self.assertEqual([v.url for v in vacancies], [
+            "https://hh.ru/vacancy/1",
+            "https://hh.ru/vacancy/2",
+        ])
+        self.assertEqual(vacancies[1].salary, "200000 руб.")
+
+    def test_delete_writes_tombstone_and_survives_reopen(self):
+        """Тест удаления через надгробие и повторного открытия файла."""
+        saver = JSONLinesSaver(self.filename)
+        saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        saver.delete_vacancy(make_vacancy(1))
+        self.assertEqual(self.count_lines(), 3)
+        reopened = JSONLinesSaver(self.filename)
+        self.assertEqual([v.url for v in reopened.iter_vacancies()], ["https://hh.ru/vacancy/2"])
+
+    def test_compact_by_threshold(self):
+        """Тест автоматического сжатия при превышении доли надгробий."""
+        saver = JSONLinesSaver(self.filename, compact_threshold=0.5, compact_min_lines=4)
+        saver.add_vacancies(make_vacancy(i) for i in range(3))
+        saver.delete_vacancy(make_vacancy(0))
+        self.assertEqual(self.count_lines(), 4)
+        saver.delete_vacancy(make_vacancy(1))
+        self.assertEqual(self.count_lines(), 1)
+        self.assertEqual(saver.stale_ratio, 0.0)
+        saver.add_vacancy(make_vacancy(5))
+        self.assertEqual(
+            [v.url for v in JSONLinesSaver(self.filename).get_vacancies()],
+            ["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/5"],
+        )
+
+    def test_criteria(self):
+        """Тест фильтрации по критериям при потоковом чтении."""
+        saver = JSONLinesSaver(self.filename)
+        saver.add_vacancies([make_vacancy(1, "50000 руб."), make_vacancy(2, "150000 руб.")])
+        found = saver.get_vacancies({"salary_min": 100000})
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/2"])
+
+    def test_torn_last_line_is_dropped(self):
+        """Тест открытия файла с недописанной последней строкой."""
+        saver = JSONLinesSaver(self.filename)
+        saver.add_vacancies([make_vacancy(1), make_vacancy(2)])
+        with open(self.filename, "ab") as f:
+            f.write(b'{"title": "Vacancy 3", "url": "https://hh.')
+        reopened = JSONLinesSaver(self.filename)
+        self.assertEqual(self.count_lines(), 2)
+        reopened.add_vacancy(make_vacancy(3))
+        self.assertEqual(len(JSONLinesSaver(self.filename).get_vacancies()), 3)
+
+    def test_append_after_line_without_newline(self):
+        """Тест дозаписи в файл, последняя строка которого без перевода строки."""
+        saver = JSONLinesSaver(self.filename)
+        saver.add_vacancy(make_vacancy(1))
+        with open(self.filename, "rb+") as f:
+            f.truncate(os.path.getsize(self.filename) - 1)
+        saver.add_vacancy(make_vacancy(2))
+        self.assertEqual(self.count_lines(), 2)
+        self.assertEqual(len(JSONLinesSaver(self.filename).get_vacancies()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from src.db_connector import SQLiteSaver
+from src.api import RequestScheduler
+from src.harvester import Harvester
+from tests.test_api import StubServerTestCase
+
+
+class FakeAPI:
+    """Клиент-заглушка, отдающий одну страницу с некорректными вакансиями."""
+
+    def iter_pages(self, keyword, extra_params=None):
+        yield [
+            {"name": f"{keyword} developer", "alternate_url": f"https://hh.ru/vacancy/{keyword}"},
+            {"name": "", "alternate_url": "https://hh.ru/vacancy/empty"},
+            {"name": "Без ссылки"},
+        ]
+
+
+class TestHarvester(StubServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server.pages = 3
+        self.server.delay = 0.01
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.saver = SQLiteSaver(os.path.join(self.tmp_dir.name, "vacancies.db"))
+
+    def tearDown(self):
+        self.saver.disconnect_from_db()
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_make_jobs(self):
+        """Тест составления заданий из сочетаний запросов, регионов и фильтров."""
+        jobs = Harvester.make_jobs(["python", "java"], [1, 2], [{}, {"schedule": "remote"}])
+        self.assertEqual(len(jobs), 8)
+        self.assertIn(("java", {"area": 2, "schedule": "remote"}), jobs)
+        self.assertEqual(Harvester.make_jobs(["go"]), [("go", {})])
+
+    def test_harvest_deduplicates_across_jobs(self):
+        """Тест сбора по нескольким заданиям без повторов в хранилище."""
+        api = self.make_api(max_workers=2)
+        harvester = Harvester(api, self.saver, max_workers=3, queue_size=2)
+        stats = harvester.harvest(["python", "java"], areas=[1, 2])
+        api.close()
+        self.assertEqual(stats["jobs"], 4)
+        self.assertEqual(stats["fetched"], 24)
+        self.assertEqual(stats["saved"], 6)
+        self.assertEqual(stats["duplicates"], 18)
+        self.assertEqual(stats["errors"], [])
+        self.assertEqual(len(self.saver.get_vacancies()), 6)
+        areas = {query["area"][0] for query in self.server.requests}
+        self.assertEqual(areas, {"1", "2"})
+
+    def test_failed_job_does_not_stop_others(self):
+        """Тест: ошибка одного задания попадает в статистику, остальные выполняются."""
+        self.server.failures = [(400, {})]
+        api = self.make_api(max_workers=1)
+        stats = Harvester(api, self.saver, max_workers=1).harvest(["python", "java"])
+        api.close()
+        self.assertEqual(len(stats["errors"]), 1)
+        self.assertEqual(stats["errors"][0][0], ("python", {}))
+        self.assertEqual(stats["saved"], 6)
+
+    def test_invalid_vacancies_are_rejected(self):
+        """Тест: некорректная вакансия пропускается, а не прерывает все задания."""
+        stats = Harvester(FakeAPI(), self.saver, max_workers=2).harvest(["python", "java"])
+        self.assertEqual(stats["fetched"], 6)
+        self.assertEqual(stats["saved"], 2)
+        self.assertEqual(stats["rejected"], 4)
+        self.assertEqual(stats["errors"], [])
+
+    def test_connection_pool_fits_scheduler(self):
+        """Тест: пул соединений вмещает все запросы, пропускаемые планировщиком."""
+        scheduler = RequestScheduler(requests_per_second=1000, max_concurrency=6)
+        api = self.make_api(max_workers=2, scheduler=scheduler)
+        with self.assertNoLogs("urllib3.connectionpool", level="WARNING"):
+            Harvester(api, self.saver, max_workers=3).harvest(["python", "java", "go"])
+        api.close()
+        self.assertGreater(self.server.max_in_flight, 2)
+
+    def test_on_batch_without_connector(self):
+        """Тест: без хранилища новые вакансии только передаются в on_batch."""
+        api = self.make_api(max_workers=2)
+        batches = []
+        stats = Harvester(api, None, max_workers=2).harvest(["python", "java"], on_batch=batches.append)
+        api.close()
+        urls = [vacancy.url for batch in batches for vacancy in batch]
+        self.assertEqual(len(urls), 6)
+        self.assertEqual(len(set(urls)), 6)
+        self.assertEqual(stats["saved"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
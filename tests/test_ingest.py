@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.file_connector import JSONLinesSaver
+from src.ingest import ParallelIngestor
+
+
+def make_item(number: int, **fields) -> dict:
+    """Вакансия в формате элемента выдачи поиска hh.ru."""
+    item = {
+        "id": str(number),
+        "name": f"Python Developer {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "salary": {"from": 1000 * number, "to": None, "currency": "RUR"},
+        "snippet": {"requirement": "Django"},
+    }
+    item.update(fields)
+    return item
+
+
+class TestParallelIngestor(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = []
+        self.write("page.json", {"items": [make_item(1), make_item(2, alternate_url="ftp://bad")], "pages": 1})
+        self.write("pages.json", [{"items": [make_item(3)]}, {"items": [make_item(1), make_item(4)]}])
+        lines = [
+            json.dumps({"items": [make_item(5), make_item(6)]}),
+            json.dumps(make_item(7)),
+            "{не JSON",
+            "",
+            json.dumps(make_item(8, name="")),
+            json.dumps(make_item(5)),
+        ] + [json.dumps(make_item(number)) for number in range(9, 40)]
+        self.write("items.jsonl", "\n".join(lines) + "\n")
+        self.write("broken.json", "[{")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, data) -> None:
+        filename = os.path.join(self.tmp_dir.name, name)
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        self.files.append(filename)
+
+    def test_rejects_are_reported_and_duplicates_dropped(self):
+        """Тест: некорректные записи собираются, повторы по ссылке отбрасываются."""
+        ingestor = ParallelIngestor(max_workers=1, shard_size=64)
+        urls = [vacancy.url for vacancy in ingestor.iter_vacancies(self.files)]
+        expected = [1, 3, 4, 5, 6, 7] + list(range(9, 40))
+        self.assertEqual(urls, [f"https://hh.ru/vacancy/{number}" for number in expected])
+        self.assertEqual(ingestor.stats["duplicates"], 2)
+        self.assertEqual(ingestor.stats["rejected"], 4)
+        sources = sorted(os.path.basename(reject[0]) for reject in ingestor.rejects)
+        self.assertEqual(sources, ["broken.json", "items.jsonl", "items.jsonl", "page.json"])
+        self.assertTrue(any("ссылка" in reject[2] for reject in ingestor.rejects))
+
+    def test_shard_boundaries_do_not_lose_or_repeat_lines(self):
+        """Тест: при любом размере частей каждая строка JSON Lines разбирается один раз."""
+        filename = self.files[2]
+        expected = [v.url for v in ParallelIngestor(max_workers=1).iter_vacancies([filename])]
+        for shard_size in (1, 7, 50, 333, 10 ** 6):
+            ingestor = ParallelIngestor(max_workers=1, shard_size=shard_size)
+            found = [v.url for v in ingestor.iter_vacancies([filename])]
+            self.assertEqual(found, expected, shard_size)
+            self.assertEqual(ingestor.stats["duplicates"], 1)
+
+    def test_process_pool_matches_single_process(self):
+        """Тест: пул процессов даёт тот же результат, что и разбор в одном процессе."""
+        single = ParallelIngestor(max_workers=1, shard_size=100)
+        expected = [v.to_dict() for v in single.iter_vacancies(self.files)]
+        pool = ParallelIngestor(max_workers=2, shard_size=100)
+        self.assertEqual([v.to_dict() for v in pool.iter_vacancies(self.files)], expected)
+        self.assertEqual(sorted(pool.rejects), sorted(single.rejects))
+
+    def test_ingest_into_connector(self):
+        """Тест загрузки файлов и страниц в хранилище пачками."""
+        saver = JSONLinesSaver(os.path.join(self.tmp_dir.name, "out", "vacancies.jsonl"))
+        stats = ParallelIngestor(saver, max_workers=2).ingest(self.files, batch_size=10)
+        self.assertEqual(stats["saved"], 37)
+        self.assertEqual(len(saver.get_vacancies()), 37)
+
+        pages = [[make_item(100), make_item(101)], [make_item(100), {"name": "Без ссылки"}]]
+        ingestor = ParallelIngestor(saver, max_workers=2)
+        stats = ingestor.ingest_pages(pages, batch_size=10)
+        self.assertEqual((stats["saved"], stats["duplicates"], stats["rejected"]), (2, 1, 1))
+        self.assertEqual(ingestor.rejects[0][:2], ("pages", 1))
+        self.assertEqual(len(saver.get_vacancies()), 39)
+
+        with self.assertRaises(ValueError):
+            ParallelIngestor(max_workers=1).ingest(self.files)
+
+
+if __name__ == "__main__":
+    unittest.main()
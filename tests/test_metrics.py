@@ -0,0 +1,87 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src import metrics
+from src.file_connector import JSONSaver
+from src.utils import filter_vacancies, sort_vacancies
+from src.vacancy import Vacancy
+
+RAW = [
+    {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1",
+     "salary": {"from": 100000, "currency": "RUR"}, "snippet": {"requirement": "Django"}},
+    {"name": "Java Developer", "alternate_url": "https://hh.ru/vacancy/2",
+     "salary": None, "snippet": {"requirement": "Spring"}},
+]
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_disabled_by_default(self):
+        """Тест: без приёмников инструментация не включена и не мешает вызовам."""
+        self.assertFalse(metrics.enabled())
+        with metrics.timer("noop") as timing:
+            timing.records = 5
+        self.assertEqual(len(Vacancy.cast_to_object_list(RAW)), 2)
+
+    def test_in_memory_sink_collects_stages(self):
+        """Тест сбора времени, вызовов, записей и байт по этапам."""
+        sink = metrics.InMemorySink()
+        metrics.add_sink(sink)
+        try:
+            vacancies = Vacancy.cast_to_object_list(RAW)
+            filter_vacancies(vacancies, ["django"])
+            sort_vacancies(vacancies)
+            saver = JSONSaver(os.path.join(self.tmp_dir.name, "vacancies.json"))
+            saver.add_vacancies(vacancies)
+            saver.get_vacancies()
+        finally:
+            metrics.remove_sink(sink)
+        stages = sink.snapshot()
+        self.assertEqual(stages["vacancy.cast_to_object_list"]["records"], 2)
+        self.assertEqual(stages["utils.filter_vacancies"]["records"], 1)
+        self.assertEqual(stages["utils.sort_vacancies"]["calls"], 1)
+        self.assertEqual(stages["json_saver.write"]["records"], 2)
+        self.assertGreater(stages["json_saver.write"]["bytes"], 0)
+        self.assertEqual(stages["json_saver.read"]["records"], 2)
+        self.assertIn("json_saver.read", sink.report())
+        self.assertFalse(metrics.enabled())
+
+    def test_json_log_and_prometheus_sinks(self):
+        """Тест журнала JSON и файла в текстовом формате Prometheus."""
+        log_path = os.path.join(self.tmp_dir.name, "metrics.jsonl")
+        prom_path = os.path.join(self.tmp_dir.name, "metrics.prom")
+        sinks = [metrics.make_sink(f"json:{log_path}"), metrics.make_sink(f"prometheus:{prom_path}")]
+        output = io.StringIO()
+        metrics.run_instrumented(lambda: Vacancy.cast_to_object_list(RAW), sinks, report_output=output)
+        with open(log_path, encoding="utf-8") as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual(events[0]["stage"], "vacancy.cast_to_object_list")
+        self.assertEqual(events[0]["records"], 2)
+        with open(prom_path, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn('vacancies_stage_records_total{stage="vacancy.cast_to_object_list"} 2', text)
+        self.assertIn("# TYPE vacancies_stage_seconds_total counter", text)
+        with self.assertRaises(ValueError):
+            metrics.make_sink("statsd:localhost")
+
+    def test_profile_report(self):
+        """Тест отчётов cProfile и tracemalloc."""
+        for mode, marker in (("cpu", "cumulative"), ("memory", "Память")):
+            output = io.StringIO()
+            result = metrics.run_instrumented(
+                lambda: Vacancy.cast_to_object_list(RAW), profile=mode, report_output=output
+            )
+            self.assertEqual(len(result), 2)
+            self.assertIn(marker, output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
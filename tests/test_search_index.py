@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+
+from src.file_connector import JSONSaver
+from src.search_index import (InvertedIndex, build_vacancy_index, normalize_keyword,
+                              normalize_text, stem_word, tokenize)
+from src.utils import filter_vacancies
+from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+
+def make_vacancies() -> list:
+    """Набор вакансий для тестов."""
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", "", "Django, PostgreSQL"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", "", "Spring Boot"),
+        Vacancy("Аналитик данных", "https://hh.ru/vacancy/3", "", "SQL и Python"),
+    ]
+
+
+class TestInvertedIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = build_vacancy_index(make_vacancies())
+
+    def test_any_and_all(self):
+        """Тест поиска с семантикой ИЛИ и И."""
+        self.assertEqual(
+            self.index.search(["python", "spring"]),
+            ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3"],
+        )
+        self.assertEqual(
+            self.index.search(["python", "sql"], mode="all"),
+            ["https://hh.ru/vacancy/3"],
+        )
+
+    def test_substring_fallback(self):
+        """Тест поиска подстрок только при явном включении."""
+        self.assertEqual(self.index.search(["postgres"]), [])
+        self.assertEqual(self.index.search(["postgres"], substring=True), ["https://hh.ru/vacancy/1"])
+        self.assertEqual(self.index.search(["data"], substring=True), [])
+        self.assertEqual(self.index.search(["go, post"], substring=True), ["https://hh.ru/vacancy/1"])
+
+    def test_incremental_update(self):
+        """Тест обновления индекса при добавлении и удалении документов."""
+        index = InvertedIndex()
+        index.add(1, "Python")
+        index.add(2, "Go")
+        index.add(1, "Rust")
+        self.assertEqual(index.search(["python"]), [])
+        self.assertEqual(index.search(["rust", "go"]), [1, 2])
+        index.remove(2)
+        self.assertEqual(index.search(["go"]), [])
+        self.assertEqual(len(index), 1)
+
+
+class TestIndexedFiltering(unittest.TestCase):
+    def test_filter_vacancies_with_index(self):
+        """Тест фильтрации списка и таблицы через индекс."""
+        vacancies = make_vacancies()
+        index = build_vacancy_index(vacancies)
+        found = filter_vacancies(vacancies[:2], ["python", "sql"], index=index)
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/1"])
+        table = VacancyTable(vacancies)
+        found = filter_vacancies(table, ["python", "sql"], mode="all", substring=False)
+        self.assertEqual([v.url for v in found], ["https://hh.ru/vacancy/3"])
+        table.append(Vacancy("SQL Python", "https://hh.ru/vacancy/4", "", ""))
+        found = filter_vacancies(table, ["python", "sql"], mode="all", substring=False)
+        self.assertEqual(len(found), 2)
+
+    def test_same_semantics_for_list_and_table(self):
+        """Тест одинаковых результатов для списка и таблицы в обоих режимах."""
+        vacancies = make_vacancies()
+        cases = [(["develop"], "any"), (["postgres", "spring"], "any"), (["sql", "pyth"], "all")]
+        for keywords, mode in cases:
+            for substring in (True, False):
+                expected = [
+                    v.url for v in filter_vacancies(vacancies, keywords, mode, substring=substring)
+                ]
+                found = filter_vacancies(VacancyTable(vacancies), keywords, mode, substring=substring)
+                self.assertEqual([v.url for v in found], expected)
+        self.assertEqual(len(filter_vacancies(VacancyTable(vacancies), ["develop"])), 2)
+        self.assertEqual(filter_vacancies(vacancies, ["develop"], substring=False), [])
+
+    def test_json_saver_index_follows_changes(self):
+        """Тест индекса JSONSaver при добавлении, удалении и внешнем изменении файла."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "vacancies.json")
+            saver = JSONSaver(filename, use_index=True)
+            saver.add_vacancies(make_vacancies())
+            self.assertEqual(len(saver.get_vacancies({"keyword": "develop"})), 2)
+            saver.add_vacancy(Vacancy("Go Developer", "https://hh.ru/vacancy/4", "", ""))
+            saver.delete_vacancy(make_vacancies()[1])
+            found = saver.get_vacancies({"keyword": "develop"})
+            self.assertEqual([v.url[-1] for v in found], ["1", "4"])
+            JSONSaver(filename).add_vacancy(
+                Vacancy("Python Developer", "https://hh.ru/vacancy/5", "", "")
+            )
+            self.assertEqual(len(saver.get_vacancies({"keyword": "python"})), 3)
+
+
+class TestNormalization(unittest.TestCase):
+    def test_normalize_text(self):
+        """Тест нормализации: casefold, NFKC и «ё» -> «е»."""
+        self.assertEqual(normalize_text("ЁЛКА Straße"), "елка strasse")
+        self.assertEqual(normalize_text("Ｐｙｔｈｏｎ ﬁle"), "python file")
+        self.assertEqual(normalize_text("㎒"), "mhz")
+        for text in ["Ёж", "Ｐｙｔｈｏｎ", "İstanbul", "㎒ ß"]:
+            self.assertEqual(normalize_text(normalize_text(text)), normalize_text(text))
+
+    def test_stemming(self):
+        """Тест отсечения окончаний у ключевых слов."""
+        self.assertEqual(stem_word("разработчиками"), "разработчик")
+        self.assertEqual(stem_word("разработчика"), "разработчик")
+        self.assertEqual(stem_word("java"), "java")
+        self.assertEqual(normalize_keyword("Разработчиков", stem=True), "разработчик")
+        self.assertEqual(normalize_keyword("Senior разработчика", stem=True), "senior разработчика")
+        self.assertEqual(tokenize("Ёлка, ПИТОН"), ["елка", "питон"])
+
+    def test_index_ignores_case_and_yo(self):
+        """Тест: индекс находит слово независимо от регистра и «ё»."""
+        index = build_vacancy_index([
+            Vacancy("Сотрудник колл-центра", "https://hh.ru/vacancy/1", "", "Пишем ЁМКИЕ тексты"),
+        ])
+        self.assertEqual(index.search(["емкие"]), ["https://hh.ru/vacancy/1"])
+        self.assertEqual(index.search(["КОЛЛ-ЦЕНТР"], substring=True), ["https://hh.ru/vacancy/1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
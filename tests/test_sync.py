@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from src.file_connector import JSONSaver
+from src.sync import VacancySync
+
+
+def make_item(number: int, published_at: str) -> dict:
+    return {
+        "id": str(number),
+        "name": f"Vacancy {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "published_at": published_at,
+    }
+
+
+class FakeAPI:
+    """Клиент-заглушка, учитывающий фильтр date_from как hh.ru."""
+
+    def __init__(self, items, max_items=None):
+        self.items = items
+        self.max_items = max_items
+        self.calls = []
+
+    def iter_pages(self, keyword, extra_params=None, info=None):
+        params = dict(extra_params or {})
+        self.calls.append((keyword, params))
+        date_from = params.get("date_from")
+        items = [item for item in self.items if date_from is None or item["published_at"] >= date_from]
+        items.sort(key=lambda item: item["published_at"], reverse=True)
+        if info is not None:
+            info["found"] = len(items)
+            info["truncated"] = self.max_items is not None and len(items) > self.max_items
+        items = items[:self.max_items]
+        for start in range(0, len(items), 2):
+            yield items[start:start + 2]
+
+
+class TestVacancySync(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.saver = JSONSaver(os.path.join(self.tmp_dir.name, "vacancies.json"))
+        self.state_file = os.path.join(self.tmp_dir.name, "sync_state.json")
+        self.api = FakeAPI([
+            make_item(1, "2024-05-01T10:00:00+0300"),
+            make_item(2, "2024-05-01T12:00:00+0300"),
+            make_item(3, "2024-05-01T12:00:00+0300"),
+        ])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_sync(self) -> VacancySync:
+        return VacancySync(self.api, self.saver, self.state_file)
+
+    def test_second_run_fetches_only_delta(self):
+        """Тест повторного запуска: сохраняются только новые вакансии."""
+        stats = self.make_sync().sync("python", {"area": 2})
+        self.assertEqual(stats["saved"], 3)
+        self.assertEqual(stats["watermark"], "2024-05-01T12:00:00+0300")
+
+        self.api.items.append(make_item(4, "2024-05-02T09:00:00+0300"))
+        stats = self.make_sync().sync("Python ", {"area": 2})
+        self.assertEqual(self.api.calls[-1][1]["date_from"], "2024-05-01T12:00:00+0300")
+        self.assertEqual(self.api.calls[-1][1]["area"], 2)
+        self.assertEqual(stats["fetched"], 3)
+        self.assertEqual(stats["saved"], 1)
+        self.assertEqual(len(self.saver.get_vacancies()), 4)
+
+        stats = self.make_sync().sync("python", {"area": 2})
+        self.assertEqual(stats["saved"], 0)
+
+    def test_expire_removes_missing_vacancies(self):
+        """Тест удаления вакансий, которых больше нет в выдаче."""
+        sync = self.make_sync()
+        sync.sync("python")
+        sync.sync("java")
+        self.api.items = [item for item in self.api.items if item["id"] != "1"]
+        stats = sync.sync("python", expire=True)
+        # Вакансия 1 всё ещё числится в выдаче запроса java.
+        self.assertEqual(stats["expired"], 0)
+        stats = sync.sync("java", expire=True)
+        self.assertEqual(stats["expired"], 1)
+        self.assertEqual(stats["saved"], 0)
+        self.assertEqual(
+            sorted(v.url for v in self.saver.get_vacancies()),
+            ["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3"],
+        )
+
+    def test_truncated_result_keeps_watermark_and_vacancies(self):
+        """Тест: усечённая выдача не удаляет живые вакансии и не сдвигает водяной знак."""
+        self.api.items = [make_item(n, f"2024-05-{n:02d}T10:00:00+0300") for n in range(1, 11)]
+        sync = self.make_sync()
+        stats = sync.sync("python")
+        self.assertFalse(stats["truncated"])
+        self.assertEqual(stats["saved"], 10)
+
+        self.api.max_items = 5
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            stats = sync.sync("python", expire=True)
+        self.assertTrue(stats["truncated"])
+        self.assertEqual(stats["expired"], 0)
+        self.assertEqual(len(self.saver.get_vacancies()), 10)
+        self.assertTrue(any(issubclass(w.category, RuntimeWarning) for w in caught))
+
+        self.api.items = [make_item(n, f"2024-06-{n - 10:02d}T10:00:00+0300") for n in range(11, 19)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            stats = sync.sync("python")
+        self.assertTrue(stats["truncated"])
+        self.assertEqual(stats["saved"], 5)
+        self.assertEqual(stats["watermark"], "2024-05-10T10:00:00+0300")
+
+        # Следующий запуск с прежним водяным знаком дочитывает пропущенное
+        # и заново записывает всё, что новее него.
+        self.api.max_items = None
+        stats = sync.sync("python")
+        self.assertFalse(stats["truncated"])
+        self.assertEqual(stats["saved"], 8)
+        self.assertEqual(stats["watermark"], "2024-06-08T10:00:00+0300")
+        self.assertEqual(len(self.saver.get_vacancies()), 18)
+
+    def test_sync_saved_queries(self):
+        """Тест повторной синхронизации всех сохранённых запросов."""
+        self.make_sync().sync("python")
+        self.make_sync().sync("java", {"area": 1})
+        results = self.make_sync().sync_saved()
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(stats["saved"] == 0 for stats in results.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from unittest import mock
+
+from src import utils
+from src.utils import (filter_vacancies, get_top_vacancies,
+                       get_vacancies_by_salary, sort_vacancies,
+                       top_vacancies_by_salary)
+from src.vacancy import Vacancy
+from src.vacancy_table import VacancyTable
+
+
+def make_vacancies() -> list:
+    """Набор вакансий для тестов."""
+    return [
+        Vacancy("Python Developer", "https://hh.ru/vacancy/1", "100000-150000 RUR", "Django"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/2", "От 200000 RUR", "Spring"),
+        Vacancy("Аналитик", "https://hh.ru/vacancy/3", "", "SQL и немного Python"),
+        Vacancy("QA Engineer", "https://hh.ru/vacancy/4", "До 120000 RUR", "Тестирование"),
+    ]
+
+
+class TestUtils(unittest.TestCase):
+    def test_filter_vacancies(self):
+        """Тест фильтрации по ключевым словам для списка и таблицы."""
+        for vacancies in (make_vacancies(), VacancyTable(make_vacancies())):
+            found = filter_vacancies(vacancies, ["python", "spring"])
+            self.assertEqual([v.url[-1] for v in found], ["1", "2", "3"])
+
+    def test_filter_normalizes_and_stems(self):
+        """Тест: регистр и «ё» не важны, а окончания отсекаются по запросу."""
+        vacancies = make_vacancies() + [
+            Vacancy("Ведущий разработчик", "https://hh.ru/vacancy/5", "", "Учёт и ОТЧЁТНОСТЬ"),
+        ]
+        for items in (vacancies, VacancyTable(vacancies)):
+            self.assertEqual([v.url[-1] for v in filter_vacancies(items, ["отчетность"])], ["5"])
+            self.assertEqual(len(filter_vacancies(items, ["разработчика"])), 0)
+            found = filter_vacancies(items, ["разработчика"], stem=True)
+            self.assertEqual([v.url[-1] for v in found], ["5"])
+
+    def test_get_vacancies_by_salary(self):
+        """Тест фильтрации по диапазону зарплат для списка и таблицы."""
+        for vacancies in (make_vacancies(), VacancyTable(make_vacancies())):
+            found = get_vacancies_by_salary(vacancies, "100000 - 150000")
+            self.assertEqual([v.url[-1] for v in found], ["1", "4"])
+            found = get_vacancies_by_salary(vacancies, "150000")
+            self.assertEqual([v.url[-1] for v in found], ["2"])
+            self.assertEqual(len(get_vacancies_by_salary(vacancies, "много")), 4)
+
+    def test_sort_and_top(self):
+        """Тест сортировки по убыванию зарплаты и выбора топ N."""
+        for vacancies in (make_vacancies(), VacancyTable(make_vacancies())):
+            top = get_top_vacancies(sort_vacancies(vacancies), 3)
+            self.assertEqual([v.url[-1] for v in top], ["2", "4", "1"])
+
+    def test_top_by_salary_matches_full_sort(self):
+        """Тест выбора топ N без сортировки: совпадает с сортировкой, ничьи по порядку."""
+        rnd = random.Random(1)
+        vacancies = [
+            Vacancy(f"Dev {i}", f"https://hh.ru/vacancy/{i}", f"От {rnd.choice([0, 1, 2, 3]) * 50000} RUR", "")
+            for i in range(200)
+        ]
+        table = VacancyTable(vacancies)
+        for numpy_module in (utils.np, None):
+            with mock.patch.object(utils, "np", numpy_module):
+                for top_n in (0, 1, 7, 60, 200, 500):
+                    expected = [v.url for v in sort_vacancies(vacancies)[:top_n]]
+                    for form in (vacancies, table):
+                        top = top_vacancies_by_salary(form, top_n)
+                        self.assertEqual([v.url for v in top], expected)
+                expected = [v.url for v in sort_vacancies(
+                    get_vacancies_by_salary(vacancies, "50000 - 100000"))[:15]]
+                for form in (vacancies, table):
+                    top = top_vacancies_by_salary(form, 15, "50000 - 100000")
+                    self.assertEqual([v.url for v in top], expected)
+                    self.assertEqual(
+                        [v.url for v in sort_vacancies(form)],
+                        [v.url for v in sort_vacancies(vacancies)],
+                    )
+
+
+class TestVacancyTable(unittest.TestCase):
+    def test_views(self):
+        """Тест выдачи строк таблицы как объектов Vacancy."""
+        table = VacancyTable(make_vacancies())
+        self.assertEqual(len(table), 4)
+        vacancy = table[-1]
+        self.assertIsInstance(vacancy, Vacancy)
+        self.assertEqual(vacancy.title, "QA Engineer")
+        self.assertIsNone(vacancy.salary_from)
+        self.assertEqual(vacancy.salary_to, 120000)
+        self.assertEqual(vacancy.currency, "RUR")
+        self.assertEqual([v.url for v in table[1:3]], [
+            "https://hh.ru/vacancy/2",
+            "https://hh.ru/vacancy/3",
+        ])
+        with self.assertRaises(IndexError):
+            table[4]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,6 +58,92 @@ class TestVacancy(unittest.TestCase):
         self.assertEqual(len(vacancies), 1)
         self.assertEqual(vacancies[0].title, "Python Developer")
         self.assertEqual(vacancies[0].salary, "100000-150000 RUR")
+        self.assertEqual(vacancies[0].salary_from, 100000)
+        self.assertEqual(vacancies[0].salary_to, 150000)
+        self.assertEqual(vacancies[0].currency, "RUR")
+
+    def test_salary_parsing(self):
+        """Тест разбора границ зарплаты из строки."""
+        cases = {
+            "100000-150000 RUR": (100000, 150000, "RUR"),
+            "От 90000 RUR": (90000, None, "RUR"),
+            "До 80000 RUR": (None, 80000, "RUR"),
+            "100 000 руб.": (100000, None, "руб."),
+            "": (None, None, None),
+        }
+        for salary, expected in cases.items():
+            vacancy = Vacancy("Dev", "https://hh.ru/vacancy/1", salary, "")
+            self.assertEqual(
+                (vacancy.salary_from, vacancy.salary_to, vacancy.currency), expected
+            )
+
+    def test_range_uses_lower_bound(self):
+        """Тест сравнения диапазона по нижней границе, а не склейке цифр."""
+        v1 = Vacancy("Dev1", "https://hh.ru/vacancy/1", "100000-150000 RUR", "")
+        v2 = Vacancy("Dev2", "https://hh.ru/vacancy/2", "От 120000 RUR", "")
+        self.assertTrue(v2 > v1)
+
+    def test_dict_round_trip(self):
+        """Тест сохранения структурированных полей зарплаты в словаре."""
+        vacancy = Vacancy(
+            "Dev", "https://hh.ru/vacancy/1", "до вычета налогов", "",
+            salary_from=None, salary_to=50000, currency="USD",
+        )
+        restored = Vacancy.from_dict(vacancy.to_dict())
+        self.assertEqual(restored.salary_to, 50000)
+        self.assertEqual(restored.currency, "USD")
+        self.assertEqual(restored._get_salary_value(), 50000)
+
+    def test_with_details(self):
+        """Тест копии вакансии с полным описанием и ключевыми навыками."""
+        vacancy = Vacancy("Dev", "https://hh.ru/vacancy/1", "100000 руб.", "Кратко")
+        self.assertFalse(vacancy.is_enriched)
+        enriched = vacancy.with_details("Полное описание", ["Python", "SQL"])
+        self.assertEqual(enriched.description, "Полное описание")
+        self.assertEqual(enriched.salary_from, 100000)
+        restored = Vacancy.from_dict(enriched.to_dict())
+        self.assertEqual(restored.key_skills, ("Python", "SQL"))
+        self.assertIsNone(Vacancy.from_dict(vacancy.to_dict()).key_skills)
+        self.assertIn("полное описание", enriched.search_text)
+        self.assertNotIn("кратко", enriched.search_text)
+
+    def test_iter_from_json_collects_errors(self):
+        """Тест: со списком errors некорректные записи пропускаются, а не прерывают разбор."""
+        raw_data = [
+            {"name": "Dev", "alternate_url": "https://hh.ru/vacancy/1"},
+            {"name": "", "alternate_url": "https://hh.ru/vacancy/2"},
+            "не вакансия",
+            {"name": "QA", "alternate_url": "https://hh.ru/vacancy/3", "snippet": None},
+            {"name": "Ops", "alternate_url": "https://hh.ru/vacancy/4"},
+        ]
+        errors = []
+        vacancies = Vacancy.cast_to_object_list(raw_data, errors)
+        self.assertEqual([v.url[-1] for v in vacancies], ["1", "3", "4"])
+        self.assertEqual(vacancies[1].description, "")
+        self.assertEqual([number for number, _ in errors], [1, 2])
+        with self.assertRaises(ValueError):
+            Vacancy.cast_to_object_list(raw_data)
+
+    def test_search_text(self):
+        """Тест ключа поиска: вычисляется один раз и сохраняется в словаре."""
+        vacancy = Vacancy("Ёлочный ДИЗАЙНЕР", "https://hh.ru/vacancy/1", "", "Figma")
+        self.assertEqual(vacancy.search_text, "елочный дизайнер\nfigma")
+        self.assertIs(vacancy.search_text, vacancy.search_text)
+        data = vacancy.to_dict()
+        self.assertEqual(data["search_text"], vacancy.search_text)
+        data["search_text"] = "сохранённый ключ"
+        self.assertEqual(Vacancy.from_dict(data).search_text, "сохранённый ключ")
+
+    def test_iter_from_json_is_lazy(self):
+        """Тест ленивого преобразования JSON в объекты."""
+        raw_data = [
+            {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1"},
+            {"name": "", "alternate_url": "https://hh.ru/vacancy/2"},
+        ]
+        vacancies = Vacancy.iter_from_json(raw_data)
+        self.assertEqual(next(vacancies).salary, "Зарплата не указана")
+        with self.assertRaises(ValueError):
+            next(vacancies)
 
 
 if __name__ == "__main__":